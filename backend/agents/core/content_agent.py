@@ -1,9 +1,34 @@
 """Agent 5: Content Execution Agent - Generates daily content."""
-from typing import Dict, Any
+import logging
+from typing import Dict, Any, Iterable, List, Optional
 
+from ...config import CONTENT_BATCH_SIZE, LLM_CONTEXT_WINDOW_TOKENS, CONTENT_OUTPUT_TOKENS_PER_DAY
 from ...services.ai.gemini_service import GeminiService
+from ...services.ai.json_stream import FieldCallback
+from ...services.ai.prompt_compaction import compact_json, estimate_tokens
 from ...models.agents.agent_outputs import ContentAgentOutput
 
+logger = logging.getLogger(__name__)
+
+# Platforms the Content Agent writes for, in row order (daily_content.platform values)
+CONTENT_PLATFORMS = ("youtube", "twitter")
+PLATFORM_ALIASES = {"x": "twitter", "twitter/x": "twitter", "x/twitter": "twitter"}
+
+
+def content_platforms(platforms: Optional[Iterable[str]]) -> List[str]:
+    """
+    Content platforms for a campaign goal's platforms (e.g. ['YouTube', 'X']).
+
+    Names are matched case-insensitively, X counts as Twitter, and
+    platforms without generated content are dropped. Defaults to
+    ['youtube'] when none are supported.
+    """
+    requested = set()
+    for platform in platforms or []:
+        name = str(platform).strip().lower()
+        requested.add(PLATFORM_ALIASES.get(name, name))
+    return [platform for platform in CONTENT_PLATFORMS if platform in requested] or ["youtube"]
+
 
 class ContentAgent:
     """
@@ -11,12 +36,14 @@ class ContentAgent:
     
     Single responsibility: Generate platform-specific content
     Stateless: No internal state
-    One call per day: N calls per campaign (one per day, where N = duration_days)
+    One call per day: N calls per campaign (one per day, where N = duration_days),
+    or ceil(N / K) calls in batched mode (K days per call, see batch_size()).
+    Each call writes the day's content for every target platform.
     """
     
-    def __init__(self):
-        """Initialize with Gemini service."""
-        self.gemini = GeminiService()
+    def __init__(self, gemini: Optional[GeminiService] = None):
+        """Initialize with Gemini service (the shared instance when built by the service container)."""
+        self.gemini = gemini or GeminiService()
     
     def generate_content(
         self,
@@ -25,7 +52,8 @@ class ContentAgent:
         day_number: int,
         duration_days: int,
         content_intensity: str = "moderate",
-        goal_type: str = "growth"
+        goal_type: str = "growth",
+        platforms: Optional[List[str]] = None
     ) -> ContentAgentOutput:
         """
         Generate content for a specific day.
@@ -37,6 +65,7 @@ class ContentAgent:
             duration_days: Total campaign duration (3-30 days)
             content_intensity: Production intensity (light/moderate/intense)
             goal_type: Type of goal (growth, engagement, monetization, launch)
+            platforms: Content platforms (content_platforms()); defaults to YouTube only
         
         Returns:
             ContentAgentOutput with ready-to-post content (scripts, titles, tweets, etc.)
@@ -53,6 +82,111 @@ class ContentAgent:
             creator_context=creator_context,
             day_number=day_number,
             content_intensity=content_intensity,
-            goal_type=goal_type
+            goal_type=goal_type,
+            platforms=platforms
+        )
+    
+    async def generate_content_async(
+        self,
+        day_plan: Dict[str, Any],
+        creator_context: Dict[str, Any],
+        day_number: int,
+        duration_days: int,
+        content_intensity: str = "moderate",
+        goal_type: str = "growth",
+        on_field: Optional[FieldCallback] = None,
+        platforms: Optional[List[str]] = None
+    ) -> ContentAgentOutput:
+        """Awaitable variant of generate_content(); on_field gets each field as it streams in."""
+        if day_number < 1 or day_number > duration_days:
+            raise ValueError(f"day_number must be between 1 and {duration_days}")
+        
+        return await self.gemini.generate_content_async(
+            day_plan=day_plan,
+            creator_context=creator_context,
+            day_number=day_number,
+            content_intensity=content_intensity,
+            goal_type=goal_type,
+            on_field=on_field,
+            platforms=platforms
         )
 
+    def batch_size(
+        self,
+        day_plans: Dict[int, Dict[str, Any]],
+        creator_context: Dict[str, Any],
+        platforms: Optional[List[str]] = None
+    ) -> int:
+        """
+        Days per batched call that fit the model's context window.
+        
+        The instruction block and creator context are sent once per batch;
+        each extra day adds its plan to the prompt and its content (for
+        every platform) to the output. Capped at CONTENT_BATCH_SIZE.
+        """
+        template = self.gemini.load_prompt('agent5_content_batch.txt')
+        # Measured on the compacted JSON the prompt actually contains
+        shared_tokens = estimate_tokens(template) + estimate_tokens(compact_json(creator_context, 'creator_context'))
+        largest_plan = max(
+            (estimate_tokens(compact_json(plan, 'day_plan')) for plan in day_plans.values()), default=0
+        )
+        per_day_tokens = largest_plan + CONTENT_OUTPUT_TOKENS_PER_DAY * len(platforms or ["youtube"])
+        fits = (LLM_CONTEXT_WINDOW_TOKENS - shared_tokens) // per_day_tokens
+        return max(1, min(CONTENT_BATCH_SIZE, fits))
+    
+    async def generate_content_batch_async(
+        self,
+        day_plans: Dict[int, Dict[str, Any]],
+        creator_context: Dict[str, Any],
+        duration_days: int,
+        content_intensity: str = "moderate",
+        goal_type: str = "growth",
+        on_field: Optional[FieldCallback] = None,
+        platforms: Optional[List[str]] = None
+    ) -> Dict[int, ContentAgentOutput]:
+        """
+        Generate content for several days in one call.
+        
+        Args:
+            day_plans: {day_number: day plan} for the days in this batch
+            creator_context: Creator profile context (from ContextAnalyzer)
+            duration_days: Total campaign duration (3-30 days)
+            content_intensity: Production intensity (light/moderate/intense)
+            goal_type: Type of goal (growth, engagement, monetization, launch)
+            on_field: Called as on_field("days[i]", ContentBatchDay) as each day streams in
+            platforms: Content platforms (content_platforms()); defaults to YouTube only
+        
+        Returns:
+            {day_number: ContentAgentOutput} for the days the model returned.
+            Empty if the batch response was malformed; callers generate any
+            missing day with generate_content_async().
+        """
+        for day_number in day_plans:
+            if day_number < 1 or day_number > duration_days:
+                raise ValueError(f"day_number must be between 1 and {duration_days}")
+        
+        try:
+            batch = await self.gemini.generate_content_batch_async(
+                day_plans=day_plans,
+                creator_context=creator_context,
+                duration_days=duration_days,
+                content_intensity=content_intensity,
+                goal_type=goal_type,
+                on_field=on_field,
+                platforms=platforms
+            )
+        except Exception as e:
+            logger.warning(f"Batched content generation failed for days {list(day_plans)}: {e}")
+            return {}
+        
+        results = {}
+        for day_content in batch.days:
+            # Ignore days we didn't ask for and keep the first answer for duplicates
+            if day_content.day_number in day_plans and day_content.day_number not in results:
+                results[day_content.day_number] = ContentAgentOutput(
+                    **day_content.model_dump(exclude={"day_number"})
+                )
+        missing = [day for day in day_plans if day not in results]
+        if missing:
+            logger.warning(f"Batched content response missing days {missing}; falling back to per-day calls")
+        return results
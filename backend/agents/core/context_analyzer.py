@@ -1,9 +1,66 @@
 """Agent 1: Creator Context Analyzer - Runs ONCE per user lifetime."""
-from typing import Dict, Any
+import hashlib
+import json
+import logging
+from typing import Dict, Any, List, NamedTuple, Optional
 
 from ...services.ai.gemini_service import GeminiService
+from ...services.ai.prompt_registry import prompt_registry
 from ...models.agents.agent_outputs import ContextAnalyzerOutput
 
+logger = logging.getLogger(__name__)
+
+CONTEXT_SECTIONS = tuple(ContextAnalyzerOutput.model_fields)
+
+_USER_CONTENT = ("user_best_videos", "user_worst_videos", "user_best_tweets", "user_worst_tweets")
+_PLATFORM_URLS = (
+    "youtube_url", "twitter_url", "instagram_url", "linkedin_url", "tiktok_url", "facebook_url", "reddit_url"
+)
+
+# Analyzer inputs (creator_data keys) each output section is derived from.
+# Inputs not listed here count towards every section.
+SECTION_INPUTS: Dict[str, frozenset] = {
+    "creator_identity": frozenset({
+        "category", "target_audience", "audience_demographics", "unique_angle", "content_purpose", "why_create",
+    }),
+    "content_dna": frozenset({
+        "category", "platforms", "self_strengths", "self_weaknesses", "content_enjoys", "content_avoids",
+        *_USER_CONTENT,
+    }),
+    "performance_insights": frozenset({"platforms", "current_metrics", "competitor_urls", *_USER_CONTENT, *_PLATFORM_URLS}),
+    "constraints": frozenset({"time_per_week", "platforms", "tech_proficiency", "budget", "team_size"}),
+    "growth_context": frozenset({"past_attempts", "what_worked_before", "current_metrics", "competitor_urls"}),
+    "strategic_insights": frozenset({
+        "time_per_week", "platforms", "self_strengths", "current_metrics", "budget", "team_size",
+        "content_purpose", "why_create", "timeline_expectations",
+    }),
+}
+
+_MAPPED_INPUTS = frozenset().union(*SECTION_INPUTS.values())
+
+
+class ContextAnalysis(NamedTuple):
+    """Result of an incremental analysis."""
+    output: ContextAnalyzerOutput
+    section_fingerprints: Dict[str, str]
+    regenerated: List[str]  # sections produced by this run (empty: nothing changed)
+
+
+def section_fingerprints(creator_data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Fingerprint of the inputs behind each ContextAnalyzerOutput section.
+    
+    Includes the agent1 prompt version, so a prompt edit re-runs every section.
+    """
+    prompt_version = prompt_registry.version('agent1_context.txt')
+    unmapped = {key: value for key, value in creator_data.items() if key not in _MAPPED_INPUTS}
+    fingerprints = {}
+    for section in CONTEXT_SECTIONS:
+        inputs = {key: creator_data.get(key) for key in sorted(SECTION_INPUTS.get(section, ()))}
+        material = json.dumps([prompt_version, inputs, unmapped], sort_keys=True, separators=(",", ":"), default=str)
+        fingerprints[section] = hashlib.sha256(material.encode("utf-8")).hexdigest()
+    return fingerprints
+
 
 class ContextAnalyzer:
     """
@@ -14,9 +71,9 @@ class ContextAnalyzer:
     One call: Single Gemini API call per execution
     """
     
-    def __init__(self):
-        """Initialize with Gemini service."""
-        self.gemini = GeminiService()
+    def __init__(self, gemini: Optional[GeminiService] = None):
+        """Initialize with Gemini service (the shared instance when built by the service container)."""
+        self.gemini = gemini or GeminiService()
     
     def analyze(
         self,
@@ -47,4 +104,58 @@ class ContextAnalyzer:
         """
         # Single Gemini call - no retries, no loops
         return self.gemini.analyze_context(creator_data)
+    
+    async def analyze_async(
+        self,
+        creator_data: Dict[str, Any]
+    ) -> ContextAnalyzerOutput:
+        """Awaitable variant of analyze() for use inside request handlers and async workflows."""
+        return await self.gemini.analyze_context_async(creator_data)
+    
+    async def analyze_incremental_async(
+        self,
+        creator_data: Dict[str, Any],
+        previous_output: Optional[Dict[str, Any]] = None,
+        previous_fingerprints: Optional[Dict[str, str]] = None
+    ) -> ContextAnalysis:
+        """
+        Re-analyze only the sections whose inputs changed since the previous analysis.
+        
+        Unchanged sections are copied from previous_output; changed ones are
+        regenerated in a single call and merged in. Without a previous
+        analysis (or when every section changed) this is a full analysis.
+        
+        Args:
+            creator_data: Analyzer input (see analyze())
+            previous_output: Stored ContextAnalyzerOutput dict, if any
+            previous_fingerprints: section_fingerprints() of its input, if known
+        
+        Returns:
+            ContextAnalysis with the merged output, the new per-section
+            fingerprints and the sections regenerated by this run
+        """
+        fingerprints = section_fingerprints(creator_data)
+        previous_fingerprints = previous_fingerprints or {}
+        changed = [
+            section for section in CONTEXT_SECTIONS
+            if not previous_output
+            or section not in previous_output
+            or previous_fingerprints.get(section) != fingerprints[section]
+        ]
+        
+        if not changed:
+            return ContextAnalysis(ContextAnalyzerOutput.model_validate(previous_output), fingerprints, [])
+        
+        if len(changed) < len(CONTEXT_SECTIONS):
+            known = {section: previous_output[section] for section in CONTEXT_SECTIONS if section not in changed}
+            try:
+                partial = await self.gemini.analyze_context_sections_async(creator_data, changed, known)
+                merged = ContextAnalyzerOutput.model_validate({**known, **partial.model_dump()})
+                logger.info(f"Context re-analysis regenerated {changed}")
+                return ContextAnalysis(merged, fingerprints, changed)
+            except Exception as e:
+                logger.warning(f"Partial context re-analysis of {changed} failed, running full analysis: {e}")
+        
+        output = await self.analyze_async(creator_data)
+        return ContextAnalysis(output, fingerprints, list(CONTEXT_SECTIONS))
 
@@ -15,9 +15,9 @@ class OutcomeAgent:
     No guessing: Only reasoning from actual metrics
     """
     
-    def __init__(self):
-        """Initialize with Gemini service."""
-        self.gemini = GeminiService()
+    def __init__(self, gemini: Optional[GeminiService] = None):
+        """Initialize with Gemini service (the shared instance when built by the service container)."""
+        self.gemini = gemini or GeminiService()
     
     def analyze_outcome(
         self,
@@ -40,4 +40,14 @@ class OutcomeAgent:
         """
         # Single Gemini call for honest analysis including adherence rate
         return self.gemini.analyze_outcome(goal, actual_metrics, campaign_plan, daily_execution)
+    
+    async def analyze_outcome_async(
+        self,
+        goal: Dict[str, Any],
+        actual_metrics: Dict[str, Any],
+        campaign_plan: Dict[str, Any],
+        daily_execution: Optional[Dict[str, Any]] = None
+    ) -> OutcomeAgentOutput:
+        """Awaitable variant of analyze_outcome()."""
+        return await self.gemini.analyze_outcome_async(goal, actual_metrics, campaign_plan, daily_execution)
 
@@ -17,9 +17,9 @@ class PlannerAgent:
     Output: User must approve before execution
     """
     
-    def __init__(self):
-        """Initialize with Gemini service."""
-        self.gemini = GeminiService()
+    def __init__(self, gemini: Optional[GeminiService] = None):
+        """Initialize with Gemini service (the shared instance when built by the service container)."""
+        self.gemini = gemini or GeminiService()
     
     def create_plan(
         self,
@@ -39,7 +39,7 @@ class PlannerAgent:
             forensics_yt: Optional output from ForensicsAgent for YouTube
             forensics_x: Optional output from ForensicsAgent for Twitter
             content_intensity: Production intensity (light/moderate/intense)
-            past_learnings: List of LearningMemory objects from previous campaigns
+            past_learnings: Learnings from previous campaigns (learning_memory.retrieve_learnings dicts)
         
         Returns:
             PlannerAgentOutput with day_1, day_2, day_3, extra_days actions
@@ -61,6 +61,28 @@ class PlannerAgent:
             past_learnings=past_learnings
         )
     
+    async def create_plan_async(
+        self,
+        goal: CampaignGoal,
+        strategy: Dict[str, Any],
+        forensics_yt: Optional[Dict[str, Any]] = None,
+        forensics_x: Optional[Dict[str, Any]] = None,
+        content_intensity: str = "moderate",
+        past_learnings: Optional[List] = None
+    ) -> PlannerAgentOutput:
+        """Awaitable variant of create_plan()."""
+        self._validate_cadence(goal)
+        
+        return await self.gemini.create_plan_async(
+            goal=goal,
+            strategy=strategy,
+            forensics_yt=forensics_yt,
+            forensics_x=forensics_x,
+            content_intensity=content_intensity,
+            goal_type=goal.goal_type if goal else "growth",
+            past_learnings=past_learnings
+        )
+    
     def _validate_cadence(self, goal: CampaignGoal) -> None:
         """
         Validate posting frequency matches platform norms.
@@ -15,9 +15,9 @@ class StrategyAgent:
     No web access: Pure reasoning from creator context and goal
     """
     
-    def __init__(self):
-        """Initialize with Gemini service."""
-        self.gemini = GeminiService()
+    def __init__(self, gemini: Optional[GeminiService] = None):
+        """Initialize with Gemini service (the shared instance when built by the service container)."""
+        self.gemini = gemini or GeminiService()
     
     def generate_strategy(
         self,
@@ -35,11 +35,22 @@ class StrategyAgent:
             creator_context: Output from ContextAnalyzer (niche, content_style, etc.)
             duration_days: Campaign duration for reality assessment
             goal_type: Type of goal (growth, engagement, monetization, launch)
-            past_learnings: List of LearningMemory objects from previous campaigns
+            past_learnings: Learnings from previous campaigns (learning_memory.retrieve_learnings dicts)
         
         Returns:
             StrategyAgentOutput with hypothesis, platform_focus, experiment_focus, reality_check
         """
         # Single Gemini call - pure reasoning, no external data
         return self.gemini.generate_strategy(goal, creator_context, duration_days, goal_type, past_learnings)
+    
+    async def generate_strategy_async(
+        self,
+        goal: str,
+        creator_context: Dict[str, Any],
+        duration_days: int = 3,
+        goal_type: str = "growth",
+        past_learnings: Optional[List] = None
+    ) -> StrategyAgentOutput:
+        """Awaitable variant of generate_strategy()."""
+        return await self.gemini.generate_strategy_async(goal, creator_context, duration_days, goal_type, past_learnings)
 
@@ -1,10 +1,13 @@
 """Agent 3: Competitor Performance Forensics Agent - Critical agent with deterministic classification."""
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 
 from ...services.ai.gemini_service import GeminiService
 from ...services.platforms.youtube_service import YouTubeService
 from ...services.platforms.twitter_service import TwitterService
+from ...services.platforms.competitor_store import CompetitorFetch, CompetitorRef, fetch_competitor
 from ...models.agents.agent_outputs import ForensicsAgentOutput
+from ...config import YOUTUBE_FETCH_CONCURRENCY, TWITTER_FETCH_CONCURRENCY
 
 
 class ForensicsAgent:
@@ -21,23 +24,36 @@ class ForensicsAgent:
     Supports: YouTube, Twitter/X
     """
     
-    def __init__(self):
-        """Initialize with services."""
-        self.gemini = GeminiService()
+    def __init__(
+        self,
+        gemini: Optional[GeminiService] = None,
+        youtube_service: Optional[YouTubeService] = None,
+        twitter_service: Optional[TwitterService] = None
+    ):
+        """
+        Initialize with services.
+        
+        The service container passes its shared clients; when built
+        standalone, any client not given is created here (None if its API
+        key is missing).
+        """
+        self.gemini = gemini or GeminiService()
         
         # Initialize YouTube service
-        try:
-            self.youtube_service = YouTubeService()
-        except ValueError as e:
-            self.youtube_service = None
-            print(f"Warning: YouTubeService not initialized: {e}")
+        self.youtube_service = youtube_service
+        if self.youtube_service is None:
+            try:
+                self.youtube_service = YouTubeService()
+            except ValueError as e:
+                print(f"Warning: YouTubeService not initialized: {e}")
         
         # Initialize Twitter service
-        try:
-            self.twitter_service = TwitterService()
-        except ValueError as e:
-            self.twitter_service = None
-            print(f"Warning: TwitterService not initialized: {e}")
+        self.twitter_service = twitter_service
+        if self.twitter_service is None:
+            try:
+                self.twitter_service = TwitterService()
+            except ValueError as e:
+                print(f"Warning: TwitterService not initialized: {e}")
     
     def analyze_competitor(
         self,
@@ -141,4 +157,173 @@ class ForensicsAgent:
             return self.gemini.analyze_twitter(platform, all_high, all_low)
         else:
             return self.gemini.analyze_forensics(platform, all_high, all_low)
-
+    
+    @staticmethod
+    def _classify(platform_lower: str, items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split fetched content into high/low traction (deterministic, no Gemini)."""
+        if platform_lower == "youtube":
+            return YouTubeService.classify_videos_by_traction(items)
+        if platform_lower == "twitter":
+            return TwitterService.classify_tweets_by_engagement(items)
+        raise ValueError(f"Unsupported platform: {platform_lower}")
+    
+    def _fetch_classified(self, platform_lower: str, competitor_url: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Fetch one competitor's recent content and split it into high/low traction."""
+        fetched = fetch_competitor(platform_lower, competitor_url, self.youtube_service, self.twitter_service)
+        return self._classify(platform_lower, fetched.items)
+    
+    async def _analyze_classified_async(
+        self,
+        platform: str,
+        high_traction: List[Dict[str, Any]],
+        low_traction: List[Dict[str, Any]]
+    ) -> ForensicsAgentOutput:
+        """Single Gemini call over already-classified content."""
+        if platform.lower() == "twitter":
+            return await self.gemini.analyze_twitter_async(platform, high_traction, low_traction)
+        return await self.gemini.analyze_forensics_async(platform, high_traction, low_traction)
+    
+    async def analyze_competitor_async(
+        self,
+        platform: str,
+        competitor_url: str
+    ) -> ForensicsAgentOutput:
+        """
+        Awaitable variant of analyze_competitor().
+        
+        The platform SDKs are blocking, so the fetch runs in a worker thread;
+        the Gemini call goes through the shared async HTTP client.
+        """
+        high_traction, low_traction = await asyncio.to_thread(
+            self._fetch_classified, platform.lower(), competitor_url
+        )
+        return await self._analyze_classified_async(platform, high_traction, low_traction)
+    
+    async def fetch_competitors_async(
+        self,
+        competitors_by_platform: Dict[str, List[str]],
+        prefetched: Optional[Dict[CompetitorRef, List[Dict[str, Any]]]] = None
+    ) -> Dict[CompetitorRef, Optional[CompetitorFetch]]:
+        """
+        Fetch every competitor on every platform concurrently.
+        
+        Each provider gets its own concurrency limit (YouTube Data API quota,
+        twitterapi.io rate limit). Competitors in `prefetched` (served from the
+        snapshot store) are skipped. Per-competitor failures are logged and
+        returned as None.
+        
+        Returns:
+            {(platform, competitor_url): CompetitorFetch or None}
+        """
+        prefetched = prefetched or {}
+        limits = {
+            "youtube": YOUTUBE_FETCH_CONCURRENCY,
+            "twitter": TWITTER_FETCH_CONCURRENCY,
+        }
+        semaphores = {
+            platform.lower(): asyncio.Semaphore(max(1, limits.get(platform.lower(), 1)))
+            for platform in competitors_by_platform
+        }
+        
+        async def fetch_one(platform: str, url: str) -> Optional[CompetitorFetch]:
+            async with semaphores[platform.lower()]:
+                try:
+                    return await asyncio.to_thread(
+                        fetch_competitor, platform, url, self.youtube_service, self.twitter_service
+                    )
+                except Exception as e:
+                    # Log but continue with other competitors
+                    print(f"Error analyzing competitor {url}: {e}")
+                    return None
+        
+        refs = [
+            (platform, url)
+            for platform, urls in competitors_by_platform.items()
+            for url in urls
+            if (platform, url) not in prefetched
+        ]
+        fetched = await asyncio.gather(*(fetch_one(platform, url) for platform, url in refs))
+        return dict(zip(refs, fetched))
+    
+    async def analyze_fetched_async(
+        self,
+        competitors_by_platform: Dict[str, List[str]],
+        items_by_competitor: Dict[CompetitorRef, List[Dict[str, Any]]]
+    ) -> Dict[str, Optional[ForensicsAgentOutput]]:
+        """
+        One comparative Gemini call per platform over the aggregated
+        high/low traction sets of all its competitors.
+        
+        Returns:
+            {platform: ForensicsAgentOutput}, or None for a platform with no
+            classified content or a failed Gemini call.
+        """
+        async def analyze_platform(platform: str) -> Optional[ForensicsAgentOutput]:
+            all_high = []
+            all_low = []
+            available = 0
+            for url in competitors_by_platform[platform]:
+                items = items_by_competitor.get((platform, url))
+                if items is None:
+                    continue
+                high, low = self._classify(platform.lower(), items)
+                all_high.extend(high)
+                all_low.extend(low)
+                available += 1
+            
+            if not all_high and not all_low:
+                print(f"⚠️ No {platform} content classified from competitors, skipping forensics")
+                return None
+            print(f"      📊 {platform}: {available}/{len(competitors_by_platform[platform])} competitors available, "
+                  f"{len(all_high)} high / {len(all_low)} low traction items")
+            try:
+                return await self._analyze_classified_async(platform, all_high, all_low)
+            except Exception as e:
+                print(f"Forensics {platform} failed: {e}")
+                return None
+        
+        platforms = list(competitors_by_platform)
+        outputs = await asyncio.gather(*(analyze_platform(p) for p in platforms))
+        return dict(zip(platforms, outputs))
+    
+    async def analyze_platforms_async(
+        self,
+        competitors_by_platform: Dict[str, List[str]],
+        prefetched: Optional[Dict[CompetitorRef, List[Dict[str, Any]]]] = None
+    ) -> Dict[str, Optional[ForensicsAgentOutput]]:
+        """
+        Forensics for several platforms at once: concurrent fetch of all
+        competitors (minus `prefetched`), then one Gemini call per platform.
+        """
+        fetched = await self.fetch_competitors_async(competitors_by_platform, prefetched)
+        items = dict(prefetched or {})
+        items.update({ref: f.items for ref, f in fetched.items() if f is not None})
+        return await self.analyze_fetched_async(competitors_by_platform, items)
+    
+    async def analyze_multiple_competitors_async(
+        self,
+        platform: str,
+        competitor_urls: List[str]
+    ) -> ForensicsAgentOutput:
+        """Awaitable variant of analyze_multiple_competitors() with concurrent fetching."""
+        fetched = await self.fetch_competitors_async({platform: competitor_urls})
+        
+        all_high = []
+        all_low = []
+        for f in fetched.values():
+            if f is None:
+                continue
+            high, low = self._classify(platform.lower(), f.items)
+            all_high.extend(high)
+            all_low.extend(low)
+        
+        if platform.lower() == "twitter" and not all_high and not all_low:
+            print(f"⚠️ No {platform} content classified from competitors, returning empty forensics")
+            return ForensicsAgentOutput(
+                platform=platform,
+                patterns_that_worked=[],
+                patterns_that_failed=[],
+                transferable_rules=[]
+            )
+        
+        return await self._analyze_classified_async(platform, all_high, all_low)
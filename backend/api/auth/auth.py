@@ -14,6 +14,7 @@ from ...models.user.user import User
 from ...models.db.user import UserDB
 from ...models.db.subscription import SubscriptionDB, UsageMetricDB
 from ...services.core.clerk_service import clerk_service
+from ...services.core.auth_cache import verified_token_cache, last_login_recorder
 from ...database.session import get_db
 from ...storage.memory_store import memory_store
 
@@ -38,6 +39,12 @@ async def get_current_user_id(
     
     token = credentials.credentials
     
+    # Warm token: already verified and mapped to a user - no crypto, no DB
+    cached_user_id = verified_token_cache.get(token)
+    if cached_user_id:
+        last_login_recorder.touch(cached_user_id)
+        return cached_user_id
+    
     # Verify Clerk JWT token
     payload = await clerk_service.verify_token(token)
     if not payload:
@@ -131,9 +138,9 @@ async def get_current_user_id(
                     detail="Failed to create user"
                 )
 
-    # Update last_login_at
-    user.last_login_at = datetime.now(timezone.utc)
-    await db.commit()
+    # last_login_at is flushed in batches, keeping read requests write-free
+    verified_token_cache.put(token, user.user_id, clerk_user_id, payload.get("exp"))
+    last_login_recorder.touch(user.user_id)
     
     return user.user_id
 
@@ -157,7 +164,8 @@ async def get_current_user(
         user_id=user.user_id,
         email=user.email,
         created_at=user.created_at,
-        last_login_at=user.last_login_at
+        # Include activity not yet flushed by the last_login_at batcher
+        last_login_at=last_login_recorder.pending_for(user.user_id) or user.last_login_at
     )
 
 
@@ -1,17 +1,21 @@
 """Campaign API routes."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from typing import Annotated, Dict, Any, Optional
+import base64
+import json
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import select, func
+from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...models.campaign.campaign import Campaign, CampaignCreate, CampaignResponse, CampaignStatus, DailyExecution, DailyContent
-from ...models.db.campaign import CampaignDB, DailyContentDB, DailyExecutionDB, LearningMemoryDB
+from ...models.campaign.campaign import Campaign, CampaignCreate, CampaignSummary, CampaignStatus, DailyExecution, DailyContent
+from ...models.db.campaign import CampaignDB, DailyContentDB, LearningMemoryDB
 from ...models.db.user import CreatorProfileDB
 from ...api.auth.auth import get_current_user_id
 from ...database.session import get_db
-from ...services.core.agent_orchestrator import AgentOrchestrator
+from ...services.core.campaign_hydration import CONTENT_PRESENCE, ensure_children_loaded, load_campaign, loaded_value
+from ...services.core.daily_store import upsert_daily_execution
+from ...storage.blob_store import media_url
 from ...tasks.campaign_tasks import (
     run_campaign_workflow_task,
     analyze_campaign_outcome_task,
@@ -19,38 +23,33 @@ from ...tasks.campaign_tasks import (
 )
 
 router = APIRouter(prefix="/campaigns", tags=["campaigns"])
-orchestrator = AgentOrchestrator()
 
 
-async def _load_daily_content(db: AsyncSession, campaign_id: str) -> dict[int, DailyContent]:
-    """Load daily content from database into dict."""
-    result = await db.execute(
-        select(DailyContentDB).where(DailyContentDB.campaign_id == campaign_id)
-    )
-    content_records = result.scalars().all()
+def _daily_content_from_rows(content_records) -> dict[int, DailyContent]:
+    """
+    Convert DailyContentDB rows into dict (columns left out by a projection stay empty).
     
+    A day's per-platform rows are merged: each row only fills its own
+    platform's fields, so YouTube and Twitter rows can come in any order.
+    """
     daily_content = {}
     for record in content_records:
-        daily_content[record.day_number] = DailyContent(
-            day=record.day_number,
-            youtube_script=record.video_script,
-            youtube_title=record.video_title,
-            youtube_seo_tags=record.seo_tags or [],
-            youtube_cta=record.call_to_action,
-            x_tweet=record.tweet_text,
-            x_thread=record.thread_tweets,
-            thumbnail_url=record.thumbnail_urls.get('youtube') if record.thumbnail_urls else None
-        )
+        content = daily_content.setdefault(record.day_number, DailyContent(day=record.day_number))
+        if record.platform == "twitter":
+            content.x_tweet = loaded_value(record, "tweet_text")
+            content.x_thread = loaded_value(record, "thread_tweets")
+            continue
+        thumbnail_urls = loaded_value(record, "thumbnail_urls")
+        content.youtube_script = loaded_value(record, "video_script")
+        content.youtube_title = loaded_value(record, "video_title")
+        content.youtube_seo_tags = loaded_value(record, "seo_tags") or []
+        content.youtube_cta = loaded_value(record, "call_to_action")
+        content.thumbnail_url = media_url(thumbnail_urls.get('youtube')) if thumbnail_urls else None
     return daily_content
 
 
-async def _load_daily_execution(db: AsyncSession, campaign_id: str) -> dict[int, DailyExecution]:
-    """Load daily execution from database into dict."""
-    result = await db.execute(
-        select(DailyExecutionDB).where(DailyExecutionDB.campaign_id == campaign_id)
-    )
-    execution_records = result.scalars().all()
-    
+def _daily_execution_from_rows(execution_records) -> dict[int, DailyExecution]:
+    """Convert DailyExecutionDB rows into dict."""
     daily_execution = {}
     for record in execution_records:
         daily_execution[record.day_number] = DailyExecution(
@@ -63,9 +62,15 @@ async def _load_daily_execution(db: AsyncSession, campaign_id: str) -> dict[int,
 
 
 async def _campaign_db_to_pydantic(db: AsyncSession, campaign_db: CampaignDB) -> Campaign:
-    """Convert CampaignDB to Pydantic Campaign with daily data loaded."""
-    daily_content = await _load_daily_content(db, campaign_db.campaign_id)
-    daily_execution = await _load_daily_execution(db, campaign_db.campaign_id)
+    """
+    Convert CampaignDB to Pydantic Campaign with daily data.
+    
+    Uses the children attached by load_campaign(); loads them first if the
+    campaign came from a plain select.
+    """
+    await ensure_children_loaded(db, campaign_db)
+    daily_content = _daily_content_from_rows(campaign_db.daily_content)
+    daily_execution = _daily_execution_from_rows(campaign_db.daily_execution)
     
     # Parse onboarding_data from dict to Pydantic if present
     from ...models.campaign.campaign import CampaignOnboarding
@@ -364,7 +369,7 @@ async def start_campaign(
     Start campaign - executes agent workflow asynchronously.
     Status: READY_TO_START → PROCESSING → IN_PROGRESS
     
-    Returns task_id for polling progress via GET /tasks/{task_id}
+    Returns task_id for progress via GET /tasks/{task_id}/events (SSE)
     """
     result = await db.execute(select(CampaignDB).where(CampaignDB.campaign_id == campaign_id))
     campaign_db = result.scalar_one_or_none()
@@ -400,6 +405,7 @@ async def start_campaign(
         "campaign_id": campaign_id,
         "task_id": task.id,
         "status_url": f"/tasks/{task.id}",
+        "events_url": f"/tasks/{task.id}/events",
         "poll_interval_seconds": 2
     }
 
@@ -464,8 +470,7 @@ async def get_campaign(
     db: AsyncSession = Depends(get_db)
 ):
     """Get campaign by ID - returns full campaign data."""
-    result = await db.execute(select(CampaignDB).where(CampaignDB.campaign_id == campaign_id))
-    campaign_db = result.scalar_one_or_none()
+    campaign_db = await load_campaign(db, campaign_id)
     
     if not campaign_db:
         raise HTTPException(
@@ -495,7 +500,7 @@ async def complete_campaign(
     Mark campaign as complete and generate outcome report asynchronously.
     Status: IN_PROGRESS → GENERATING_REPORT → COMPLETED
     
-    Returns task_id for polling progress via GET /tasks/{task_id}
+    Returns task_id for progress via GET /tasks/{task_id}/events (SSE)
     """
     result = await db.execute(select(CampaignDB).where(CampaignDB.campaign_id == campaign_id))
     campaign_db = result.scalar_one_or_none()
@@ -536,6 +541,7 @@ async def complete_campaign(
         "campaign_id": campaign_id,
         "task_id": task.id,
         "status_url": f"/tasks/{task.id}",
+        "events_url": f"/tasks/{task.id}/events",
         "poll_interval_seconds": 2
     }
 
@@ -576,51 +582,35 @@ async def confirm_daily_execution(
     
     # Check if content exists for this day
     result = await db.execute(
-        select(DailyContentDB)
+        select(DailyContentDB.content_id)
         .where(DailyContentDB.campaign_id == campaign_id)
         .where(DailyContentDB.day_number == day_number)
+        .limit(1)
     )
     content_exists = result.scalar_one_or_none() is not None
     
     if not content_exists:
         raise HTTPException(status_code=400, detail=f"No content generated for day {day_number}")
     
-    # Create or update execution tracking
-    result = await db.execute(
-        select(DailyExecutionDB)
-        .where(DailyExecutionDB.campaign_id == campaign_id)
-        .where(DailyExecutionDB.day_number == day_number)
-    )
-    execution_db = result.scalar_one_or_none()
-    
-    if execution_db:
-        # Update existing
-        execution_db.posted_to_youtube = execution_data.get("youtube_posted", False)
-        execution_db.posted_to_twitter = execution_data.get("twitter_posted", False)
-        execution_db.executed_at = datetime.now(timezone.utc)
-    else:
-        # Create new
-        execution_db = DailyExecutionDB(
-            execution_id=str(uuid.uuid4()),
-            campaign_id=campaign_id,
-            day_number=day_number,
-            platform="youtube",  # Default platform
-            posted_to_youtube=execution_data.get("youtube_posted", False),
-            posted_to_twitter=execution_data.get("twitter_posted", False),
-            executed_at=datetime.now(timezone.utc)
-        )
-        db.add(execution_db)
-    
+    # Create or update execution tracking (one upsert on campaign/day/platform)
+    execution = {
+        "campaign_id": campaign_id,
+        "day_number": day_number,
+        "platform": "youtube",  # Default platform
+        "posted_to_youtube": execution_data.get("youtube_posted", False),
+        "posted_to_twitter": execution_data.get("twitter_posted", False),
+        "executed_at": datetime.now(timezone.utc)
+    }
+    await upsert_daily_execution(db, [execution])
     await db.commit()
-    await db.refresh(execution_db)
     
     return {
         "message": f"Day {day_number} execution confirmed",
         "execution": {
-            "day_number": execution_db.day_number,
-            "youtube_posted": execution_db.posted_to_youtube,
-            "twitter_posted": execution_db.posted_to_twitter,
-            "posted_at": execution_db.executed_at
+            "day_number": day_number,
+            "youtube_posted": execution["posted_to_youtube"],
+            "twitter_posted": execution["posted_to_twitter"],
+            "posted_at": execution["executed_at"]
         }
     }
 
@@ -635,8 +625,8 @@ async def get_campaign_schedule(
     Get campaign schedule with execution tracking.
     Shows all days with content, plan, and posting status.
     """
-    result = await db.execute(select(CampaignDB).where(CampaignDB.campaign_id == campaign_id))
-    campaign_db = result.scalar_one_or_none()
+    # Only day presence is needed from daily_content - skip scripts and thumbnails
+    campaign_db = await load_campaign(db, campaign_id, content_columns=CONTENT_PRESENCE)
     
     if not campaign_db:
         raise HTTPException(status_code=404, detail="Campaign not found")
@@ -650,9 +640,8 @@ async def get_campaign_schedule(
     duration_days = campaign_db.onboarding_data.get("goal", {}).get("duration_days", 3) if campaign_db.onboarding_data else 3
     campaign_plan = campaign_db.campaign_plan
     
-    # Load daily content and execution
-    daily_content = await _load_daily_content(db, campaign_id)
-    daily_execution = await _load_daily_execution(db, campaign_id)
+    daily_content = _daily_content_from_rows(campaign_db.daily_content)
+    daily_execution = _daily_execution_from_rows(campaign_db.daily_execution)
     
     schedule = []
     for day in range(1, duration_days + 1):
@@ -715,31 +704,68 @@ async def get_campaign_report(
     return campaign_db.outcome_report
 
 
-@router.get("", response_model=list[CampaignResponse])
+def _encode_cursor(created_at: datetime, campaign_id: str) -> str:
+    """Opaque keyset cursor for (created_at, campaign_id)."""
+    raw = json.dumps([created_at.isoformat(), campaign_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Inverse of _encode_cursor; 400 on anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, campaign_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(campaign_id)
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("", response_model=list[CampaignSummary])
 async def list_campaigns(
     user_id: Annotated[str, Depends(get_current_user_id)],
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    status_filter: Optional[list[str]] = Query(None, alias="status", description="Only these statuses (repeatable)"),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all campaigns for current user."""
-    result = await db.execute(
-        select(CampaignDB)
+    """
+    List campaigns for current user, newest first.
+    
+    Returns summary columns only (no plan or agent outputs). Keyset-paginated
+    on (created_at, campaign_id), 20 per page by default: when more campaigns
+    exist, the cursor for the next page is returned in the X-Next-Cursor
+    header (exposed to cross-origin clients by the CORS middleware).
+    """
+    query = (
+        select(
+            CampaignDB.campaign_id,
+            CampaignDB.onboarding_data["name"].astext.label("name"),
+            CampaignDB.onboarding_data["goal"]["platforms"].label("target_platforms"),
+            CampaignDB.status,
+            CampaignDB.created_at,
+            CampaignDB.started_at,
+            CampaignDB.completed_at,
+            CampaignDB.updated_at,
+        )
         .where(CampaignDB.user_id == user_id)
-        .order_by(CampaignDB.created_at.desc())
+        # Served by ix_campaigns_user_id_created_at
+        .order_by(CampaignDB.created_at.desc(), CampaignDB.campaign_id.desc())
+        .limit(limit + 1)
     )
-    campaigns_db = result.scalars().all()
-    
-    return [
-        CampaignResponse(
-            campaign_id=c.campaign_id,
-            user_id=c.user_id,
-            goal=c.onboarding_data.get("goal") if c.onboarding_data else None,
-            target_platforms=c.onboarding_data.get("goal", {}).get("platforms") if c.onboarding_data else None,
-            status=c.status,
-            campaign_plan=c.campaign_plan,
-            plan_approved=False,  # Not in DB yet
-            created_at=c.created_at,
-            updated_at=c.updated_at,
-        )
-        for c in campaigns_db
-    ]
-
+    if status_filter:
+        query = query.where(CampaignDB.status.in_(status_filter))
+    if cursor:
+        cursor_created_at, cursor_campaign_id = _decode_cursor(cursor)
+        query = query.where(or_(
+            CampaignDB.created_at < cursor_created_at,
+            and_(CampaignDB.created_at == cursor_created_at, CampaignDB.campaign_id < cursor_campaign_id)
+        ))
+    
+    rows = (await db.execute(query)).all()
+    
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(rows[-1].created_at, rows[-1].campaign_id)
+    
+    return [CampaignSummary(**row._mapping) for row in rows]
@@ -0,0 +1,112 @@
+"""Media API for serving generated images from the blob store."""
+import asyncio
+import re
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from ..storage.blob_store import blob_store, is_blob_key
+
+router = APIRouter(prefix="/media", tags=["media"])
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(ValueError):
+    """A well-formed byte range that lies outside the resource."""
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "bytes=start-end" header into inclusive offsets.
+
+    Malformed and multi-range headers may be ignored (RFC 7233 section 3.1),
+    so the caller serves the full body for them.
+
+    Returns:
+        (start, end), or None if the header should be ignored
+
+    Raises:
+        RangeNotSatisfiable: If a valid range can't be satisfied (416)
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match:
+        return None
+    start_str, end_str = match.groups()
+    if start_str:
+        start = int(start_str)
+        if end_str and int(end_str) < start:
+            # last-byte-pos before first-byte-pos is a syntax error, not a 416
+            return None
+        if start >= size:
+            raise RangeNotSatisfiable(header)
+        end = min(int(end_str), size - 1) if end_str else size - 1
+    elif end_str:
+        # Suffix range: last N bytes
+        suffix = int(end_str)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        start = max(size - suffix, 0)
+        end = size - 1
+    else:
+        return None
+    return start, end
+
+
+@router.api_route("/{key}", methods=["GET", "HEAD"])
+async def get_media(key: str, request: Request):
+    """
+    Serve a generated image.
+
+    Keys are content hashes, so responses are immutable: the key doubles as
+    a strong ETag and clients may cache forever. Supports conditional GET
+    (If-None-Match) and single byte ranges (Range: bytes=...).
+    """
+    if not is_blob_key(key):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+
+    info = await asyncio.to_thread(blob_store.stat, key)
+    if info is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+
+    etag = f'"{key.split(".")[0]}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "Accept-Ranges": "bytes",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    start, end = 0, info.size - 1
+    status_code = status.HTTP_200_OK
+    range_header = request.headers.get("range")
+    # If-Range with a different validator means "send the whole thing"
+    if_range = request.headers.get("if-range")
+    if range_header and (not if_range or if_range.strip() == etag):
+        try:
+            byte_range = _parse_range(range_header, info.size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{info.size}"},
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {start}-{end}/{info.size}"
+
+    headers["Content-Length"] = str(end - start + 1 if info.size else 0)
+    if request.method == "HEAD" or info.size == 0:
+        return Response(status_code=status_code, headers=headers, media_type=info.content_type)
+
+    # Sync iterator: Starlette drives it from the threadpool, so file/S3 reads don't block the loop
+    return StreamingResponse(
+        blob_store.iter_range(key, start, end),
+        status_code=status_code,
+        headers=headers,
+        media_type=info.content_type,
+    )
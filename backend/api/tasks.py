@@ -1,8 +1,11 @@
-"""Task status API for polling Celery task progress."""
-from fastapi import APIRouter, HTTPException, status
+"""Task status API for Celery task progress (snapshot and SSE stream)."""
+import json
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from typing import Dict, Any, Optional
 from celery.result import AsyncResult
 from ..celery_app import celery_app
+from ..services.core.task_events import build_task_status, publish_task_event_async, stream_task_events
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -12,7 +15,8 @@ async def get_task_status(task_id: str) -> Dict[str, Any]:
     """
     Get Celery task status and progress.
     
-    Frontend should poll this endpoint every 2 seconds while task is running.
+    Prefer GET /tasks/{task_id}/events, which pushes the same payload as
+    it changes; this endpoint is a one-off snapshot.
     
     Returns:
         {
@@ -23,69 +27,50 @@ async def get_task_status(task_id: str) -> Dict[str, Any]:
             "result": {...} if SUCCESS,
             "error": "..." if FAILURE,
             "campaign_id": "uuid",
-            "redirect_url": "/campaigns/{id}" if SUCCESS
+            "redirect_url": "/campaigns/{id}" if SUCCESS,
+            "details": {"stage", "unit", "unit_total", "elapsed_seconds", "eta_seconds", ...} if STARTED
         }
     """
     task_result = AsyncResult(task_id, app=celery_app)
+    return build_task_status(task_id, task_result.state, task_result.info)
+
+
+@router.get("/{task_id}/events")
+async def stream_task_status(task_id: str, request: Request) -> StreamingResponse:
+    """
+    Stream task progress as Server-Sent Events.
     
-    response = {
-        "task_id": task_id,
-        "state": task_result.state,
-        "progress": 0,
-        "message": "",
-        "result": None,
-        "error": None,
-        "campaign_id": None,
-        "redirect_url": None
-    }
+    Each `data:` line carries the same payload as GET /tasks/{task_id}.
+    The current state is sent immediately, then every progress update as
+    the task publishes it; the stream ends after SUCCESS, FAILURE or
+    REVOKED. Comment lines are sent periodically as keepalives.
     
-    if task_result.state == "PENDING":
-        # Task not yet started or doesn't exist
-        response["message"] = "Task pending..."
-        response["progress"] = 0
-        
-    elif task_result.state == "STARTED":
-        # Task is running - get progress from meta
-        info = task_result.info or {}
-        response["progress"] = info.get("progress", 0)
-        response["message"] = info.get("message", "Processing...")
-        
-    elif task_result.state == "SUCCESS":
-        # Task completed successfully
-        result = task_result.result or {}
-        response["progress"] = 100
-        response["message"] = result.get("message", "Task completed")
-        response["result"] = result
-        response["campaign_id"] = result.get("campaign_id")
-        
-        # Provide redirect URL for frontend
-        if response["campaign_id"]:
-            response["redirect_url"] = f"/campaigns/{response['campaign_id']}"
-        
-    elif task_result.state == "FAILURE":
-        # Task failed
-        response["progress"] = 0
-        response["message"] = "Task failed"
-        response["error"] = str(task_result.info)  # Exception details
-        
-        # Try to extract campaign_id from exception args if available
-        if hasattr(task_result.info, 'args') and task_result.info.args:
-            try:
-                # Tasks store campaign_id as first arg
-                response["campaign_id"] = task_result.info.args[0] if task_result.info.args else None
-            except:
-                pass
-        
-    elif task_result.state == "RETRY":
-        # Task is retrying after failure
-        response["progress"] = 0
-        response["message"] = "Retrying after failure..."
-        
-    else:
-        # Unknown state
-        response["message"] = f"Unknown state: {task_result.state}"
+    Frontend usage:
+        const source = new EventSource(`/tasks/${taskId}/events`);
+        source.onmessage = (e) => render(JSON.parse(e.data));
+    """
+    # Starting point for tasks that haven't published anything yet
+    # (queued, or finished before events existed)
+    task_result = AsyncResult(task_id, app=celery_app)
+    initial_event = build_task_status(task_id, task_result.state, task_result.info)
+    
+    async def event_source():
+        async for event in stream_task_events(task_id, initial_event):
+            if await request.is_disconnected():
+                break
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"data: {json.dumps(event, default=str)}\n\n"
     
-    return response
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Don't let nginx buffer the stream
+        },
+    )
 
 
 @router.delete("/{task_id}")
@@ -101,6 +86,8 @@ async def cancel_task(task_id: str) -> Dict[str, str]:
     if task_result.state in ["PENDING", "STARTED"]:
         # Revoke the task
         task_result.revoke(terminate=True)
+        # A terminated task never reports back; close any open event streams
+        await publish_task_event_async(build_task_status(task_id, "REVOKED"))
         return {
             "message": "Task cancellation requested",
             "task_id": task_id,
@@ -12,18 +12,10 @@ from ...models.db.user import CreatorProfileDB
 from ...models.common.enums import PlatformEnum, PLATFORM_URL_PATTERNS
 from ...api.auth.auth import get_current_user_id
 from ...database.session import get_db
-from ...agents.core.context_analyzer import ContextAnalyzer
-from ...services.platforms.youtube_service import YouTubeService
-from ...services.platforms.twitter_service import TwitterService
+from ...services.core.profile_analysis import context_analyzer_input, request_profile_analysis
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
-context_analyzer = ContextAnalyzer()
-
-# ⚠️ IMPORTANT: These services use SYSTEM API keys (config.YOUTUBE_API_KEY, config.TWITTER_API_KEY)
-# NOT user's personal API keys. The system fetches public data on the user's behalf.
-youtube_service = YouTubeService()  # Uses system's YOUTUBE_API_KEY from config
-twitter_service = TwitterService()  # Uses system's TWITTER_API_KEY from config
 
 
 class OnboardingRequest(BaseModel):
@@ -87,7 +79,9 @@ async def create_creator_profile(
 ):
     """
     Phase 1: Global Onboarding (Required)
-    Collects 4 essential fields and triggers Context Analyzer.
+    Collects 4 essential fields and queues the Context Analyzer as a
+    background task (follow analysis_task_id via GET /tasks/{task_id}/events).
+    Re-submitting unchanged fields doesn't re-run the analysis.
     """
     # Check if profile already exists
     result = await db.execute(select(CreatorProfileDB).where(CreatorProfileDB.user_id == user_id))
@@ -125,54 +119,9 @@ async def create_creator_profile(
     
     logger.info(f"Creator profile {'updated' if existing_profile else 'created'} for user_id={user_id}")
     
-    # Trigger Context Analyzer (fetches historical content automatically)
-    try:
-        # Use getattr to avoid Column type issues
-        platform_urls_val = getattr(profile_db, 'platform_urls') or {}
-        creator_data = {
-            "user_id": getattr(profile_db, 'user_id'),
-            "user_name": getattr(profile_db, 'user_name'),
-            "creator_type": getattr(profile_db, 'creator_type'),
-            "category": getattr(profile_db, 'niche'),  # Map niche → category for Context Analyzer
-            "target_audience": getattr(profile_db, 'target_audience_niche'),  # Map correctly
-            "platforms": getattr(profile_db, 'existing_platforms') or [],
-            "youtube_url": platform_urls_val.get("YouTube") if platform_urls_val else None,
-            "twitter_url": platform_urls_val.get("Twitter") if platform_urls_val else None,
-            "instagram_url": platform_urls_val.get("Instagram") if platform_urls_val else None,
-            "linkedin_url": platform_urls_val.get("LinkedIn") if platform_urls_val else None,
-            "tiktok_url": platform_urls_val.get("TikTok") if platform_urls_val else None,
-            "facebook_url": platform_urls_val.get("Facebook") if platform_urls_val else None,
-            "reddit_url": platform_urls_val.get("Reddit") if platform_urls_val else None,
-        }
-        
-        # Note: Context Analyzer will attempt to auto-fetch user's content
-        # based on niche and available public data
-        # This replaces manual best/worst content entry
-        
-        context_output = context_analyzer.analyze(creator_data)
-        
-        # Update profile with analyzed data using getattr/setattr
-        agent_context = getattr(profile_db, 'agent_context') or {}
-        agent_context["_analyzed_context"] = context_output.model_dump()
-        agent_context["_context_analyzed_at"] = datetime.now(timezone.utc).isoformat()
-        
-        setattr(profile_db, 'agent_context', agent_context)
-        # Extract and truncate recommended_frequency to fit VARCHAR(50)
-        raw_frequency = context_output.strategic_insights.get(
-            'realistic_posting_frequency', 
-            'Not yet determined'
-        )
-        truncated_frequency = raw_frequency[:50] if raw_frequency else 'Not yet determined'
-        setattr(profile_db, 'recommended_frequency', truncated_frequency)
-        
-        await db.commit()
-        await db.refresh(profile_db)
-        
-        logger.info(f"Context Analyzer completed successfully for user_id={user_id}")
-        
-    except Exception as e:
-        logger.error(f"Context Analyzer failed for user_id={user_id}: {e}", exc_info=True)
-        # Continue without analysis - not critical for onboarding
+    # Queue Context Analyzer (fetches historical content automatically);
+    # the profile is returned right away with analysis_pending/analysis_task_id
+    await request_profile_analysis(db, profile_db, context_analyzer_input(profile_db))
     
     # Convert to Pydantic model for response using getattr
     return CreatorProfile(
@@ -195,6 +144,8 @@ async def create_creator_profile(
         recommended_frequency=getattr(profile_db, 'recommended_frequency'),
         agent_context=getattr(profile_db, 'agent_context') or {},
         phase2_completed=getattr(profile_db, 'phase2_completed'),
+        analysis_pending=getattr(profile_db, 'analysis_pending'),
+        analysis_task_id=getattr(profile_db, 'analysis_task_id'),
         created_at=getattr(profile_db, 'created_at'),
         updated_at=getattr(profile_db, 'updated_at')
     )
@@ -236,6 +187,8 @@ async def get_creator_profile(
         recommended_frequency=getattr(profile_db, 'recommended_frequency'),
         agent_context=getattr(profile_db, 'agent_context') or {},
         phase2_completed=getattr(profile_db, 'phase2_completed'),
+        analysis_pending=getattr(profile_db, 'analysis_pending'),
+        analysis_task_id=getattr(profile_db, 'analysis_task_id'),
         created_at=getattr(profile_db, 'created_at'),
         updated_at=getattr(profile_db, 'updated_at')
     )
@@ -10,10 +10,9 @@ from ...models.user.user import CreatorProfile
 from ...models.db.user import CreatorProfileDB
 from ...api.auth.auth import get_current_user_id
 from ...database.session import get_db
-from ...agents.core.context_analyzer import ContextAnalyzer
+from ...services.core.profile_analysis import context_analyzer_input, request_profile_analysis
 
 router = APIRouter(prefix="/profile", tags=["profile"])
-context_analyzer = ContextAnalyzer()
 
 
 class Phase2Update(BaseModel):
@@ -51,6 +50,8 @@ def _profile_db_to_pydantic(profile_db: CreatorProfileDB) -> CreatorProfile:
         recommended_frequency=profile_db.recommended_frequency,
         agent_context=profile_db.agent_context or {},
         phase2_completed=profile_db.phase2_completed,
+        analysis_pending=profile_db.analysis_pending,
+        analysis_task_id=profile_db.analysis_task_id,
         created_at=profile_db.created_at,
         updated_at=profile_db.updated_at
     )
@@ -175,42 +176,8 @@ async def update_phase2(
     await db.commit()
     await db.refresh(profile_db)
     
-    # Re-run Context Analyzer with enhanced data
-    try:
-        creator_data = {
-            "user_id": profile_db.user_id,
-            "user_name": profile_db.user_name,
-            "creator_type": profile_db.creator_type,
-            "niche": profile_db.niche,
-            "target_audience_niche": profile_db.target_audience_niche,
-            "unique_angle": profile_db.unique_angle,
-            "self_purpose": profile_db.self_purpose,
-            "self_strengths": profile_db.self_strengths,
-            "existing_platforms": profile_db.existing_platforms,
-            "target_platforms": profile_db.target_platforms,
-            "self_topics": profile_db.self_topics,
-            "target_audience_demographics": profile_db.target_audience_demographics,
-            "competitor_accounts": profile_db.competitor_accounts,
-            "existing_assets": profile_db.existing_assets,
-            "self_motivation": profile_db.self_motivation
-        }
-        
-        context_output = context_analyzer.analyze(creator_data)
-        
-        agent_context = profile_db.agent_context or {}
-        agent_context["_analyzed_context"] = context_output.model_dump()
-        agent_context["_context_analyzed_at"] = datetime.now(timezone.utc).isoformat()
-        
-        profile_db.agent_context = agent_context
-        profile_db.recommended_frequency = context_output.strategic_insights.get(
-            'realistic_posting_frequency',
-            'Not yet determined'
-        )
-        
-        await db.commit()
-        await db.refresh(profile_db)
-        
-    except Exception as e:
-        print(f"Context Analyzer failed: {e}")
+    # Re-run Context Analyzer with enhanced data (background task; only sections
+    # whose inputs changed are regenerated, nothing if the input is unchanged)
+    await request_profile_analysis(db, profile_db, context_analyzer_input(profile_db))
     
     return _profile_db_to_pydantic(profile_db)
@@ -11,6 +11,7 @@ from ..models.db.user import UserDB
 from ..models.db.subscription import SubscriptionDB, UsageMetricDB
 from ..models.db.webhook import WebhookEventDB
 from ..database.session import get_db
+from ..services.core.auth_cache import verified_token_cache
 from ..config import CLERK_WEBHOOK_SECRET
 
 router = APIRouter(prefix="/api", tags=["webhooks"])
@@ -214,6 +215,9 @@ async def clerk_webhook(request: Request, db: AsyncSession = Depends(get_db)):
 
         # Commit user deletion AND webhook event in same transaction
         await db.commit()
+        # Stop serving the deleted user from the verified-token cache
+        if clerk_user_id:
+            verified_token_cache.invalidate_user(clerk_user_id)
         logger.info(f"Successfully processed user.deleted for {clerk_user_id}")
 
     return {"status": "success"}
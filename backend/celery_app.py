@@ -1,5 +1,10 @@
 """Celery application for background task processing."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from .config import REDIS_URL
 
 # Initialize Celery app
@@ -7,7 +12,7 @@ celery_app = Celery(
     "super_engine_lab",
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=["backend.tasks.campaign_tasks"]
+    include=["backend.tasks.campaign_tasks", "backend.tasks.competitor_tasks", "backend.tasks.profile_tasks"]
 )
 
 # Celery configuration
@@ -40,48 +45,108 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,  # Requeue if worker crashes
 )
 
-# Helper function for async database sessions in tasks
-def get_async_session():
-    """
-    Create async database session for Celery tasks.
-    Cannot use FastAPI dependency injection in tasks.
-    
-    Creates a fresh engine per task to avoid connection pool conflicts.
-    Returns a context manager that properly handles connection lifecycle.
-    """
+# Worker runtime: one event loop and one pooled engine per worker process,
+# created when the process starts and reused by every task it runs. Loop-bound
+# clients (asyncpg pool, LLM httpx client, async Redis) stay warm across tasks
+# instead of being rebuilt by asyncio.run() each time.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_engine = None
+_worker_sessionmaker = None
+
+
+def init_worker_runtime() -> None:
+    """Create the process's event loop and pooled DB engine, and compile prompts (idempotent)."""
+    global _worker_loop, _worker_engine, _worker_sessionmaker
     from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-    from sqlalchemy.pool import NullPool
-    from contextlib import asynccontextmanager
-    from .config import DATABASE_URL
+    from .config import DATABASE_URL, CELERY_DB_POOL_SIZE, CELERY_DB_MAX_OVERFLOW, DB_POOL_TIMEOUT
+    from .services.ai.gemini_service import validate_prompts
     
-    # Create engine with NullPool to avoid connection conflicts between Celery and FastAPI
-    engine = create_async_engine(
-        DATABASE_URL,
-        poolclass=NullPool,  # No connection pooling for Celery tasks
-        echo=False,
-    )
+    validate_prompts()
     
-    @asynccontextmanager
-    async def session_context():
-        """Async context manager for session."""
-        # Create session maker
-        SessionLocal = async_sessionmaker(
-            engine,
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    
+    if _worker_engine is None:
+        _worker_engine = create_async_engine(
+            DATABASE_URL,
+            pool_size=CELERY_DB_POOL_SIZE,
+            max_overflow=CELERY_DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_pre_ping=True,  # Connections can sit idle between tasks
+            pool_recycle=3600,
+            echo=False,
+        )
+        _worker_sessionmaker = async_sessionmaker(
+            _worker_engine,
             class_=AsyncSession,
             expire_on_commit=False,
             autocommit=False,
             autoflush=False,
         )
-        
-        session = SessionLocal()
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-            await engine.dispose()
+
+
+def shutdown_worker_runtime() -> None:
+    """Close loop-bound clients, dispose the engine and close the loop."""
+    global _worker_loop, _worker_engine, _worker_sessionmaker
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+    
+    from .services.ai.llm_client import close_llm_http_client
+    
+    async def close_clients():
+        await close_llm_http_client()
+        if _worker_engine is not None:
+            await _worker_engine.dispose()
+    
+    try:
+        _worker_loop.run_until_complete(close_clients())
+        _worker_loop.run_until_complete(_worker_loop.shutdown_asyncgens())
+    finally:
+        _worker_loop.close()
+        _worker_loop = None
+        _worker_engine = None
+        _worker_sessionmaker = None
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs):
+    init_worker_runtime()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs):
+    shutdown_worker_runtime()
+
+
+def run_async(coro):
+    """
+    Run a task's coroutine on the worker-lifetime event loop.
     
-    return session_context()
+    Use instead of asyncio.run() in task bodies. The runtime is created
+    lazily when worker_process_init didn't fire (solo pool, eager mode).
+    """
+    init_worker_runtime()
+    return _worker_loop.run_until_complete(coro)
+
+
+# Helper function for async database sessions in tasks
+@asynccontextmanager
+async def get_async_session():
+    """
+    Borrow an async database session from the worker's pooled engine.
+    Cannot use FastAPI dependency injection in tasks.
+    
+    Commits on success, rolls back on error; the connection goes back to
+    the process pool rather than being closed.
+    """
+    init_worker_runtime()
+    session = _worker_sessionmaker()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
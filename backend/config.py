@@ -40,12 +40,84 @@ if not _clerk_jwks:
     raise ValueError("CLERK_JWKS_URL environment variable is required")
 CLERK_JWKS_URL: str = _clerk_jwks
 
+# Auth hot path: verified token -> user_id cache (bounded by the token's exp)
+# and batched last_login_at writes
+AUTH_TOKEN_CACHE_TTL: int = int(os.getenv("AUTH_TOKEN_CACHE_TTL", "60"))  # seconds
+AUTH_TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+LAST_LOGIN_FLUSH_INTERVAL: int = int(os.getenv("LAST_LOGIN_FLUSH_INTERVAL", "60"))  # seconds
+
+# Clerk JWKS: refreshed in the background before it expires; an unknown kid
+# (key rotation) forces a refresh at most once per JWKS_MIN_REFRESH_INTERVAL,
+# and failed background refreshes are retried at the same rate. A key set is
+# served stale for at most JWKS_MAX_STALENESS past its TTL; after that callers
+# wait for a fresh fetch and tokens are rejected if it fails (fail closed)
+JWKS_CACHE_TTL: int = int(os.getenv("JWKS_CACHE_TTL", "3600"))  # seconds
+JWKS_REFRESH_AHEAD: int = int(os.getenv("JWKS_REFRESH_AHEAD", "300"))  # seconds before expiry
+JWKS_MIN_REFRESH_INTERVAL: int = int(os.getenv("JWKS_MIN_REFRESH_INTERVAL", "30"))  # seconds
+JWKS_MAX_STALENESS: int = int(os.getenv("JWKS_MAX_STALENESS", "900"))  # seconds past JWKS_CACHE_TTL
+
+# LLM HTTP client (shared, connection-pooled async client for completions)
+LLM_HTTP_TIMEOUT: float = float(os.getenv("LLM_HTTP_TIMEOUT", "30"))
+LLM_HTTP2_ENABLED: bool = os.getenv("LLM_HTTP2_ENABLED", "True").lower() == "true"
+LLM_MAX_CONNECTIONS: int = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "10"))
+LLM_KEEPALIVE_EXPIRY: float = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+# Stream completions and parse/validate JSON fields as they arrive
+LLM_STREAMING_ENABLED: bool = os.getenv("LLM_STREAMING_ENABLED", "True").lower() == "true"
+
+# Campaign workflow: max concurrent LLM calls for content (batched calls, or days
+# when batching is off) and max days running thumbnail + SEO at once
+CONTENT_GENERATION_CONCURRENCY: int = int(os.getenv("CONTENT_GENERATION_CONCURRENCY", "5"))
+# Batched content generation: up to CONTENT_BATCH_SIZE days per LLM call (1 = one
+# call per day). The batch is shrunk so prompt + expected output fit the model's
+# context window; token counts are estimated at ~4 characters per token. Days are
+# checkpointed in waves of batch size x CONTENT_GENERATION_CONCURRENCY days, so
+# e.g. 5 x 5 generates 25 days in 5 concurrent calls before the next commit.
+CONTENT_BATCH_SIZE: int = int(os.getenv("CONTENT_BATCH_SIZE", "5"))
+LLM_CONTEXT_WINDOW_TOKENS: int = int(os.getenv("LLM_CONTEXT_WINDOW_TOKENS", "32000"))
+CONTENT_OUTPUT_TOKENS_PER_DAY: int = int(os.getenv("CONTENT_OUTPUT_TOKENS_PER_DAY", "1500"))
+# Minimum seconds between workflow progress updates (stage boundaries always report)
+PROGRESS_MIN_INTERVAL: float = float(os.getenv("PROGRESS_MIN_INTERVAL", "1.0"))
+
+# Past-campaign learnings fed to the Strategy and Planner agents.
+# "ranked": a user's most recent LEARNING_MEMORY_CANDIDATES memories ranked by
+# lexical (TF-IDF) similarity to the new campaign blended with recency.
+# "exact": latest memories with the same goal type, platform and niche.
+LEARNING_RETRIEVAL_MODE: str = os.getenv("LEARNING_RETRIEVAL_MODE", "ranked").lower()
+LEARNING_MEMORY_TOP_K: int = int(os.getenv("LEARNING_MEMORY_TOP_K", "3"))
+LEARNING_MEMORY_CANDIDATES: int = int(os.getenv("LEARNING_MEMORY_CANDIDATES", "50"))
+LEARNING_RECENCY_HALF_LIFE_DAYS: float = float(os.getenv("LEARNING_RECENCY_HALF_LIFE_DAYS", "90"))
+LEARNING_RECENCY_WEIGHT: float = float(os.getenv("LEARNING_RECENCY_WEIGHT", "0.3"))  # 0-1, rest is similarity
+# Per-user candidate cache (invalidated in-process when a memory is saved)
+LEARNING_CACHE_TTL: int = int(os.getenv("LEARNING_CACHE_TTL", "300"))  # seconds
+
 # YouTube Data API v3 Configuration
 YOUTUBE_API_KEY: Optional[str] = os.getenv("YOUTUBE_API_KEY")
 
 # Twitter/X API Configuration (twitterapi.io)
 TWITTER_API_KEY: Optional[str] = os.getenv("TWITTER_API_KEY")
 
+# Competitor fetch concurrency per provider (forensics fetches all competitors at once)
+YOUTUBE_FETCH_CONCURRENCY: int = int(os.getenv("YOUTUBE_FETCH_CONCURRENCY", "4"))
+TWITTER_FETCH_CONCURRENCY: int = int(os.getenv("TWITTER_FETCH_CONCURRENCY", "3"))
+
+# Shared competitor snapshot store (competitor_snapshots table)
+# Fresh: served as-is. Stale but within max age: served, refreshed in the background.
+# Older than max age (or missing): fetched inline.
+COMPETITOR_SNAPSHOT_FRESHNESS: dict[str, int] = {  # seconds
+    "youtube": int(os.getenv("YOUTUBE_SNAPSHOT_FRESHNESS", str(24 * 3600))),
+    "twitter": int(os.getenv("TWITTER_SNAPSHOT_FRESHNESS", str(6 * 3600))),
+}
+COMPETITOR_SNAPSHOT_MAX_AGE: dict[str, int] = {  # seconds
+    "youtube": int(os.getenv("YOUTUBE_SNAPSHOT_MAX_AGE", str(7 * 24 * 3600))),
+    "twitter": int(os.getenv("TWITTER_SNAPSHOT_MAX_AGE", str(2 * 24 * 3600))),
+}
+
+# YouTube channel resolution index (channel_resolutions table)
+# Handles can be renamed or reclaimed, so positive entries expire too (just slowly).
+CHANNEL_RESOLUTION_TTL: int = int(os.getenv("CHANNEL_RESOLUTION_TTL", str(30 * 24 * 3600)))  # seconds
+CHANNEL_RESOLUTION_NEGATIVE_TTL: int = int(os.getenv("CHANNEL_RESOLUTION_NEGATIVE_TTL", str(24 * 3600)))  # seconds
+
 # Platform-specific constants
 YOUTUBE_MAX_ITEMS: int = 8
 X_MAX_ITEMS: int = 15
@@ -82,6 +154,15 @@ POLLINATIONS_API_KEY: str = os.getenv("POLLINATIONS_API_KEY")
 if not POLLINATIONS_API_KEY:
     raise ValueError("POLLINATIONS_API_KEY environment variable is required")
 
+# Generated media blob store (content-addressed; rows keep only the key)
+# "filesystem" for dev/test, "s3" for any S3-compatible object store (requires boto3)
+BLOB_STORE_BACKEND: str = os.getenv("BLOB_STORE_BACKEND", "filesystem").lower()
+BLOB_STORE_PATH: str = os.getenv("BLOB_STORE_PATH", os.path.join(os.path.dirname(__file__), "media"))
+BLOB_STORE_BUCKET: Optional[str] = os.getenv("BLOB_STORE_BUCKET")
+BLOB_STORE_ENDPOINT_URL: Optional[str] = os.getenv("BLOB_STORE_ENDPOINT_URL")  # e.g. R2/MinIO; None = AWS
+# Public origin of this API, used to build /media/{key} URLs at read time
+MEDIA_BASE_URL: str = os.getenv("MEDIA_BASE_URL", "http://localhost:8000").rstrip("/")
+
 # Database Configuration (Neon DB - PostgreSQL)
 DATABASE_URL: str = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
@@ -99,4 +180,26 @@ DB_ECHO: bool = os.getenv("DB_ECHO", "False").lower() == "true"
 REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 CELERY_BROKER_URL: str = REDIS_URL
 CELERY_RESULT_BACKEND: str = REDIS_URL
-
+# Per-worker-process DB pool (each prefork child runs one task at a time)
+CELERY_DB_POOL_SIZE: int = int(os.getenv("CELERY_DB_POOL_SIZE", "2"))
+CELERY_DB_MAX_OVERFLOW: int = int(os.getenv("CELERY_DB_MAX_OVERFLOW", "3"))
+# Task progress events (Redis pub/sub relayed as SSE by GET /tasks/{task_id}/events)
+TASK_EVENTS_TTL: int = int(os.getenv("TASK_EVENTS_TTL", "3600"))  # seconds the latest event is kept
+TASK_EVENTS_KEEPALIVE: float = float(os.getenv("TASK_EVENTS_KEEPALIVE", "15"))  # seconds between keepalives
+
+# Agent LLM response cache (in-process LRU + Redis tier on REDIS_URL)
+LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+LLM_CACHE_REDIS_ENABLED: bool = os.getenv("LLM_CACHE_REDIS_ENABLED", "True").lower() == "true"
+LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "256"))
+LLM_CACHE_DEFAULT_TTL: int = int(os.getenv("LLM_CACHE_DEFAULT_TTL", "3600"))  # seconds
+# Per-agent TTLs keyed by prompt template name
+LLM_CACHE_TTLS: dict[str, int] = {
+    "agent1_context.txt": 24 * 3600,
+    "agent2_strategy.txt": 6 * 3600,
+    "agent3_forensics_youtube.txt": 12 * 3600,
+    "agent3_forensics_twitter.txt": 6 * 3600,
+    "agent4_planner.txt": 6 * 3600,
+    "agent5_content.txt": 6 * 3600,
+    "agent5_content_batch.txt": 6 * 3600,
+    "agent6_outcome.txt": 24 * 3600,
+}
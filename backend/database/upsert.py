@@ -0,0 +1,11 @@
+"""Dialect-aware INSERT ... ON CONFLICT helpers."""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(db: AsyncSession):
+    """Dialect-specific INSERT supporting ON CONFLICT (PostgreSQL in prod, SQLite in tests)."""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
@@ -10,6 +10,14 @@ from .api.user import onboarding, profile
 from .api.campaign import campaigns, content
 from .api import tasks
 from .api import webhooks
+from .api import media
+from .services.ai.gemini_service import validate_prompts
+from .services.ai.llm_client import close_llm_http_client
+from .services.ai.prompt_registry import prompt_registry
+from .services.ai.response_cache import response_cache
+from .services.core.auth_cache import last_login_recorder
+from .services.core.clerk_service import clerk_service
+from .services.core.redis_clients import close_redis_clients
 
 app = FastAPI(
     title="Goal-Driven Agentic Campaign System",
@@ -24,6 +32,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Cross-origin clients must be able to read the list pagination cursor
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
@@ -34,6 +44,29 @@ app.include_router(profile.router)
 app.include_router(campaigns.router)
 app.include_router(content.router)
 app.include_router(tasks.router)
+app.include_router(media.router)
+
+
+@app.on_event("startup")
+def load_prompt_templates():
+    """Compile all agent prompts once and fail fast if one doesn't match its caller."""
+    validate_prompts()
+
+
+@app.on_event("startup")
+async def start_background_flushers():
+    """Start the batched last_login_at writer and proactive JWKS refresh."""
+    last_login_recorder.start()
+    clerk_service.start_key_rotation()
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Release pooled LLM/Redis connections and flush pending last_login_at writes on shutdown."""
+    await close_llm_http_client()
+    await close_redis_clients()
+    await last_login_recorder.stop()
+    await clerk_service.stop_key_rotation()
 
 
 @app.exception_handler(Exception)
@@ -61,6 +94,18 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/cache")
+def cache_stats():
+    """LLM response cache hit/miss counters (paid calls saved = memory_hits + redis_hits)."""
+    return response_cache.snapshot()
+
+
+@app.get("/health/prompts")
+def prompt_versions():
+    """Loaded prompt templates and their content hashes (part of LLM cache keys)."""
+    return prompt_registry.versions()
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
 
@@ -22,6 +22,8 @@ from backend.database.base import Base
 from backend.models.db.user import UserDB, CreatorProfileDB
 from backend.models.db.subscription import SubscriptionDB, UsageMetricDB
 from backend.models.db.campaign import CampaignDB, DailyContentDB, DailyExecutionDB, LearningMemoryDB
+from backend.models.db.competitor import CompetitorSnapshotDB
+from backend.models.db.channel_resolution import ChannelResolutionDB
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,39 @@
+"""Add workflow_checkpoint to campaigns
+
+Revision ID: 006_add_workflow_checkpoint
+Revises: 005_fix_mutable_defaults
+Create Date: 2026-10-17
+
+Stores per-stage markers (strategy, forensics per competitor, planner,
+content/thumbnail/SEO per day) so a retried or restarted campaign workflow
+resumes from the first incomplete unit instead of starting over.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '006_add_workflow_checkpoint'
+down_revision = '005_fix_mutable_defaults'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Add workflow_checkpoint column."""
+    op.add_column(
+        'campaigns',
+        sa.Column(
+            'workflow_checkpoint',
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment='Workflow stage markers for resumable execution'
+        )
+    )
+
+
+def downgrade() -> None:
+    """Revert migration: Drop workflow_checkpoint column."""
+    op.drop_column('campaigns', 'workflow_checkpoint')
@@ -0,0 +1,43 @@
+"""Add competitor_snapshots table
+
+Revision ID: 007_add_competitor_snapshots
+Revises: 006_add_workflow_checkpoint
+Create Date: 2026-10-17
+
+Shared store of normalized competitor videos/tweets keyed by resolved
+YouTube channel ID / Twitter user ID, so repeat competitors across
+campaigns don't re-spend platform API quota.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '007_add_competitor_snapshots'
+down_revision = '006_add_workflow_checkpoint'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Create competitor_snapshots table."""
+    op.create_table(
+        'competitor_snapshots',
+        sa.Column('platform', sa.String(length=50), nullable=False, comment='youtube, twitter'),
+        sa.Column('external_id', sa.String(length=255), nullable=False, comment='Resolved YouTube channel ID (UC...) or Twitter user ID'),
+        sa.Column('handle', sa.String(length=255), nullable=False, comment='Normalized identifier from the competitor URL'),
+        sa.Column('items', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Normalized video/tweet records'),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=False, comment='When items were fetched from the platform API'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('platform', 'external_id')
+    )
+    op.create_index('ix_competitor_snapshots_platform_handle', 'competitor_snapshots', ['platform', 'handle'])
+
+
+def downgrade() -> None:
+    """Revert migration: Drop competitor_snapshots table."""
+    op.drop_index('ix_competitor_snapshots_platform_handle', table_name='competitor_snapshots')
+    op.drop_table('competitor_snapshots')
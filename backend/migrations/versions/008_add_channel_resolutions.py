@@ -0,0 +1,37 @@
+"""Add channel_resolutions table
+
+Revision ID: 008_add_channel_resolutions
+Revises: 007_add_competitor_snapshots
+Create Date: 2026-10-17
+
+Persistent YouTube handle/username → channel ID index, including negative
+entries for unresolvable identifiers.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_add_channel_resolutions'
+down_revision = '007_add_competitor_snapshots'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Create channel_resolutions table."""
+    op.create_table(
+        'channel_resolutions',
+        sa.Column('identifier_type', sa.String(length=20), nullable=False, comment='handle, username, id'),
+        sa.Column('identifier_value', sa.String(length=255), nullable=False, comment='Lowercased handle/username; channel IDs keep their case'),
+        sa.Column('channel_id', sa.String(length=64), nullable=True, comment='Resolved channel ID (UC...), NULL if unresolvable'),
+        sa.Column('resolved_at', sa.DateTime(timezone=True), nullable=False, comment='When the platform API was last asked'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('identifier_type', 'identifier_value')
+    )
+
+
+def downgrade() -> None:
+    """Revert migration: Drop channel_resolutions table."""
+    op.drop_table('channel_resolutions')
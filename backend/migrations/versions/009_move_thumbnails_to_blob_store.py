@@ -0,0 +1,109 @@
+"""Move inline thumbnail data URIs into the blob store
+
+Revision ID: 009_move_thumbnails_to_blob_store
+Revises: 008_add_channel_resolutions
+Create Date: 2026-10-17
+
+daily_content.thumbnail_urls used to hold full base64 data URIs (~1-2 MB
+per day). Decode them into the configured blob store and keep only the
+content-addressed key, which the API expands to /media/{key} on read.
+"""
+
+import base64
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '009_move_thumbnails_to_blob_store'
+down_revision = '008_add_channel_resolutions'
+branch_labels = None
+depends_on = None
+
+
+# Rows per batch: each holds up to ~1-2 MB of base64, so never load the table at once
+BATCH_SIZE = 100
+
+
+def _daily_content_table():
+    return sa.table(
+        'daily_content',
+        sa.column('content_id', sa.String),
+        sa.column('thumbnail_urls', postgresql.JSONB),
+    )
+
+
+def _batches(conn, daily_content, condition):
+    """Yield (content_id, thumbnail_urls) rows matching condition, BATCH_SIZE at a time (keyset on content_id)."""
+    last_id = None
+    while True:
+        query = (
+            sa.select(daily_content.c.content_id, daily_content.c.thumbnail_urls)
+            .where(condition)
+            .order_by(daily_content.c.content_id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(daily_content.c.content_id > last_id)
+        rows = conn.execute(query).fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Apply migration: Replace data URIs with blob keys."""
+    from backend.storage.blob_store import blob_store
+
+    conn = op.get_bind()
+    daily_content = _daily_content_table()
+    has_data_uri = sa.cast(daily_content.c.thumbnail_urls, sa.Text).like('%data:image/%')
+
+    # Each batch is updated before the next is fetched
+    for rows in _batches(conn, daily_content, has_data_uri):
+        for row_id, thumbnail_urls in rows:
+            migrated = {}
+            for platform, value in (thumbnail_urls or {}).items():
+                if isinstance(value, str) and value.startswith('data:image/') and ';base64,' in value:
+                    header, b64_data = value.split(';base64,', 1)
+                    content_type = header[len('data:'):]
+                    value = blob_store.put(base64.b64decode(b64_data), content_type)
+                migrated[platform] = value
+            conn.execute(
+                daily_content.update()
+                .where(daily_content.c.content_id == row_id)
+                .values(thumbnail_urls=migrated)
+            )
+
+
+def downgrade() -> None:
+    """Revert migration: Rebuild data URIs from the blob store (pre-008 code serves the column as-is)."""
+    from backend.storage.blob_store import blob_store, content_type_for, is_blob_key
+
+    conn = op.get_bind()
+    daily_content = _daily_content_table()
+    has_value = sa.cast(daily_content.c.thumbnail_urls, sa.Text).notin_(['{}', 'null'])
+
+    for rows in _batches(conn, daily_content, has_value):
+        for row_id, thumbnail_urls in rows:
+            restored = {}
+            changed = False
+            for platform, value in (thumbnail_urls or {}).items():
+                if isinstance(value, str) and is_blob_key(value):
+                    data = blob_store.get(value)
+                    if data is None:
+                        raise RuntimeError(
+                            f"Cannot downgrade: thumbnail blob {value} for daily_content {row_id} is missing"
+                        )
+                    value = f"data:{content_type_for(value)};base64,{base64.b64encode(data).decode('ascii')}"
+                    changed = True
+                restored[platform] = value
+            if changed:
+                conn.execute(
+                    daily_content.update()
+                    .where(daily_content.c.content_id == row_id)
+                    .values(thumbnail_urls=restored)
+                )
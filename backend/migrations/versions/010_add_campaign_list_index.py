@@ -0,0 +1,34 @@
+"""Add composite index for paginated campaign listing
+
+Revision ID: 010_add_campaign_list_index
+Revises: 009_move_thumbnails_to_blob_store
+Create Date: 2026-10-17
+
+GET /campaigns pages through a user's campaigns newest first with a
+(created_at, campaign_id) keyset cursor; this index serves both the
+filter and the ordering.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_add_campaign_list_index'
+down_revision = '009_move_thumbnails_to_blob_store'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Create ix_campaigns_user_id_created_at."""
+    op.create_index(
+        'ix_campaigns_user_id_created_at',
+        'campaigns',
+        ['user_id', sa.text('created_at DESC'), sa.text('campaign_id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Revert migration: Drop ix_campaigns_user_id_created_at."""
+    op.drop_index('ix_campaigns_user_id_created_at', table_name='campaigns')
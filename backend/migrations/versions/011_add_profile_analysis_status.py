@@ -0,0 +1,47 @@
+"""Add context analysis status columns to creator_profiles
+
+Revision ID: 011_add_profile_analysis_status
+Revises: 010_add_campaign_list_index
+Create Date: 2026-10-17
+
+Context analysis now runs as a Celery task after onboarding/profile
+updates. analysis_pending and analysis_task_id let the client follow it;
+analysis_fingerprint identifies the profile data the latest requested
+analysis is for, so unchanged re-submissions don't re-run it.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011_add_profile_analysis_status'
+down_revision = '010_add_campaign_list_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Add analysis_pending, analysis_task_id, analysis_fingerprint."""
+    op.add_column(
+        'creator_profiles',
+        sa.Column('analysis_pending', sa.Boolean(), server_default=sa.text('false'), nullable=False,
+                  comment='Context analysis queued or running')
+    )
+    op.add_column(
+        'creator_profiles',
+        sa.Column('analysis_task_id', sa.String(length=255), nullable=True,
+                  comment='Celery task ID of the pending context analysis')
+    )
+    op.add_column(
+        'creator_profiles',
+        sa.Column('analysis_fingerprint', sa.String(length=64), nullable=True,
+                  comment='SHA-256 of the analyzer input of the latest requested analysis')
+    )
+
+
+def downgrade() -> None:
+    """Revert migration: Drop the analysis status columns."""
+    op.drop_column('creator_profiles', 'analysis_fingerprint')
+    op.drop_column('creator_profiles', 'analysis_task_id')
+    op.drop_column('creator_profiles', 'analysis_pending')
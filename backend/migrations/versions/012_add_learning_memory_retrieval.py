@@ -0,0 +1,44 @@
+"""Add composite index and term vectors for learning memory retrieval
+
+Revision ID: 012_add_learning_memory_retrieval
+Revises: 011_add_profile_analysis_status
+Create Date: 2026-10-17
+
+Past learnings are looked up per user by goal type and platform, newest
+first; the composite index serves the filter and the ordering (the one
+described in LearningMemoryDB.__table_args__ was never created).
+relevance_terms holds each memory's lexical term vector, computed when
+the memory is saved, for relevance-ranked retrieval. Existing rows keep
+NULL and are vectorized at read time.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '012_add_learning_memory_retrieval'
+down_revision = '011_add_profile_analysis_status'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Create ix_learning_memories_user_goal_platform_created, add relevance_terms."""
+    op.create_index(
+        'ix_learning_memories_user_goal_platform_created',
+        'learning_memories',
+        ['user_id', 'goal_type', 'platform', sa.text('created_at DESC')]
+    )
+    op.add_column(
+        'learning_memories',
+        sa.Column('relevance_terms', postgresql.JSONB(astext_type=sa.Text()), nullable=True,
+                  comment='Lexical term vector {term: weight} for relevance ranking')
+    )
+
+
+def downgrade() -> None:
+    """Revert migration: Drop relevance_terms and the composite index."""
+    op.drop_column('learning_memories', 'relevance_terms')
+    op.drop_index('ix_learning_memories_user_goal_platform_created', table_name='learning_memories')
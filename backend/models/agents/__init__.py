@@ -5,6 +5,8 @@ from .agent_outputs import (
     ForensicsAgentOutput,
     PlannerAgentOutput,
     ContentAgentOutput,
+    ContentBatchDay,
+    ContentBatchOutput,
     OutcomeAgentOutput
 )
 
@@ -14,5 +16,7 @@ __all__ = [
     "ForensicsAgentOutput",
     "PlannerAgentOutput",
     "ContentAgentOutput",
+    "ContentBatchDay",
+    "ContentBatchOutput",
     "OutcomeAgentOutput"
 ]
@@ -83,14 +83,26 @@ class ContentReasoning(BaseModel):
 
 
 class ContentAgentOutput(BaseModel):
-    """Output from Content Execution Agent."""
+    """Output from Content Execution Agent (every target platform's content for the day)."""
     youtube_script: Optional[str] = None
     title: Optional[str] = None
     seo_tags: list[str] = Field(default_factory=list)
     cta: Optional[str] = None
+    x_tweet: Optional[str] = Field(None, description="Twitter/X single tweet (max 280 characters)")
+    x_thread: Optional[list[str]] = Field(None, description="Twitter/X thread (list of tweets)")
     reasoning: Optional[ContentReasoning] = Field(None, description="Explanation of content strategy")
 
 
+class ContentBatchDay(ContentAgentOutput):
+    """One day's content inside a batched Content Agent response."""
+    day_number: int = Field(..., description="Day this content is for")
+
+
+class ContentBatchOutput(BaseModel):
+    """Output from a batched Content Agent call (several days per call)."""
+    days: list[ContentBatchDay]
+
+
 # Agent 6: Outcome Agent Output
 class OutcomeAgentOutput(BaseModel):
     """Output from Outcome Analysis Agent."""
@@ -1,6 +1,6 @@
 """Campaign models package."""
 from .campaign import (
-    Campaign, CampaignCreate, CampaignResponse, CampaignStatus,
+    Campaign, CampaignCreate, CampaignResponse, CampaignSummary, CampaignStatus,
     CampaignOnboarding, CampaignGoal, CampaignMetric, CampaignCompetitors,
     CompetitorPlatform, AgentConfig, CampaignPlan, DayPlan,
     DailyContent, DailyExecution, CampaignReport
@@ -8,7 +8,7 @@ from .campaign import (
 from .learning_memory import LearningMemory
 
 __all__ = [
-    "Campaign", "CampaignCreate", "CampaignResponse", "CampaignStatus",
+    "Campaign", "CampaignCreate", "CampaignResponse", "CampaignSummary", "CampaignStatus",
     "CampaignOnboarding", "CampaignGoal", "CampaignMetric", "CampaignCompetitors",
     "CompetitorPlatform", "AgentConfig", "CampaignPlan", "DayPlan",
     "DailyContent", "DailyExecution", "CampaignReport",
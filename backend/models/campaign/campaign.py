@@ -177,3 +177,15 @@ class CampaignResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+
+class CampaignSummary(BaseModel):
+    """Campaign list item (summary columns only - no plan or agent outputs)."""
+    campaign_id: str
+    name: Optional[str] = None
+    status: str
+    target_platforms: Optional[list[str]] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    updated_at: datetime
+
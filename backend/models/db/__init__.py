@@ -1,2 +1,4 @@
 """SQLAlchemy database models package."""
 from .webhook import WebhookEventDB
+from .competitor import CompetitorSnapshotDB
+from .channel_resolution import ChannelResolutionDB
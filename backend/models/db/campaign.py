@@ -1,6 +1,7 @@
 """SQLAlchemy models for campaigns and related tables."""
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, CheckConstraint, UniqueConstraint
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ...database.base import Base
 
@@ -37,6 +38,7 @@ class CampaignDB(Base):
     campaign_plan = Column(JSONB, nullable=True, comment="CampaignPlan model (day-by-day plan)")
     content_warnings = Column(JSONB, nullable=True, comment="Realism assessment warnings")
     outcome_report = Column(JSONB, nullable=True, comment="CampaignReport model (outcome analysis)")
+    workflow_checkpoint = Column(JSONB, nullable=True, comment="Workflow stage markers for resumable execution: {strategy, forensics: {platform: output}, planner, days: {day: [content, thumbnail, seo]}}")
     
     # ===== Timestamps =====
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -44,6 +46,32 @@ class CampaignDB(Base):
     started_at = Column(DateTime(timezone=True), nullable=True, comment="User clicked 'Start'")
     completed_at = Column(DateTime(timezone=True), nullable=True, comment="Campaign finished")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    # Keyset pagination for GET /campaigns (newest first per user)
+    __table_args__ = (
+        Index("ix_campaigns_user_id_created_at", user_id, created_at.desc(), campaign_id.desc()),
+    )
+    
+    # ===== Children =====
+    # lazy="raise": implicit loads fail under AsyncSession anyway, so callers must
+    # hydrate explicitly (see services.core.campaign_hydration). passive_deletes
+    # leaves unloaded children to the ON DELETE CASCADE foreign keys.
+    daily_content = relationship(
+        "DailyContentDB",
+        back_populates="campaign",
+        order_by="DailyContentDB.day_number",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    daily_execution = relationship(
+        "DailyExecutionDB",
+        back_populates="campaign",
+        order_by="DailyExecutionDB.day_number",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
 
 
 class DailyContentDB(Base):
@@ -84,6 +112,8 @@ class DailyContentDB(Base):
         CheckConstraint("day_number >= 1 AND day_number <= 30", name="check_day_number_range"),
         UniqueConstraint("campaign_id", "day_number", "platform", name="unique_content_per_day_platform"),
     )
+    
+    campaign = relationship("CampaignDB", back_populates="daily_content", lazy="raise")
 
 
 class DailyExecutionDB(Base):
@@ -119,6 +149,8 @@ class DailyExecutionDB(Base):
     __table_args__ = (
         UniqueConstraint("campaign_id", "day_number", "platform", name="unique_execution_per_day_platform"),
     )
+    
+    campaign = relationship("CampaignDB", back_populates="daily_execution", lazy="raise")
 
 
 class LearningMemoryDB(Base):
@@ -147,10 +179,13 @@ class LearningMemoryDB(Base):
     recommendations = Column(JSONB, default=list, comment="Recommendations")
     goal_achievement_summary = Column(Text, default="", comment="Goal achievement summary")
     
+    # ===== Retrieval =====
+    relevance_terms = Column(JSONB, nullable=True, comment="Lexical term vector {term: weight} for relevance ranking")
+    
     # Timestamp
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
-    # Composite index for fast retrieval
+    # Composite index for fast retrieval (filter by user/goal/platform, newest first)
     __table_args__ = (
-        # Index on (user_id, goal_type, platform, niche) for fast filtering
+        Index("ix_learning_memories_user_goal_platform_created", user_id, goal_type, platform, created_at.desc()),
     )
@@ -0,0 +1,26 @@
+"""SQLAlchemy model for the YouTube channel resolution index."""
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from ...database.base import Base
+
+
+class ChannelResolutionDB(Base):
+    """
+    Channel resolutions table - YouTube handle/username/custom URL → channel ID.
+    
+    Resolving an @handle costs a search.list call (100 quota units) and the
+    answer almost never changes, so resolutions are shared across users.
+    A NULL channel_id records an unresolvable identifier (negative cache).
+    """
+    __tablename__ = "channel_resolutions"
+    
+    # Primary Key (normalized identifier from the channel URL)
+    identifier_type = Column(String(20), primary_key=True, comment="handle, username, id")
+    identifier_value = Column(String(255), primary_key=True, comment="Lowercased handle/username; channel IDs keep their case")
+    
+    # Resolution
+    channel_id = Column(String(64), nullable=True, comment="Resolved channel ID (UC...), NULL if unresolvable")
+    resolved_at = Column(DateTime(timezone=True), nullable=False, comment="When the platform API was last asked")
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,34 @@
+"""SQLAlchemy model for shared competitor data snapshots."""
+from sqlalchemy import Column, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from ...database.base import Base
+
+
+class CompetitorSnapshotDB(Base):
+    """
+    Competitor snapshots table - Latest normalized videos/tweets per competitor account.
+    
+    Shared across users: creators in the same niche often list the same
+    competitors, so one fetch serves every campaign that references them.
+    """
+    __tablename__ = "competitor_snapshots"
+    
+    # Primary Key (platform-native account ID)
+    platform = Column(String(50), primary_key=True, comment="youtube, twitter")
+    external_id = Column(String(255), primary_key=True, comment="Resolved YouTube channel ID (UC...) or Twitter user ID")
+    
+    # Lookup
+    handle = Column(String(255), nullable=False, comment="Normalized identifier from the competitor URL (e.g. handle:fireship, id:UC..., or Twitter handle)")
+    
+    # Data
+    items = Column(JSONB, nullable=False, comment="Normalized video/tweet records")
+    fetched_at = Column(DateTime(timezone=True), nullable=False, comment="When items were fetched from the platform API")
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_competitor_snapshots_platform_handle", "platform", "handle"),
+    )
@@ -60,6 +60,11 @@ class CreatorProfileDB(Base):
     agent_context = Column(JSONB, server_default=text("'{}'::jsonb"), nullable=False, comment="Context Analyzer output")
     phase2_completed = Column(Boolean, server_default=text("false"), nullable=False, comment="Track Phase 2 completion")
     
+    # Background context analysis (see services/core/profile_analysis.py)
+    analysis_pending = Column(Boolean, server_default=text("false"), nullable=False, comment="Context analysis queued or running")
+    analysis_task_id = Column(String(255), nullable=True, comment="Celery task ID of the pending context analysis")
+    analysis_fingerprint = Column(String(64), nullable=True, comment="SHA-256 of the analyzer input of the latest requested analysis")
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -35,6 +35,8 @@ class CreatorProfile(BaseModel):
     recommended_frequency: Optional[str] = Field(None, description="Agent-calculated realistic posting frequency")
     agent_context: dict = Field(default_factory=dict, description="Context Analyzer output and campaign results")
     phase2_completed: bool = Field(default=False, description="Track Phase 2 completion status")
+    analysis_pending: bool = Field(default=False, description="Context analysis is queued or running")
+    analysis_task_id: Optional[str] = Field(None, description="Task to follow via GET /tasks/{task_id}/events while analysis is pending")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
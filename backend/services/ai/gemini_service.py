@@ -1,35 +1,150 @@
 """Gemini 3 Flash API wrapper service."""
+import asyncio
 import json
 import logging
 import os
 import time
-from pathlib import Path
-from typing import Any, Dict, Optional, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, NamedTuple, Sequence, Tuple, get_args, get_origin
+import httpx
 import requests
+from pydantic import BaseModel, Field, create_model
 # import google.generativeai as genai  # Commented for Pollinations testing
 
-from ...config import GEMINI_API_KEY, GEMINI_MODEL, POLLINATIONS_API_KEY
+from ...config import GEMINI_API_KEY, GEMINI_MODEL, POLLINATIONS_API_KEY, LLM_CACHE_ENABLED, LLM_STREAMING_ENABLED
 from ...models.agents.agent_outputs import (
     ContextAnalyzerOutput,
     StrategyAgentOutput,
     ForensicsAgentOutput,
     PlannerAgentOutput,
     ContentAgentOutput,
+    ContentBatchOutput,
     OutcomeAgentOutput,
 )
+from .json_stream import FieldCallback, IncrementalJSONParser, parse_json_response
+from .prompt_compaction import POLICIES, batch_policy, compact_json, record_prompt
+from .prompt_registry import PromptTemplateError, prompt_registry
+from .llm_client import get_llm_http_client
+from .response_cache import response_cache, make_cache_key, ttl_for
 
 logger = logging.getLogger(__name__)
 
 
-def _serialize_for_prompt(obj: Any) -> str:
-    """Serialize object to JSON string, handling datetime objects."""
-    def datetime_handler(x):
-        if isinstance(x, datetime):
-            return x.isoformat()
-        raise TypeError(f"Object of type {type(x)} is not JSON serializable")
-    
-    return json.dumps(obj, indent=2, default=datetime_handler)
+class LLMRequest(NamedTuple):
+    """A fully rendered agent prompt, ready to send to either the sync or async path."""
+    prompt: str
+    output_schema: type[Any]
+    system_instruction: Optional[str] = None
+    template: Optional[str] = None  # prompt template name (cache key + TTL)
+
+
+# Arguments each request builder passes when rendering its template
+# (checked against the templates' placeholders at startup)
+PROMPT_ARGUMENTS: Dict[str, frozenset] = {
+    "agent1_context.txt": frozenset({
+        "category", "target_audience", "platforms", "time_per_week", "youtube_url", "twitter_url",
+        "instagram_url", "linkedin_url", "tiktok_url", "facebook_url", "reddit_url", "competitor_urls",
+        "user_best_videos", "user_worst_videos", "user_best_tweets", "user_worst_tweets", "phase2_data",
+    }),
+    "agent2_strategy.txt": frozenset({
+        "goal", "goal_type", "duration_days", "niche", "content_style", "audience_type",
+        "strengths", "weaknesses", "current_metrics", "past_learnings",
+    }),
+    "agent3_forensics_youtube.txt": frozenset({"platform", "high_traction", "low_traction"}),
+    "agent3_forensics_twitter.txt": frozenset({"platform", "high_traction", "low_traction"}),
+    "agent4_planner.txt": frozenset({
+        "goal", "goal_type", "duration_days", "posting_frequency", "target_platforms",
+        "content_intensity", "strategy", "forensics_yt", "forensics_x", "past_learnings",
+    }),
+    "agent5_content.txt": frozenset({
+        "day_number", "day_plan", "creator_context", "content_intensity", "goal_type", "platforms",
+    }),
+    "agent5_content_batch.txt": frozenset({
+        "day_numbers", "duration_days", "day_plans", "creator_context", "content_intensity", "goal_type", "platforms",
+    }),
+    "agent6_outcome.txt": frozenset({"goal", "actual_metrics", "campaign_plan", "daily_execution"}),
+}
+
+
+def format_learnings(past_learnings: Optional[List] = None, include_context: bool = False) -> str:
+    """
+    Past learnings as prompt text.
+
+    Accepts learning dicts (learning_memory.retrieve_learnings) as well as
+    LearningMemory / OutcomeAgentOutput objects; suggestions come from
+    recommendations or next_campaign_suggestions, whichever is set.
+    """
+    if not past_learnings:
+        return "No previous campaign data available."
+
+    def field(learning, name, default=None):
+        if isinstance(learning, dict):
+            return learning.get(name, default)
+        return getattr(learning, name, default)
+
+    def joined(items) -> str:
+        return ", ".join(str(item) for item in items or []) or "None recorded"
+
+    blocks = []
+    for i, learning in enumerate(past_learnings):
+        lines = [f"Campaign {i+1}:"]
+        if include_context:
+            lines.append(f"- Goal Type: {field(learning, 'goal_type', 'Unknown')}")
+            lines.append(f"- Platform: {field(learning, 'platform', 'Unknown')}")
+            niche = field(learning, 'niche')
+            if niche:
+                lines.append(f"- Niche: {niche}")
+            result = field(learning, 'goal_achievement_summary') or field(learning, 'goal_vs_result')
+            lines.append(f"- Result: {result or 'Not recorded'}")
+        suggestions = field(learning, 'recommendations') or field(learning, 'next_campaign_suggestions')
+        lines.append(f"- What Worked: {joined(field(learning, 'what_worked'))}")
+        lines.append(f"- What Failed: {joined(field(learning, 'what_failed'))}")
+        lines.append(f"- Suggestions: {joined(suggestions)}")
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+@lru_cache(maxsize=None)
+def context_sections_schema(sections: Tuple[str, ...]) -> type[BaseModel]:
+    """ContextAnalyzerOutput restricted to the given sections (output schema of a partial re-analysis)."""
+    fields = {
+        name: (dict, Field(default_factory=dict, description=ContextAnalyzerOutput.model_fields[name].description))
+        for name in sections
+    }
+    return create_model("ContextAnalyzerSections", **fields)
+
+
+def render_prompt(name: str, **kwargs: Any) -> str:
+    """
+    Render an agent template with exactly the arguments declared in PROMPT_ARGUMENTS.
+
+    Keeps the declarations (checked against the templates at startup) in
+    step with what each request builder actually passes.
+
+    Raises:
+        PromptTemplateError: If the arguments differ from PROMPT_ARGUMENTS[name]
+    """
+    declared = PROMPT_ARGUMENTS.get(name)
+    if declared is None or kwargs.keys() != declared:
+        passed = frozenset(kwargs)
+        raise PromptTemplateError(
+            f"{name}: arguments don't match PROMPT_ARGUMENTS "
+            f"(undeclared {sorted(passed - (declared or frozenset()))}, "
+            f"not passed {sorted((declared or frozenset()) - passed)})"
+        )
+    return prompt_registry.render(name, **kwargs)
+
+
+def validate_prompts() -> None:
+    """Load all prompt templates and check them against PROMPT_ARGUMENTS (raises PromptTemplateError)."""
+    prompt_registry.validate(PROMPT_ARGUMENTS)
+
+
+# Pollinations retry policy: 3 attempts with exponential backoff (2s, 4s, 8s)
+POLLINATIONS_MAX_RETRIES = 3
+POLLINATIONS_BACKOFF_DELAYS = [2, 4, 8]  # seconds
+POLLINATIONS_RETRYABLE_STATUSES = [530, 503, 502, 504]  # Cloudflare Tunnel / transient errors
+POLLINATIONS_TEXT_MODEL = "mistral"
 
 
 class GeminiService:
@@ -40,95 +155,131 @@ class GeminiService:
         # ⚠️ TESTING MODE: Use Pollinations API instead of Gemini
         self.use_pollinations = True
         self.pollinations_url = "https://gen.pollinations.ai/v1/chat/completions"
-        
-        # Cache for loaded prompts
-        self._prompt_cache: Dict[str, str] = {}
+    
+    @property
+    def model_name(self) -> str:
+        """Identifier of the backing model (part of the response cache key)."""
+        if self.use_pollinations:
+            return f"pollinations/{POLLINATIONS_TEXT_MODEL}"
+        return GEMINI_MODEL
     
     def load_prompt(self, filename: str) -> str:
-        """Load prompt from txt file in prompts/ directory.
+        """Raw text of a prompt template from prompts/agents/.
         
         Args:
             filename: Name of the prompt file (e.g., 'agent1_context.txt')
         
         Returns:
-            Prompt string from file
+            Prompt string from file (served by the process-wide prompt_registry)
             
         Raises:
             FileNotFoundError: If prompt file doesn't exist
         """
-        # Check cache first
-        if filename in self._prompt_cache:
-            return self._prompt_cache[filename]
-        
-        # Build path to prompts directory (now at backend/prompts/agents/)
-        current_dir = Path(__file__).parent.parent.parent
-        prompts_dir = current_dir / "prompts" / "agents"
-        
-        # Handle platform-specific prompts
-        if "forensics" in filename and ("youtube" in filename or "twitter" in filename):
-            prompts_dir = prompts_dir / "platform_specific"
-        
-        prompt_file = prompts_dir / filename
-        
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
-        
-        # Load and cache
-        with open(prompt_file, 'r', encoding='utf-8') as f:
-            prompt = f.read()
-        
-        self._prompt_cache[filename] = prompt
-        return prompt
+        return prompt_registry.get(filename).text
     
-    def _generate_json_pollinations(self, prompt: str, output_schema: type[Any], system_instruction: Optional[str] = None) -> Any:
-        """Use Pollinations text API with retry logic for Cloudflare Tunnel errors."""
-        # Build full prompt
+    def _build_pollinations_prompt(self, prompt: str, output_schema: type[Any], system_instruction: Optional[str] = None) -> str:
+        """Build the full Pollinations prompt with system instruction and schema hint."""
         full_prompt = prompt
         if system_instruction:
             full_prompt = f"{system_instruction}\n\n{prompt}"
         
-        # Build detailed schema with type info
+        schema_example = self._schema_example(output_schema)
+        schema_instruction = f"\n\nIMPORTANT: Return ONLY valid JSON matching this structure: {schema_example}. No markdown, no extra text, just JSON."
+        return full_prompt + schema_instruction
+    
+    @classmethod
+    def _schema_example(cls, output_schema: type[Any]) -> str:
+        """Compact JSON shape of a Pydantic model (lists of models are expanded one level)."""
         schema_fields = []
         for field_name, field_info in output_schema.model_fields.items():
             field_type = str(field_info.annotation)
+            item_type = get_args(field_info.annotation)[0] if get_origin(field_info.annotation) is list else None
             # Simplify type hints for clarity
-            if 'list[str]' in field_type or 'List[str]' in field_type:
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+                schema_fields.append(f'"{field_name}": [{cls._schema_example(item_type)}, ...]')
+            elif 'list[str]' in field_type or 'List[str]' in field_type:
                 schema_fields.append(f'"{field_name}": ["string1", "string2", ...]')
             elif 'dict' in field_type or 'Dict' in field_type:
                 schema_fields.append(f'"{field_name}": {{"key": "value"}}')
             else:
                 schema_fields.append(f'"{field_name}": "value"')
+        return "{" + ", ".join(schema_fields) + "}"
+    
+    def _pollinations_payload(self, full_prompt: str) -> tuple[Dict[str, Any], Dict[str, str]]:
+        """Request body and headers for the OpenAI-compatible Pollinations endpoint."""
+        headers = {}
+        if POLLINATIONS_API_KEY:
+            headers["Authorization"] = f"Bearer {POLLINATIONS_API_KEY}"
+        body = {
+            "messages": [{"role": "user", "content": full_prompt}],
+            "model": POLLINATIONS_TEXT_MODEL
+        }
+        return body, headers
+    
+    @staticmethod
+    def _parse_pollinations_response(
+        response_data: Dict[str, Any],
+        output_schema: type[Any],
+        on_field: Optional[FieldCallback] = None
+    ) -> Any:
+        """Extract choices[0].message.content and validate it against output_schema."""
+        if "choices" not in response_data or len(response_data["choices"]) == 0:
+            raise ValueError(f"Invalid response format: missing 'choices' field")
         
-        schema_example = "{" + ", ".join(schema_fields) + "}"
-        schema_instruction = f"\n\nIMPORTANT: Return ONLY valid JSON matching this structure: {schema_example}. No markdown, no extra text, just JSON."
-        full_prompt += schema_instruction
+        # Markdown fences and preamble are skipped by the parser
+        return parse_json_response(response_data["choices"][0]["message"]["content"], output_schema, on_field)
+    
+    async def _stream_pollinations_completion(
+        self,
+        response: httpx.Response,
+        output_schema: type[Any],
+        on_field: Optional[FieldCallback] = None
+    ) -> Any:
+        """
+        Parse a streamed (SSE) completion as it arrives.
         
-        # Retry logic: 3 attempts with exponential backoff (2s, 4s, 8s)
-        max_retries = 3
-        backoff_delays = [2, 4, 8]  # seconds
+        Fields are validated as they complete, so a response that has already
+        gone wrong is abandoned without waiting for the rest of it.
+        """
+        if "text/event-stream" not in response.headers.get("content-type", ""):
+            # Endpoint ignored "stream": parse the whole body the old way
+            return self._parse_pollinations_response(json.loads(await response.aread()), output_schema, on_field)
+        
+        parser = IncrementalJSONParser(output_schema, on_field)
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            chunk = json.loads(data)
+            choices = chunk.get("choices") or []
+            delta = choices[0].get("delta", {}).get("content") if choices else None
+            if delta:
+                parser.feed(delta)
+            if parser.complete:
+                break  # Anything after the root object is ignored
+        return parser.finish()
+    
+    def _generate_json_pollinations(self, prompt: str, output_schema: type[Any], system_instruction: Optional[str] = None) -> Any:
+        """Use Pollinations text API with retry logic for Cloudflare Tunnel errors (blocking)."""
+        full_prompt = self._build_pollinations_prompt(prompt, output_schema, system_instruction)
+        body, headers = self._pollinations_payload(full_prompt)
+        max_retries = POLLINATIONS_MAX_RETRIES
         
         for attempt in range(max_retries):
             try:
-                # Prepare headers with API key
-                headers = {}
-                if POLLINATIONS_API_KEY:
-                    headers["Authorization"] = f"Bearer {POLLINATIONS_API_KEY}"
-                
                 # Call Pollinations text API (using mistral model with OpenAI-compatible endpoint)
                 response = requests.post(
                     self.pollinations_url,
-                    json={
-                        "messages": [{"role": "user", "content": full_prompt}],
-                        "model": "mistral"
-                    },
+                    json=body,
                     headers=headers,
                     timeout=30
                 )
                 
                 if response.status_code != 200:
-                    # Check for Cloudflare Tunnel errors (530, 503) or other transient errors
-                    if response.status_code in [530, 503, 502, 504] and attempt < max_retries - 1:
-                        delay = backoff_delays[attempt]
+                    if response.status_code in POLLINATIONS_RETRYABLE_STATUSES and attempt < max_retries - 1:
+                        delay = POLLINATIONS_BACKOFF_DELAYS[attempt]
                         logger.warning(
                             f"Pollinations API returned status {response.status_code} (attempt {attempt + 1}/{max_retries}). "
                             f"Retrying in {delay}s... Error: {response.text[:200]}"
@@ -139,38 +290,14 @@ class GeminiService:
                     # Final failure or non-retryable error
                     raise ValueError(f"Pollinations API error: {response.status_code} - {response.text[:500]}")
                 
-                json_text = response.text.strip()
-                # Parse OpenAI-compatible response format
-                response_data = response.json()
-                
-                # Extract content from choices[0].message.content
-                if "choices" not in response_data or len(response_data["choices"]) == 0:
-                    raise ValueError(f"Invalid response format: missing 'choices' field")
-                
-                json_text = response_data["choices"][0]["message"]["content"].strip()
-                
-                # Clean markdown code blocks
-                if json_text.startswith("```json"):
-                    json_text = json_text[7:].strip()
-                elif json_text.startswith("```"):
-                    json_text = json_text[3:].strip()
-                if json_text.endswith("```"):
-                    json_text = json_text[:-3].strip()
-                
-                # Extract JSON object_text:
-                    start = json_text.index('{')
-                    end = json_text.rindex('}') + 1
-                    json_text = json_text[start:end]
-                
-                # Parse and validate
-                data = json.loads(json_text)
+                result = self._parse_pollinations_response(response.json(), output_schema)
                 logger.info(f"Pollinations API call successful (attempt {attempt + 1}/{max_retries})")
-                return output_schema(**data)
+                return result
                 
             except (requests.exceptions.RequestException, requests.exceptions.Timeout) as e:
                 # Network errors - retry
                 if attempt < max_retries - 1:
-                    delay = backoff_delays[attempt]
+                    delay = POLLINATIONS_BACKOFF_DELAYS[attempt]
                     logger.warning(
                         f"Pollinations API network error (attempt {attempt + 1}/{max_retries}): {e}. "
                         f"Retrying in {delay}s..."
@@ -189,15 +316,158 @@ class GeminiService:
         # Should not reach here, but just in case
         raise ValueError(f"Pollinations API call failed after {max_retries} attempts")
     
+    async def _generate_json_pollinations_async(
+        self,
+        prompt: str,
+        output_schema: type[Any],
+        system_instruction: Optional[str] = None,
+        on_field: Optional[FieldCallback] = None
+    ) -> Any:
+        """
+        Non-blocking Pollinations call on the shared pooled client, with asyncio.sleep backoff.
+        
+        With LLM_STREAMING_ENABLED the completion is streamed and parsed
+        incrementally; on_field receives each top-level field as it completes.
+        """
+        full_prompt = self._build_pollinations_prompt(prompt, output_schema, system_instruction)
+        body, headers = self._pollinations_payload(full_prompt)
+        if LLM_STREAMING_ENABLED:
+            body["stream"] = True
+        client = get_llm_http_client()
+        max_retries = POLLINATIONS_MAX_RETRIES
+        
+        for attempt in range(max_retries):
+            try:
+                async with client.stream("POST", self.pollinations_url, json=body, headers=headers) as response:
+                    if response.status_code != 200:
+                        error_text = (await response.aread()).decode("utf-8", errors="replace")
+                        if response.status_code in POLLINATIONS_RETRYABLE_STATUSES and attempt < max_retries - 1:
+                            delay = POLLINATIONS_BACKOFF_DELAYS[attempt]
+                            logger.warning(
+                                f"Pollinations API returned status {response.status_code} (attempt {attempt + 1}/{max_retries}). "
+                                f"Retrying in {delay}s... Error: {error_text[:200]}"
+                            )
+                            await asyncio.sleep(delay)
+                            continue
+                        
+                        raise ValueError(f"Pollinations API error: {response.status_code} - {error_text[:500]}")
+                    
+                    result = await self._stream_pollinations_completion(response, output_schema, on_field)
+                logger.info(f"Pollinations API call successful (attempt {attempt + 1}/{max_retries})")
+                return result
+                
+            except httpx.TransportError as e:
+                # Network errors (connect/read timeouts, resets) - retry
+                if attempt < max_retries - 1:
+                    delay = POLLINATIONS_BACKOFF_DELAYS[attempt]
+                    logger.warning(
+                        f"Pollinations API network error (attempt {attempt + 1}/{max_retries}): {e}. "
+                        f"Retrying in {delay}s..."
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(f"Pollinations API call failed after {max_retries} attempts: {e}", exc_info=True)
+                raise ValueError(f"Pollinations API call failed after {max_retries} attempts: {str(e)}")
+            
+            except (json.JSONDecodeError, ValueError, KeyError) as e:
+                logger.error(f"Pollinations API response parsing failed: {e}", exc_info=True)
+                raise ValueError(f"Pollinations API response parsing failed: {str(e)}")
+        
+        raise ValueError(f"Pollinations API call failed after {max_retries} attempts")
+    
+    def _cache_lookup_key(
+        self,
+        prompt: str,
+        output_schema: type[Any],
+        system_instruction: Optional[str],
+        template: Optional[str]
+    ) -> Optional[str]:
+        """Response cache key for this request, or None when caching is off."""
+        if not LLM_CACHE_ENABLED:
+            return None
+        # Template version: editing a prompt file never serves answers cached for the old text
+        template_tag = prompt_registry.cache_tag(template) if template else None
+        return make_cache_key(template_tag, prompt, system_instruction, output_schema, self.model_name)
+    
+    async def generate_json_async(
+        self,
+        prompt: str,
+        output_schema: type[Any],
+        system_instruction: Optional[str] = None,
+        template: Optional[str] = None,
+        on_field: Optional[FieldCallback] = None
+    ) -> Any:
+        """
+        Awaitable variant of generate_json.
+        
+        The Pollinations path runs natively on the event loop and streams the
+        completion; on_field(name, value) is called for each field as soon as
+        it has been parsed and validated (not on cache hits). The Gemini SDK
+        path is blocking, so it is pushed to a worker thread.
+        """
+        record_prompt(template, prompt, system_instruction)
+        cache_key = self._cache_lookup_key(prompt, output_schema, system_instruction, template)
+        ttl = ttl_for(template)
+        if cache_key:
+            cached = await response_cache.get_async(cache_key, output_schema, ttl)
+            if cached is not None:
+                logger.info(f"LLM cache hit ({template or 'untemplated'})")
+                return cached
+        
+        if self.use_pollinations:
+            result = await self._generate_json_pollinations_async(prompt, output_schema, system_instruction, on_field)
+        else:
+            result = await asyncio.to_thread(self._generate_json_uncached, prompt, output_schema, system_instruction)
+        
+        if cache_key:
+            await response_cache.set_async(cache_key, result, ttl)
+        return result
+    
     def generate_json(
         self,
         prompt: str,
         output_schema: type[Any],
-        system_instruction: Optional[str] = None
+        system_instruction: Optional[str] = None,
+        template: Optional[str] = None
     ) -> Any:
         """
         Generate structured JSON output from Gemini or Pollinations.
         
+        Byte-identical requests are served from the response cache.
+        
+        Args:
+            prompt: The input prompt
+            output_schema: Pydantic model class for output structure
+            system_instruction: Optional system instruction
+            template: Prompt template name; part of the cache key and selects the TTL
+        
+        Returns:
+            Parsed Pydantic model instance
+        """
+        record_prompt(template, prompt, system_instruction)
+        cache_key = self._cache_lookup_key(prompt, output_schema, system_instruction, template)
+        ttl = ttl_for(template)
+        if cache_key:
+            cached = response_cache.get(cache_key, output_schema, ttl)
+            if cached is not None:
+                logger.info(f"LLM cache hit ({template or 'untemplated'})")
+                return cached
+        
+        result = self._generate_json_uncached(prompt, output_schema, system_instruction)
+        
+        if cache_key:
+            response_cache.set(cache_key, result, ttl)
+        return result
+    
+    def _generate_json_uncached(
+        self,
+        prompt: str,
+        output_schema: type[Any],
+        system_instruction: Optional[str] = None
+    ) -> Any:
+        """
+        Call Gemini or Pollinations directly, bypassing the response cache.
+        
         Args:
             prompt: The input prompt
             output_schema: Pydantic model class for output structure
@@ -238,79 +508,17 @@ class GeminiService:
             if not response or not hasattr(response, 'text') or not response.text:
                 raise ValueError("Empty or invalid response from Gemini")
             
-            # Parse JSON response with robust extraction
-            json_text = response.text.strip()
-            
-            if not json_text:
-                raise ValueError("Empty text in Gemini response")
-            
-            # Remove markdown code blocks (multiple formats)
-            if json_text.startswith("```json"):
-                json_text = json_text[7:].strip()
-            elif json_text.startswith("```"):
-                json_text = json_text[3:].strip()
-            
-            if json_text.endswith("```"):
-                json_text = json_text[:-3].strip()
-            
-            # DEBUG: Log before extraction
-            print(f"📄 After markdown removal (first 200): {json_text[:200]}")
-            
-            # Extract JSON object with proper brace matching
-            if '{' in json_text:
-                start = json_text.index('{')
-                brace_count = 0
-                end = start
-                
-                for i in range(start, len(json_text)):
-                    if json_text[i] == '{':
-                        brace_count += 1
-                    elif json_text[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            end = i + 1
-                            break
-                
-                if end > start:
-                    print(f"🔍 Extracting JSON from position {start} to {end}")
-                    json_text = json_text[start:end]
-                else:
-                    print(f"⚠️ Warning: Could not find matching closing brace")
-            
-            # Parse JSON
-            try:
-                print(f"🔍 About to parse JSON. First 300 chars: {json_text[:300]}")
-                print(f"🔍 Last 100 chars: {json_text[-100:]}")
-                json_data = json.loads(json_text)
-            except json.JSONDecodeError as e:
-                print(f"❌ JSON parse error: {e}")
-                print(f"❌ Error position: line {e.lineno} col {e.colno}")
-                print(f"❌ Full extracted text ({len(json_text)} chars):\n{json_text}")
-                print(f"❌ Original response text (first 500 chars):\n{response.text[:500]}")
-                
-                # Try to clean common JSON issues as fallback
-                try:
-                    # Remove trailing commas before closing braces/brackets
-                    cleaned = json_text.replace(',}', '}').replace(',]', ']')
-                    # Remove control characters
-                    cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in '\n\r\t')
-                    print(f"🔄 Attempting to parse cleaned JSON...")
-                    json_data = json.loads(cleaned)
-                    print(f"✅ Successfully parsed after cleaning")
-                except json.JSONDecodeError as e2:
-                    print(f"❌ Cleaning also failed: {e2}")
-                    raise ValueError(f"Failed to parse Gemini JSON (line {e.lineno}, col {e.colno}): {str(e)}")
-            
-            # Parse into Pydantic model
-            return output_schema.model_validate(json_data)
+            # Tolerant parse: skips markdown fences/preamble, fixes trailing commas,
+            # validates against output_schema
+            return parse_json_response(response.text, output_schema)
             
         except json.JSONDecodeError as e:
             raise ValueError(f"Gemini returned invalid JSON: {str(e)}")
         except Exception as e:
             raise ValueError(f"Gemini API call failed: {str(e)}")
     
-    def analyze_context(self, creator_data: Dict[str, Any]) -> ContextAnalyzerOutput:
-        """Agent 1: Deep creator context analysis."""
+    def _context_request(self, creator_data: Dict[str, Any]) -> LLMRequest:
+        """Build the Agent 1 (context analysis) request."""
         
         # Build Phase 2 data string
         phase2_parts = []
@@ -330,7 +538,7 @@ class GeminiService:
             phase2_parts.append(f"\nCONTENT TYPES THEY AVOID: {creator_data['content_avoids']}")
         
         if creator_data.get('current_metrics'):
-            phase2_parts.append(f"\n\nCURRENT METRICS: {json.dumps(creator_data['current_metrics'], indent=2)}")
+            phase2_parts.append(f"\n\nCURRENT METRICS: {compact_json(creator_data['current_metrics'], 'metrics')}")
         if creator_data.get('audience_demographics'):
             phase2_parts.append(f"\nAUDIENCE DEMOGRAPHICS: {creator_data['audience_demographics']}")
         
@@ -342,7 +550,7 @@ class GeminiService:
             phase2_parts.append(f"\nTEAM: {creator_data['team_size']}")
         
         if creator_data.get('past_attempts'):
-            phase2_parts.append(f"\n\nPAST GROWTH ATTEMPTS: {json.dumps(creator_data['past_attempts'], indent=2)}")
+            phase2_parts.append(f"\n\nPAST GROWTH ATTEMPTS: {compact_json(creator_data['past_attempts'], 'creator_context')}")
         if creator_data.get('what_worked_before'):
             phase2_parts.append(f"\nWHAT WORKED BEFORE: {creator_data['what_worked_before']}")
         
@@ -353,27 +561,25 @@ class GeminiService:
         
         phase2_data = ''.join(phase2_parts) if phase2_parts else "No Phase 2 data provided"
         
-        # Load prompt template and format
-        prompt_template = self.load_prompt('agent1_context.txt')
-        
         # Format user's auto-classified content
         user_best_videos = "No videos yet"
         if creator_data.get('user_best_videos'):
-            user_best_videos = json.dumps(creator_data['user_best_videos'], indent=2)
+            user_best_videos = compact_json(creator_data['user_best_videos'], 'creator_videos')
         
         user_worst_videos = "No videos yet"
         if creator_data.get('user_worst_videos'):
-            user_worst_videos = json.dumps(creator_data['user_worst_videos'], indent=2)
+            user_worst_videos = compact_json(creator_data['user_worst_videos'], 'creator_videos')
         
         user_best_tweets = "No tweets yet"
         if creator_data.get('user_best_tweets'):
-            user_best_tweets = json.dumps(creator_data['user_best_tweets'], indent=2)
+            user_best_tweets = compact_json(creator_data['user_best_tweets'], 'creator_tweets')
         
         user_worst_tweets = "No tweets yet"
         if creator_data.get('user_worst_tweets'):
-            user_worst_tweets = json.dumps(creator_data['user_worst_tweets'], indent=2)
+            user_worst_tweets = compact_json(creator_data['user_worst_tweets'], 'creator_tweets')
         
-        prompt = prompt_template.format(
+        prompt = render_prompt(
+            'agent1_context.txt',
             category=creator_data.get('category', 'Not specified'),
             target_audience=creator_data.get('target_audience', 'Not specified'),
             platforms=', '.join(creator_data.get('platforms', [])),
@@ -385,7 +591,7 @@ class GeminiService:
             tiktok_url=creator_data.get('tiktok_url', 'Not provided'),
             facebook_url=creator_data.get('facebook_url', 'Not provided'),
             reddit_url=creator_data.get('reddit_url', 'Not provided'),
-            competitor_urls=json.dumps(creator_data.get('competitor_urls', []), indent=2),
+            competitor_urls=compact_json(creator_data.get('competitor_urls', [])),
             user_best_videos=user_best_videos,
             user_worst_videos=user_worst_videos,
             user_best_tweets=user_best_tweets,
@@ -393,16 +599,60 @@ class GeminiService:
             phase2_data=phase2_data
         )
         
-        return self.generate_json(
+        return LLMRequest(
             prompt,
             ContextAnalyzerOutput,
-            system_instruction="You are an expert creator strategist building persistent creator memory for personalized campaigns."
+            system_instruction="You are an expert creator strategist building persistent creator memory for personalized campaigns.",
+            template="agent1_context.txt"
         )
     
-    def generate_strategy(self, goal: str, creator_context: Dict[str, Any], duration_days: int = 3, goal_type: str = "growth", past_learnings: Optional[List] = None) -> StrategyAgentOutput:
-        """Agent 2: Generate campaign strategy with reality check."""
-        prompt_template = self.load_prompt('agent2_strategy.txt')
+    def analyze_context(self, creator_data: Dict[str, Any]) -> ContextAnalyzerOutput:
+        """Agent 1: Deep creator context analysis."""
+        return self.generate_json(*self._context_request(creator_data))
+    
+    async def analyze_context_async(self, creator_data: Dict[str, Any]) -> ContextAnalyzerOutput:
+        """Agent 1: Deep creator context analysis (non-blocking)."""
+        return await self.generate_json_async(*self._context_request(creator_data))
+    
+    def _context_sections_request(
+        self,
+        creator_data: Dict[str, Any],
+        sections: Sequence[str],
+        known_sections: Dict[str, Any]
+    ) -> LLMRequest:
+        """Build an Agent 1 request that regenerates only some ContextAnalyzerOutput sections."""
+        request = self._context_request(creator_data)
+        prompt = (
+            f"{request.prompt}\n\n"
+            f"=== INCREMENTAL UPDATE ===\n"
+            f"Only the inputs behind these components changed: {', '.join(sections)}.\n"
+            f"Regenerate ONLY those components, following the rules above. "
+            f"The other components are unchanged; stay consistent with them:\n"
+            f"{compact_json(known_sections, 'creator_context')}"
+        )
+        return request._replace(prompt=prompt, output_schema=context_sections_schema(tuple(sections)))
+    
+    async def analyze_context_sections_async(
+        self,
+        creator_data: Dict[str, Any],
+        sections: Sequence[str],
+        known_sections: Dict[str, Any]
+    ) -> BaseModel:
+        """
+        Agent 1: Regenerate only some context sections (non-blocking).
         
+        Args:
+            creator_data: Full analyzer input (same as analyze_context)
+            sections: ContextAnalyzerOutput fields to regenerate
+            known_sections: Current values of the other sections (kept for consistency)
+        
+        Returns:
+            Model with one dict field per requested section
+        """
+        return await self.generate_json_async(*self._context_sections_request(creator_data, sections, known_sections))
+    
+    def _strategy_request(self, goal: str, creator_context: Dict[str, Any], duration_days: int = 3, goal_type: str = "growth", past_learnings: Optional[List] = None) -> LLMRequest:
+        """Build the Agent 2 (strategy) request."""
         # Extract from creator_identity if nested
         identity = creator_context.get('creator_identity', {})
         content_dna = creator_context.get('content_dna', {})
@@ -416,21 +666,10 @@ class GeminiService:
                 return "\n- " + "\n- ".join(str(item) for item in items)
             return str(items)
         
-        # Format past learnings
-        learnings_text = "No previous campaign data available."
-        if past_learnings:
-            learnings_text = "\n\n".join([
-                f"Campaign {i+1}:\n"
-                f"- Goal Type: {l.goal_type}\n"
-                f"- Platform: {l.platform}\n"
-                f"- Result: {l.goal_vs_result}\n"
-                f"- What Worked: {', '.join(l.what_worked)}\n"
-                f"- What Failed: {', '.join(l.what_failed)}\n"
-                f"- Suggestions: {', '.join(l.next_campaign_suggestions)}"
-                for i, l in enumerate(past_learnings)
-            ])
-        
-        prompt = prompt_template.format(
+        learnings_text = format_learnings(past_learnings, include_context=True)
+        
+        prompt = render_prompt(
+            'agent2_strategy.txt',
             goal=goal,
             goal_type=goal_type,
             duration_days=duration_days,  # NEW
@@ -442,34 +681,84 @@ class GeminiService:
             current_metrics=growth_context.get('current_metrics', 'Not available'),  # NEW
             past_learnings=learnings_text
         )
-        return self.generate_json(
+        return LLMRequest(
             prompt,
             StrategyAgentOutput,
-            system_instruction="You are a growth strategy expert. Create testable hypotheses based on real data. Be brutally honest about goal realism."  # UPDATED
+            system_instruction="You are a growth strategy expert. Create testable hypotheses based on real data. Be brutally honest about goal realism.",  # UPDATED
+            template="agent2_strategy.txt"
         )
     
-    def analyze_forensics(
+    def generate_strategy(self, goal: str, creator_context: Dict[str, Any], duration_days: int = 3, goal_type: str = "growth", past_learnings: Optional[List] = None) -> StrategyAgentOutput:
+        """Agent 2: Generate campaign strategy with reality check."""
+        return self.generate_json(*self._strategy_request(goal, creator_context, duration_days, goal_type, past_learnings))
+    
+    async def generate_strategy_async(self, goal: str, creator_context: Dict[str, Any], duration_days: int = 3, goal_type: str = "growth", past_learnings: Optional[List] = None) -> StrategyAgentOutput:
+        """Agent 2: Generate campaign strategy (non-blocking)."""
+        return await self.generate_json_async(*self._strategy_request(goal, creator_context, duration_days, goal_type, past_learnings))
+    
+    def _forensics_request(
         self,
         platform: str,
         high_traction: list[Dict[str, Any]],
         low_traction: list[Dict[str, Any]]
-    ) -> ForensicsAgentOutput:
-        """Agent 3: Compare high vs low traction content."""
-        prompt_template = self.load_prompt('agent3_forensics_youtube.txt')
-        prompt = prompt_template.format(
+    ) -> LLMRequest:
+        """Build the Agent 3 (YouTube forensics) request."""
+        prompt = render_prompt(
+            'agent3_forensics_youtube.txt',
             platform=platform,
-            high_traction=json.dumps(high_traction, indent=2),
-            low_traction=json.dumps(low_traction, indent=2)
+            high_traction=compact_json(high_traction, 'videos'),
+            low_traction=compact_json(low_traction, 'videos')
         )
-        result = self.generate_json(
+        return LLMRequest(
             prompt,
             ForensicsAgentOutput,
-            system_instruction="You are a content performance analyst. Identify clear patterns from comparative data."
+            system_instruction="You are a content performance analyst. Identify clear patterns from comparative data.",
+            template="agent3_forensics_youtube.txt"
         )
+    
+    def analyze_forensics(
+        self,
+        platform: str,
+        high_traction: list[Dict[str, Any]],
+        low_traction: list[Dict[str, Any]]
+    ) -> ForensicsAgentOutput:
+        """Agent 3: Compare high vs low traction content."""
+        result = self.generate_json(*self._forensics_request(platform, high_traction, low_traction))
         # Ensure platform field is set
         result.platform = platform
         return result
     
+    async def analyze_forensics_async(
+        self,
+        platform: str,
+        high_traction: list[Dict[str, Any]],
+        low_traction: list[Dict[str, Any]]
+    ) -> ForensicsAgentOutput:
+        """Agent 3: Compare high vs low traction content (non-blocking)."""
+        result = await self.generate_json_async(*self._forensics_request(platform, high_traction, low_traction))
+        result.platform = platform
+        return result
+    
+    def _twitter_request(
+        self,
+        platform: str,
+        high_traction: list[Dict[str, Any]],
+        low_traction: list[Dict[str, Any]]
+    ) -> LLMRequest:
+        """Build the Agent 3 (Twitter/X forensics) request."""
+        prompt = render_prompt(
+            'agent3_forensics_twitter.txt',
+            platform=platform,
+            high_traction=compact_json(high_traction, 'tweets'),
+            low_traction=compact_json(low_traction, 'tweets')
+        )
+        return LLMRequest(
+            prompt,
+            ForensicsAgentOutput,
+            system_instruction="You are a Twitter/X content analyst. Identify engagement patterns and content strategies.",
+            template="agent3_forensics_twitter.txt"
+        )
+    
     def analyze_twitter(
         self,
         platform: str,
@@ -486,22 +775,23 @@ class GeminiService:
         Returns:
             ForensicsAgentOutput with platform='twitter'
         """
-        prompt_template = self.load_prompt('agent3_forensics_twitter.txt')
-        prompt = prompt_template.format(
-            platform=platform,
-            high_traction=json.dumps(high_traction, indent=2),
-            low_traction=json.dumps(low_traction, indent=2)
-        )
-        result = self.generate_json(
-            prompt,
-            ForensicsAgentOutput,
-            system_instruction="You are a Twitter/X content analyst. Identify engagement patterns and content strategies."
-        )
+        result = self.generate_json(*self._twitter_request(platform, high_traction, low_traction))
         # Ensure platform field is set
         result.platform = "twitter"
         return result
     
-    def create_plan(
+    async def analyze_twitter_async(
+        self,
+        platform: str,
+        high_traction: list[Dict[str, Any]],
+        low_traction: list[Dict[str, Any]]
+    ) -> ForensicsAgentOutput:
+        """Agent 3: Analyze Twitter/X content performance (non-blocking)."""
+        result = await self.generate_json_async(*self._twitter_request(platform, high_traction, low_traction))
+        result.platform = "twitter"
+        return result
+    
+    def _plan_request(
         self,
         goal: Any,  # CampaignGoal
         strategy: Dict[str, Any],
@@ -510,80 +800,199 @@ class GeminiService:
         content_intensity: str = "moderate",
         goal_type: str = "growth",
         past_learnings: Optional[List] = None
-    ) -> PlannerAgentOutput:
-        """Agent 4: Create N-day campaign plan."""
-        prompt_template = self.load_prompt('agent4_planner.txt')
-        
-        # Format past learnings
-        learnings_text = "No previous campaign data available."
-        if past_learnings:
-            learnings_text = "\n\n".join([
-                f"Campaign {i+1}:\n"
-                f"- What Worked: {', '.join(l.what_worked)}\n"
-                f"- What Failed: {', '.join(l.what_failed)}\n"
-                f"- Suggestions: {', '.join(l.next_campaign_suggestions)}"
-                for i, l in enumerate(past_learnings)
-            ])
-        
-        prompt = prompt_template.format(
-            goal=json.dumps(goal.model_dump() if hasattr(goal, 'model_dump') else goal, indent=2),
+    ) -> LLMRequest:
+        """Build the Agent 4 (planner) request."""
+        learnings_text = format_learnings(past_learnings)
+        
+        prompt = render_prompt(
+            'agent4_planner.txt',
+            goal=compact_json(goal, 'goal'),
             goal_type=goal_type,
             duration_days=goal.duration_days if hasattr(goal, 'duration_days') else 3,
             posting_frequency=goal.posting_frequency if hasattr(goal, 'posting_frequency') else "daily",
             target_platforms=goal.platform if hasattr(goal, 'platform') else "YouTube",
             content_intensity=content_intensity,
-            strategy=json.dumps(strategy, indent=2),
-            forensics_yt=json.dumps(forensics_yt or {}, indent=2),
-            forensics_x=json.dumps(forensics_x or {}, indent=2),
+            strategy=compact_json(strategy, 'strategy'),
+            forensics_yt=compact_json(forensics_yt or {}, 'forensics'),
+            forensics_x=compact_json(forensics_x or {}, 'forensics'),
             past_learnings=learnings_text
         )
-        return self.generate_json(
+        return LLMRequest(
             prompt,
             PlannerAgentOutput,
-            system_instruction="You are a campaign planner. Create specific, daily action plans with proper platform cadence."
+            system_instruction="You are a campaign planner. Create specific, daily action plans with proper platform cadence.",
+            template="agent4_planner.txt"
         )
     
-    def generate_content(
+    def create_plan(
+        self,
+        goal: Any,  # CampaignGoal
+        strategy: Dict[str, Any],
+        forensics_yt: Optional[Dict[str, Any]] = None,
+        forensics_x: Optional[Dict[str, Any]] = None,
+        content_intensity: str = "moderate",
+        goal_type: str = "growth",
+        past_learnings: Optional[List] = None
+    ) -> PlannerAgentOutput:
+        """Agent 4: Create N-day campaign plan."""
+        return self.generate_json(*self._plan_request(
+            goal, strategy, forensics_yt, forensics_x, content_intensity, goal_type, past_learnings
+        ))
+    
+    async def create_plan_async(
+        self,
+        goal: Any,  # CampaignGoal
+        strategy: Dict[str, Any],
+        forensics_yt: Optional[Dict[str, Any]] = None,
+        forensics_x: Optional[Dict[str, Any]] = None,
+        content_intensity: str = "moderate",
+        goal_type: str = "growth",
+        past_learnings: Optional[List] = None
+    ) -> PlannerAgentOutput:
+        """Agent 4: Create N-day campaign plan (non-blocking)."""
+        return await self.generate_json_async(*self._plan_request(
+            goal, strategy, forensics_yt, forensics_x, content_intensity, goal_type, past_learnings
+        ))
+    
+    def _content_request(
         self,
         day_plan: Dict[str, Any],
         creator_context: Dict[str, Any],
         day_number: int,
         content_intensity: str = "moderate",
-        goal_type: str = "growth"
-    ) -> ContentAgentOutput:
-        """Agent 5: Generate daily content."""
-        prompt_template = self.load_prompt('agent5_content.txt')
-        prompt = prompt_template.format(
+        goal_type: str = "growth",
+        platforms: Optional[Sequence[str]] = None
+    ) -> LLMRequest:
+        """Build the Agent 5 (daily content) request."""
+        prompt = render_prompt(
+            'agent5_content.txt',
             day_number=day_number,
-            day_plan=_serialize_for_prompt(day_plan),
-            creator_context=_serialize_for_prompt(creator_context),
+            day_plan=compact_json(day_plan, 'day_plan'),
+            creator_context=compact_json(creator_context, 'creator_context'),
             content_intensity=content_intensity,
-            goal_type=goal_type
+            goal_type=goal_type,
+            platforms=", ".join(platforms or ["youtube"])
         )
-        return self.generate_json(
+        return LLMRequest(
             prompt,
             ContentAgentOutput,
-            system_instruction="You are a content creator assistant. Generate authentic, platform-optimized content with clear reasoning."
+            system_instruction="You are a content creator assistant. Generate authentic, platform-optimized content with clear reasoning.",
+            template="agent5_content.txt"
         )
     
-    def analyze_outcome(
+    def generate_content(
+        self,
+        day_plan: Dict[str, Any],
+        creator_context: Dict[str, Any],
+        day_number: int,
+        content_intensity: str = "moderate",
+        goal_type: str = "growth",
+        platforms: Optional[Sequence[str]] = None
+    ) -> ContentAgentOutput:
+        """Agent 5: Generate daily content (for every platform in platforms, default YouTube only)."""
+        return self.generate_json(*self._content_request(
+            day_plan, creator_context, day_number, content_intensity, goal_type, platforms
+        ))
+    
+    async def generate_content_async(
+        self,
+        day_plan: Dict[str, Any],
+        creator_context: Dict[str, Any],
+        day_number: int,
+        content_intensity: str = "moderate",
+        goal_type: str = "growth",
+        on_field: Optional[FieldCallback] = None,
+        platforms: Optional[Sequence[str]] = None
+    ) -> ContentAgentOutput:
+        """Agent 5: Generate daily content (non-blocking, fields streamed to on_field)."""
+        return await self.generate_json_async(*self._content_request(
+            day_plan, creator_context, day_number, content_intensity, goal_type, platforms
+        ), on_field=on_field)
+    
+    def _content_batch_request(
+        self,
+        day_plans: Dict[int, Dict[str, Any]],
+        creator_context: Dict[str, Any],
+        duration_days: int,
+        content_intensity: str = "moderate",
+        goal_type: str = "growth",
+        platforms: Optional[Sequence[str]] = None
+    ) -> LLMRequest:
+        """Build the batched Agent 5 request (several days, one shared context block)."""
+        prompt = render_prompt(
+            'agent5_content_batch.txt',
+            day_numbers=", ".join(str(day) for day in day_plans),
+            duration_days=duration_days,
+            day_plans=compact_json(
+                {str(day): plan for day, plan in day_plans.items()},
+                policy=batch_policy(POLICIES['day_plan'], len(day_plans))
+            ),
+            creator_context=compact_json(creator_context, 'creator_context'),
+            content_intensity=content_intensity,
+            goal_type=goal_type,
+            platforms=", ".join(platforms or ["youtube"])
+        )
+        return LLMRequest(
+            prompt,
+            ContentBatchOutput,
+            system_instruction="You are a content creator assistant. Generate authentic, platform-optimized content with clear reasoning.",
+            template="agent5_content_batch.txt"
+        )
+    
+    async def generate_content_batch_async(
+        self,
+        day_plans: Dict[int, Dict[str, Any]],
+        creator_context: Dict[str, Any],
+        duration_days: int,
+        content_intensity: str = "moderate",
+        goal_type: str = "growth",
+        on_field: Optional[FieldCallback] = None,
+        platforms: Optional[Sequence[str]] = None
+    ) -> ContentBatchOutput:
+        """Agent 5: Generate content for several days in one call (non-blocking, each day streamed to on_field)."""
+        return await self.generate_json_async(*self._content_batch_request(
+            day_plans, creator_context, duration_days, content_intensity, goal_type, platforms
+        ), on_field=on_field)
+    
+    def _outcome_request(
         self,
         goal: Dict[str, Any],
         actual_metrics: Dict[str, Any],
         campaign_plan: Dict[str, Any],
         daily_execution: Optional[Dict[str, Any]] = None
-    ) -> OutcomeAgentOutput:
-        """Agent 6: Analyze campaign outcome."""
-        prompt_template = self.load_prompt('agent6_outcome.txt')
-        prompt = prompt_template.format(
-            goal=json.dumps(goal, indent=2),
-            actual_metrics=json.dumps(actual_metrics, indent=2),
-            campaign_plan=json.dumps(campaign_plan, indent=2),
-            daily_execution=json.dumps(daily_execution or {}, indent=2)
+    ) -> LLMRequest:
+        """Build the Agent 6 (outcome) request."""
+        prompt = render_prompt(
+            'agent6_outcome.txt',
+            goal=compact_json(goal, 'goal'),
+            actual_metrics=compact_json(actual_metrics, 'metrics'),
+            campaign_plan=compact_json(campaign_plan, 'campaign_plan'),
+            daily_execution=compact_json(daily_execution or {}, 'daily_execution')
         )
-        return self.generate_json(
+        return LLMRequest(
             prompt,
             OutcomeAgentOutput,
-            system_instruction="You are a campaign analyst. Provide honest, actionable insights including adherence rate."
+            system_instruction="You are a campaign analyst. Provide honest, actionable insights including adherence rate.",
+            template="agent6_outcome.txt"
         )
+    
+    def analyze_outcome(
+        self,
+        goal: Dict[str, Any],
+        actual_metrics: Dict[str, Any],
+        campaign_plan: Dict[str, Any],
+        daily_execution: Optional[Dict[str, Any]] = None
+    ) -> OutcomeAgentOutput:
+        """Agent 6: Analyze campaign outcome."""
+        return self.generate_json(*self._outcome_request(goal, actual_metrics, campaign_plan, daily_execution))
+    
+    async def analyze_outcome_async(
+        self,
+        goal: Dict[str, Any],
+        actual_metrics: Dict[str, Any],
+        campaign_plan: Dict[str, Any],
+        daily_execution: Optional[Dict[str, Any]] = None
+    ) -> OutcomeAgentOutput:
+        """Agent 6: Analyze campaign outcome (non-blocking)."""
+        return await self.generate_json_async(*self._outcome_request(goal, actual_metrics, campaign_plan, daily_execution))
 
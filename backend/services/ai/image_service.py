@@ -3,11 +3,12 @@ Image generation service using Pollinations.ai Flux model.
 Uses REST API with HTTP requests for simple, efficient image generation.
 """
 
-import base64
+import asyncio
 from typing import Optional
 import httpx
 
 from ...config import POLLINATIONS_API_KEY
+from ...storage.blob_store import blob_store
 
 
 class ImageService:
@@ -36,7 +37,7 @@ class ImageService:
             size: Target resolution/aspect ratio (1280x720, 1080x1080, etc.)
         
         Returns:
-            Base64-encoded data URI (data:image/png;base64,...) or None
+            Blob store key of the image (see storage.blob_store.media_url) or None
         """
         if not self.api_key:
             return None
@@ -74,10 +75,9 @@ class ImageService:
                 )
 
                 if response.status_code == 200:
-                    # Convert binary image to base64 data URI
-                    image_bytes = response.content
-                    b64_data = base64.b64encode(image_bytes).decode("utf-8")
-                    return f"data:image/png;base64,{b64_data}"
+                    # Store the bytes once; rows keep only the key
+                    content_type = response.headers.get("content-type", "image/png")
+                    return await asyncio.to_thread(blob_store.put, response.content, content_type)
                 elif response.status_code == 401:
                     print("⚠️  Pollinations API: Unauthorized - check your API key")
                     return None
@@ -110,7 +110,7 @@ class ImageService:
             platform: Target platform (YouTube, TikTok, Instagram)
         
         Returns:
-            Base64-encoded data URI or None
+            Blob store key or None
         """
         sizes = {
             "YouTube": "1280x720",
@@ -0,0 +1,235 @@
+"""Incremental JSON parsing of (streamed) LLM responses.
+
+IncrementalJSONParser is fed completion text as it arrives. It skips any
+preamble or markdown fence before the first `{`, tracks nesting, and
+validates each top-level field of the root object against the Pydantic
+output schema as soon as that field's value is complete (items of
+top-level arrays are validated one by one). Completed fields are handed
+to an optional callback, so callers can show e.g. a title before the
+script has finished streaming. Structural errors (mismatched brackets,
+non-string keys, a field of the wrong type) raise JSONStreamError
+immediately instead of after the whole completion has been paid for.
+"""
+import json
+from typing import Any, Callable, Dict, List, Optional, get_args, get_origin
+
+from pydantic import TypeAdapter, ValidationError
+
+# Give up if this much text arrives without the root object starting
+MAX_PREAMBLE_CHARS = 2000
+
+FieldCallback = Callable[[str, Any], None]
+
+_CLOSERS = {"}": "{", "]": "["}
+
+
+class JSONStreamError(ValueError):
+    """The response can no longer become a valid instance of the schema."""
+
+
+def strip_trailing_commas(text: str) -> str:
+    """Drop commas followed (after optional whitespace) by a closing bracket, leaving string contents alone."""
+    out: List[str] = []
+    in_string = escape = False
+    length = len(text)
+    for i, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ",":
+            j = i + 1
+            while j < length and text[j] in " \t\r\n":
+                j += 1
+            if j < length and text[j] in "}]":
+                continue
+        out.append(char)
+    return "".join(out)
+
+
+def _loads_lenient(text: str) -> Any:
+    """json.loads, retried without trailing commas (a common LLM slip)."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(strip_trailing_commas(text))
+
+
+class IncrementalJSONParser:
+    """Tolerant, schema-aware incremental parser for one JSON object."""
+
+    def __init__(self, output_schema: type[Any], on_field: Optional[FieldCallback] = None):
+        """
+        Args:
+            output_schema: Pydantic model the root object must validate against
+            on_field: Called as on_field(name, value) for each completed
+                top-level field, and on_field("name[i]", item) for each
+                object in a top-level array (e.g. each day of a batch)
+        """
+        self.output_schema = output_schema
+        self.on_field = on_field
+        self.fields: Dict[str, Any] = {}
+
+        self._preamble = 0
+        self._buf: List[str] = []  # root object text
+        self._pos = 0  # index of the next char in the root text
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._member_start = 0
+        self._key: Optional[str] = None
+        self._item_start = 0
+        self._item_index = 0
+        self._done = False
+        self._adapters: Dict[str, TypeAdapter] = {}
+
+    # ---- public API ----
+
+    @property
+    def complete(self) -> bool:
+        """True once the root object has closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next piece of completion text."""
+        for char in chunk:
+            if self._done:
+                return  # Trailing text (closing fence, commentary) is ignored
+            if not self._stack and not self._buf:
+                if char == "{":
+                    self._open(char)
+                else:
+                    self._preamble += 1
+                    if self._preamble > MAX_PREAMBLE_CHARS:
+                        raise JSONStreamError("No JSON object found in response")
+                continue
+            self._buf.append(char)
+            self._pos += 1
+            self._consume(char)
+
+    def finish(self) -> Any:
+        """Validate the complete object; raises JSONStreamError if it never completed."""
+        if not self._done:
+            raise JSONStreamError("Response ended before the JSON object was complete")
+        # Every member was parsed and validated as it closed; only the model-level checks remain
+        try:
+            return self.output_schema.model_validate(self.fields)
+        except ValidationError as e:
+            raise JSONStreamError(f"Response does not match {self.output_schema.__name__}: {e}")
+
+    # ---- internals ----
+
+    def _open(self, char: str) -> None:
+        self._buf.append(char)
+        self._pos += 1
+        self._stack.append(char)
+        self._member_start = self._pos
+
+    def _consume(self, char: str) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+            return
+
+        depth = len(self._stack)
+        if char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._stack.append(char)
+            if depth == 1 and char == "[":
+                # Top-level array value: items are validated as they close
+                self._item_start = self._pos
+                self._item_index = 0
+        elif char in "}]":
+            if not self._stack or self._stack[-1] != _CLOSERS[char]:
+                raise JSONStreamError(f"Mismatched '{char}' in response")
+            if depth == 2 and char == "]" and self._key is not None:
+                self._complete_item(self._pos - 1)
+            self._stack.pop()
+            if depth == 1:
+                self._complete_member(self._pos - 1)
+                self._done = True
+        elif char == ":" and depth == 1:
+            self._read_key(self._pos - 1)
+        elif char == ",":
+            if depth == 1:
+                self._complete_member(self._pos - 1)
+                self._member_start = self._pos
+            elif depth == 2 and self._stack[-1] == "[" and self._key is not None:
+                self._complete_item(self._pos - 1)
+                self._item_start = self._pos
+                self._item_index += 1
+
+    def _text(self, start: int, end: int) -> str:
+        return "".join(self._buf[start:end]).strip()
+
+    def _read_key(self, colon: int) -> None:
+        try:
+            key = json.loads(self._text(self._member_start, colon))
+        except json.JSONDecodeError:
+            key = None
+        if not isinstance(key, str):
+            raise JSONStreamError("Object keys must be strings")
+        self._key = key
+
+    def _complete_member(self, end: int) -> None:
+        member = self._text(self._member_start, end)
+        key, self._key = self._key, None
+        if not member:
+            return  # "{}" or a trailing comma
+        if key is None:
+            raise JSONStreamError(f"Expected a \"key\": value pair, got {member[:40]!r}")
+        try:
+            value = _loads_lenient("{" + member + "}")[key]
+        except json.JSONDecodeError as e:
+            raise JSONStreamError(f"Invalid value for field '{key}': {e.msg}")
+        self.fields[key] = self._validate(key, value)
+        if self.on_field:
+            self.on_field(key, self.fields[key])
+
+    def _complete_item(self, end: int) -> None:
+        item_text = self._text(self._item_start, end)
+        if not item_text:
+            return  # "[]" or a trailing comma
+        try:
+            item = _loads_lenient(item_text)
+        except json.JSONDecodeError as e:
+            raise JSONStreamError(f"Invalid item {self._item_index} in '{self._key}': {e.msg}")
+        is_object = isinstance(item, dict)
+        item = self._validate(self._key, item, item=True)
+        if self.on_field and is_object:
+            self.on_field(f"{self._key}[{self._item_index}]", item)
+
+    def _validate(self, key: str, value: Any, item: bool = False) -> Any:
+        field_info = self.output_schema.model_fields.get(key)
+        if field_info is None:
+            return value  # Extra keys are ignored by the model, as with model_validate
+        annotation = field_info.annotation
+        if item:
+            if get_origin(annotation) is not list:
+                return value
+            annotation = get_args(annotation)[0]
+        cache_key = f"{key}[]" if item else key
+        adapter = self._adapters.get(cache_key)
+        if adapter is None:
+            adapter = self._adapters[cache_key] = TypeAdapter(annotation)
+        try:
+            return adapter.validate_python(value)
+        except ValidationError as e:
+            raise JSONStreamError(f"Field '{key}' does not match the schema: {e.errors()[0]['msg']}")
+
+
+def parse_json_response(text: str, output_schema: type[Any], on_field: Optional[FieldCallback] = None) -> Any:
+    """Parse a complete (non-streamed) response with the same tolerant rules."""
+    parser = IncrementalJSONParser(output_schema, on_field)
+    parser.feed(text)
+    return parser.finish()
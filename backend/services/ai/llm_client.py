@@ -0,0 +1,62 @@
+"""Shared async HTTP client for LLM completion calls."""
+import asyncio
+import weakref
+from typing import Optional
+
+import httpx
+
+from ...config import (
+    LLM_HTTP_TIMEOUT,
+    LLM_HTTP2_ENABLED,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_KEEPALIVE_EXPIRY,
+)
+
+# One pooled client per event loop. httpx connections are bound to the loop
+# that opened them, so a client must never be shared across loops (e.g. between
+# the FastAPI loop and a Celery task loop in the same process).
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (installed via httpx[http2])."""
+    if not LLM_HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """
+    Return the connection-pooled client for the running event loop.
+
+    The client keeps connections alive between calls, so concurrent agent
+    calls from one worker reuse the same TLS connections instead of
+    handshaking per request.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=httpx.Timeout(LLM_HTTP_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_llm_http_client() -> None:
+    """Close the client bound to the running event loop (call on shutdown)."""
+    loop = asyncio.get_running_loop()
+    client: Optional[httpx.AsyncClient] = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -0,0 +1,271 @@
+"""Prompt compaction - serialize agent inputs with as few tokens as possible.
+
+Agent prompts inline large structures (creator context, strategy,
+forensics, plans, competitor video/tweet lists). compact_json() renders
+them for a prompt section:
+
+- minified JSON (no indentation, no ASCII escaping)
+- empty values (None, "", [], {}) dropped
+- per-section field allow-lists (e.g. only the metrics forensics needs
+  from a raw tweet object)
+- per-field and default string budgets, list item caps
+- repeated lines inside a section (YouTube description boilerplate,
+  link footers) emitted only once
+- a token budget per section: budgets are tightened until the estimate fits,
+  then trailing list items / largest keys are dropped (the section always
+  stays valid JSON)
+
+Token counts are estimated at ~4 characters per token, which is close
+enough to keep prompts inside the model's context window.
+"""
+import json
+import logging
+import math
+from datetime import date, datetime
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional
+
+from ...config import LLM_CONTEXT_WINDOW_TOKENS
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio for English text and JSON
+CHARS_PER_TOKEN = 4
+
+# Lines shorter than this (e.g. "Thanks!") are never treated as boilerplate
+MIN_DEDUPE_LINE_CHARS = 20
+
+# Shrink rounds before whole items are dropped to fit a section's token budget
+MAX_SHRINK_ROUNDS = 4
+
+
+class CompactionPolicy(NamedTuple):
+    """How one prompt section is compacted."""
+    keep: Optional[FrozenSet[str]] = None  # allowed dict keys (any depth); None keeps all
+    field_budgets: Dict[str, int] = {}  # max chars per string field
+    default_budget: Optional[int] = None  # max chars for any other string
+    max_items: Optional[int] = None  # max items per list
+    max_tokens: Optional[int] = None  # token budget for the rendered section
+
+
+# Per-agent sections
+POLICIES: Dict[str, CompactionPolicy] = {
+    # Agent 3 inputs: competitor videos / tweets
+    "videos": CompactionPolicy(
+        keep=frozenset({"title", "description", "views", "likes", "comments", "duration", "published_at"}),
+        field_budgets={"description": 300, "title": 150},
+        max_items=15,
+        max_tokens=2500,
+    ),
+    "tweets": CompactionPolicy(
+        keep=frozenset({
+            "text", "likeCount", "retweetCount", "replyCount", "quoteCount",
+            "bookmarkCount", "viewCount", "createdAt",
+        }),
+        field_budgets={"text": 400},
+        max_items=15,
+        max_tokens=2500,
+    ),
+    # Agent 1 inputs: the creator's own best/worst content
+    "creator_videos": CompactionPolicy(
+        keep=frozenset({"title", "description", "views", "likes", "comments", "duration", "published_at"}),
+        field_budgets={"description": 200, "title": 150},
+        max_items=10,
+        max_tokens=1500,
+    ),
+    "creator_tweets": CompactionPolicy(
+        keep=frozenset({"text", "likeCount", "retweetCount", "replyCount", "viewCount", "createdAt"}),
+        field_budgets={"text": 300},
+        max_items=10,
+        max_tokens=1500,
+    ),
+    # Agent outputs fed to later agents
+    "creator_context": CompactionPolicy(default_budget=400, max_items=10, max_tokens=1500),
+    "strategy": CompactionPolicy(default_budget=500, max_items=10, max_tokens=1500),
+    "forensics": CompactionPolicy(default_budget=400, max_items=8, max_tokens=1200),
+    "goal": CompactionPolicy(default_budget=300, max_tokens=400),
+    "day_plan": CompactionPolicy(default_budget=500, max_tokens=600),
+    "campaign_plan": CompactionPolicy(default_budget=300, max_tokens=2000),
+    "daily_execution": CompactionPolicy(default_budget=300, max_items=10, max_tokens=2000),
+    "metrics": CompactionPolicy(default_budget=200, max_tokens=600),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a prompt or section."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def batch_policy(policy: CompactionPolicy, count: int) -> CompactionPolicy:
+    """Policy for a section holding count entries of policy's kind (e.g. a batch of day plans)."""
+    if policy.max_tokens is None:
+        return policy
+    return policy._replace(max_tokens=policy.max_tokens * max(count, 1))
+
+
+# Prompt size per template: {template: {"calls": n, "tokens": total, "max_tokens": largest}}
+prompt_stats: Dict[str, Dict[str, int]] = {}
+
+
+def record_prompt(template: Optional[str], prompt: str, system_instruction: Optional[str] = None) -> int:
+    """
+    Estimate a prompt's size before it is sent and track it per template.
+
+    Args:
+        template: Prompt template name (None for untemplated prompts)
+        prompt: Full prompt text
+        system_instruction: Optional system instruction sent with it
+
+    Returns:
+        Estimated input tokens
+    """
+    name = template or "untemplated"
+    tokens = estimate_tokens(prompt) + estimate_tokens(system_instruction or "")
+    stats = prompt_stats.setdefault(name, {"calls": 0, "tokens": 0, "max_tokens": 0})
+    stats["calls"] += 1
+    stats["tokens"] += tokens
+    stats["max_tokens"] = max(stats["max_tokens"], tokens)
+
+    if tokens > LLM_CONTEXT_WINDOW_TOKENS:
+        logger.warning(f"Prompt {name} is ~{tokens} tokens, over the {LLM_CONTEXT_WINDOW_TOKENS}-token context window")
+    else:
+        logger.info(f"Prompt {name}: ~{tokens} input tokens")
+    return tokens
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return str(value)
+
+
+def _truncate(text: str, budget: Optional[int]) -> str:
+    if budget is None or len(text) <= budget:
+        return text
+    return text[:max(budget - 1, 0)].rstrip() + "…"
+
+
+class _Compactor:
+    """One pass over a section (tracks lines already emitted for dedup)."""
+
+    def __init__(self, policy: CompactionPolicy, scale: float):
+        self.policy = policy
+        self.scale = scale
+        self.seen_lines: set = set()
+
+    def _budget(self, key: Optional[str]) -> Optional[int]:
+        budget = self.policy.field_budgets.get(key, self.policy.default_budget) if key else self.policy.default_budget
+        if budget is None:
+            return None
+        return max(40, int(budget * self.scale))
+
+    def _max_items(self) -> Optional[int]:
+        if self.policy.max_items is None:
+            return None
+        return max(3, int(self.policy.max_items * self.scale))
+
+    def _string(self, text: str, key: Optional[str]) -> str:
+        lines = text.strip().splitlines()
+        if len(lines) > 1:
+            kept = []
+            for line in lines:
+                normalized = line.strip()
+                if not normalized:
+                    continue
+                if len(normalized) >= MIN_DEDUPE_LINE_CHARS:
+                    if normalized in self.seen_lines:
+                        continue
+                    self.seen_lines.add(normalized)
+                kept.append(normalized)
+            text = "\n".join(kept)
+        return _truncate(text, self._budget(key))
+
+    def compact(self, value: Any, key: Optional[str] = None) -> Any:
+        if hasattr(value, "model_dump"):
+            value = value.model_dump()
+        if isinstance(value, dict):
+            result = {}
+            for k, v in value.items():
+                if self.policy.keep is not None and k not in self.policy.keep and not isinstance(v, (dict, list)):
+                    continue
+                compacted = self.compact(v, str(k))
+                if compacted in (None, "", [], {}):
+                    continue
+                result[k] = compacted
+            return result
+        if isinstance(value, (list, tuple)):
+            limit = self._max_items()
+            items = [self.compact(item, key) for item in list(value)[:limit]]
+            return [item for item in items if item not in (None, "", [], {})]
+        if isinstance(value, str):
+            return self._string(value, key)
+        return value
+
+
+def compact(value: Any, policy: CompactionPolicy, scale: float = 1.0) -> Any:
+    """Compacted copy of value (budgets multiplied by scale)."""
+    return _Compactor(policy, scale).compact(value)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+
+def _drop_one(node: Any) -> bool:
+    """
+    Remove one element from the structure in place: the last item of a
+    list, or the largest key of a dict, descending into the largest child
+    while it is a non-empty list/dict. Returns False if nothing is left.
+    """
+    if isinstance(node, list):
+        if not node:
+            return False
+        if len(node) == 1 and isinstance(node[0], (dict, list)) and node[0]:
+            return _drop_one(node[0])
+        node.pop()
+        return True
+    if isinstance(node, dict):
+        if not node:
+            return False
+        key = max(node, key=lambda k: len(_dumps(node[k])))
+        if isinstance(node[key], (dict, list)) and node[key]:
+            return _drop_one(node[key])
+        del node[key]
+        return True
+    return False
+
+
+def compact_json(value: Any, section: Optional[str] = None, policy: Optional[CompactionPolicy] = None) -> str:
+    """
+    Render value as a compact JSON prompt section.
+
+    Args:
+        value: Structure to serialize (dicts, lists, Pydantic models, datetimes)
+        section: Name of a policy in POLICIES
+        policy: Explicit policy (overrides section)
+
+    Returns:
+        Minified JSON within the policy's token budget
+    """
+    policy = policy or POLICIES.get(section, CompactionPolicy())
+    scale = 1.0
+    for _ in range(MAX_SHRINK_ROUNDS + 1):
+        compacted = compact(value, policy, scale)
+        text = _dumps(compacted)
+        if policy.max_tokens is None or estimate_tokens(text) <= policy.max_tokens:
+            return text
+        scale /= 2
+
+    # Still over budget after shrinking: drop whole items so the JSON stays parseable
+    if isinstance(compacted, str):
+        text = _dumps(_truncate(compacted, policy.max_tokens * CHARS_PER_TOKEN - 2))
+    dropped = 0
+    while estimate_tokens(text) > policy.max_tokens and _drop_one(compacted):
+        dropped += 1
+        text = _dumps(compacted)
+    logger.warning(
+        f"Prompt section {section or 'custom'} over its {policy.max_tokens}-token budget after "
+        f"{MAX_SHRINK_ROUNDS} shrink rounds; dropped {dropped} item(s) (~{estimate_tokens(text)} tokens)"
+    )
+    return text
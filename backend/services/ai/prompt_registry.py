@@ -0,0 +1,160 @@
+"""Process-wide registry of precompiled agent prompt templates.
+
+Every file under prompts/agents/ (including platform_specific/) is read
+once per process and split into literal text and {placeholder} segments,
+so rendering is a single join instead of re-parsing a multi-KB template
+with str.format on every request. Each template carries a short content
+hash (its version), which is folded into LLM response cache keys so
+editing a prompt never serves answers generated for the old text.
+
+validate() checks, at startup, that the arguments each agent request
+builder supplies match the placeholders in its template, turning a
+KeyError deep inside a campaign run into a boot-time error.
+"""
+import hashlib
+import logging
+import string
+import threading
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts" / "agents"
+
+# Length of the hex content hash used as a template version
+VERSION_LENGTH = 12
+
+
+class PromptTemplateError(ValueError):
+    """A prompt template is missing, malformed or doesn't match its caller."""
+
+
+class PromptTemplate:
+    """One compiled prompt file."""
+
+    def __init__(self, name: str, path: Path, text: str):
+        self.name = name
+        self.path = path
+        self.text = text
+        self.version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:VERSION_LENGTH]
+        self._segments = self._compile(text)
+        self.placeholders: FrozenSet[str] = frozenset(field for _, field in self._segments if field is not None)
+
+    def _compile(self, text: str) -> List[Tuple[str, Optional[str]]]:
+        """Split into (literal, placeholder) pairs; {{ and }} are unescaped once here."""
+        segments = []
+        try:
+            for literal, field, format_spec, conversion in string.Formatter().parse(text):
+                if field is not None and (not field.isidentifier() or format_spec or conversion):
+                    raise PromptTemplateError(
+                        f"{self.name}: only plain {{name}} placeholders are supported, got {{{field}}}"
+                    )
+                segments.append((literal, field))
+        except ValueError as e:
+            if isinstance(e, PromptTemplateError):
+                raise
+            raise PromptTemplateError(f"{self.name}: malformed template ({e})")
+        return segments
+
+    def render(self, **kwargs: Any) -> str:
+        """Fill the placeholders (equivalent to text.format(**kwargs))."""
+        parts = []
+        for literal, field in self._segments:
+            parts.append(literal)
+            if field is not None:
+                try:
+                    parts.append(str(kwargs[field]))
+                except KeyError:
+                    raise PromptTemplateError(f"{self.name}: missing argument '{field}'")
+        return "".join(parts)
+
+
+class PromptRegistry:
+    """Loads every template once and serves them to all GeminiService instances."""
+
+    def __init__(self, prompts_dir: Path = PROMPTS_DIR):
+        self.prompts_dir = prompts_dir
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Read and compile all templates (idempotent)."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            templates = {}
+            for path in sorted(self.prompts_dir.rglob("*.txt")):
+                if path.name in templates:
+                    raise PromptTemplateError(
+                        f"Duplicate prompt name {path.name}: {templates[path.name].path} and {path}"
+                    )
+                templates[path.name] = PromptTemplate(path.name, path, path.read_text(encoding="utf-8"))
+            self._templates = templates
+            self._loaded = True
+            logger.info(f"Loaded {len(templates)} prompt templates from {self.prompts_dir}")
+
+    def get(self, name: str) -> PromptTemplate:
+        """
+        Compiled template by file name (e.g. 'agent1_context.txt').
+
+        Raises:
+            FileNotFoundError: If no such template exists
+        """
+        self.load()
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise FileNotFoundError(f"Prompt file not found: {name} (under {self.prompts_dir})")
+
+    def render(self, name: str, **kwargs: Any) -> str:
+        """Render a template by name."""
+        return self.get(name).render(**kwargs)
+
+    def version(self, name: str) -> str:
+        """Content hash of a template."""
+        return self.get(name).version
+
+    def cache_tag(self, name: str) -> str:
+        """Template identity for cache keys: 'name@version'."""
+        return f"{name}@{self.version(name)}"
+
+    def versions(self) -> Dict[str, str]:
+        """{template name: version} for every loaded template."""
+        self.load()
+        return {name: template.version for name, template in self._templates.items()}
+
+    def validate(self, expected: Mapping[str, Iterable[str]]) -> None:
+        """
+        Check templates against the arguments their callers supply.
+
+        Args:
+            expected: {template name: argument names passed when rendering it}
+
+        Raises:
+            PromptTemplateError: If a template is missing or uses a placeholder
+                its caller doesn't supply
+        """
+        self.load()
+        problems = []
+        for name, arguments in expected.items():
+            template = self._templates.get(name)
+            if template is None:
+                problems.append(f"{name}: template not found")
+                continue
+            arguments = frozenset(arguments)
+            missing = template.placeholders - arguments
+            if missing:
+                problems.append(f"{name}: placeholders without arguments {sorted(missing)}")
+            unused = arguments - template.placeholders
+            if unused:
+                # Harmless (extra format arguments are ignored), but usually a stale prompt edit
+                logger.warning(f"Prompt {name} doesn't use arguments {sorted(unused)}")
+        if problems:
+            raise PromptTemplateError("Prompt validation failed: " + "; ".join(problems))
+
+
+prompt_registry = PromptRegistry()
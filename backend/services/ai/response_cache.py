@@ -0,0 +1,242 @@
+"""Content-addressed cache for structured agent LLM responses.
+
+Two tiers:
+    1. In-process LRU (per worker, no I/O)
+    2. Redis (shared across API and Celery workers, reuses REDIS_URL)
+
+Keys are a SHA-256 over everything that determines the model's answer, so
+a byte-identical request (e.g. a Celery retry re-running Strategy/Planner)
+is served without a paid call. Values are the validated output serialized
+as JSON and re-validated against the schema on read.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ...config import (
+    REDIS_URL,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_REDIS_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_DEFAULT_TTL,
+    LLM_CACHE_TTLS,
+)
+from ..core.redis_clients import RedisBackoff, get_async_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm-cache:"
+STATS_KEY = "llm-cache:stats"
+
+
+def make_cache_key(
+    template: Optional[str],
+    prompt: str,
+    system_instruction: Optional[str],
+    output_schema: type[Any],
+    model: str
+) -> str:
+    """Hash (template name, rendered prompt, system instruction, output schema, model)."""
+    schema_json = json.dumps(output_schema.model_json_schema(), sort_keys=True)
+    material = "\x1f".join([
+        template or "",
+        prompt,
+        system_instruction or "",
+        f"{output_schema.__module__}.{output_schema.__qualname__}",
+        schema_json,
+        model,
+    ])
+    return KEY_PREFIX + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def ttl_for(template: Optional[str]) -> int:
+    """Per-agent TTL (seconds), looked up by prompt template name."""
+    if template and template in LLM_CACHE_TTLS:
+        return LLM_CACHE_TTLS[template]
+    return LLM_CACHE_DEFAULT_TTL
+
+
+class ResponseCache:
+    """LRU + Redis cache for agent responses, with hit/miss counters."""
+
+    def __init__(
+        self,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        redis_url: Optional[str] = REDIS_URL if LLM_CACHE_REDIS_ENABLED else None
+    ):
+        self.max_entries = max_entries
+        self.redis_url = redis_url
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis_backoff = RedisBackoff()
+        self.stats: Dict[str, int] = {
+            "memory_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "redis_errors": 0,
+        }
+
+    # ---- in-process tier ----
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _memory_set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # ---- Redis tier ----
+
+    def _redis_available(self) -> bool:
+        return bool(self.redis_url) and self._redis_backoff.available()
+
+    def _redis_failed(self, error: Exception) -> None:
+        self.stats["redis_errors"] += 1
+        self._redis_backoff.failed()
+        logger.warning(f"LLM cache Redis tier unavailable, falling back to memory only: {error}")
+
+    def _get_sync_redis(self):
+        return get_sync_redis(self.redis_url)
+
+    def _get_async_redis(self):
+        return get_async_redis(self.redis_url)
+
+    # ---- public API ----
+
+    def _decode(self, raw: str, output_schema: type[Any]) -> Optional[Any]:
+        try:
+            return output_schema.model_validate_json(raw)
+        except Exception as e:
+            # Schema changed under the same key material, or corrupted entry
+            logger.warning(f"Discarding unreadable LLM cache entry: {e}")
+            return None
+
+    def _record(self, outcome: str) -> None:
+        self.stats[outcome] += 1
+        if outcome != "stores" and self._redis_available():
+            try:
+                self._get_sync_redis().hincrby(STATS_KEY, outcome, 1)
+            except Exception as e:
+                self._redis_failed(e)
+
+    async def _record_async(self, outcome: str) -> None:
+        self.stats[outcome] += 1
+        if outcome != "stores" and self._redis_available():
+            try:
+                await self._get_async_redis().hincrby(STATS_KEY, outcome, 1)
+            except Exception as e:
+                self._redis_failed(e)
+
+    def get(self, key: str, output_schema: type[Any], ttl: int) -> Optional[Any]:
+        """Look up a response (blocking). Returns a validated model or None."""
+        raw = self._memory_get(key)
+        if raw is not None:
+            result = self._decode(raw, output_schema)
+            if result is not None:
+                self._record("memory_hits")
+                return result
+
+        if self._redis_available():
+            try:
+                raw = self._get_sync_redis().get(key)
+            except Exception as e:
+                self._redis_failed(e)
+                raw = None
+            if raw is not None:
+                raw = raw.decode("utf-8")
+                result = self._decode(raw, output_schema)
+                if result is not None:
+                    self._memory_set(key, raw, ttl)
+                    self._record("redis_hits")
+                    return result
+
+        self._record("misses")
+        return None
+
+    async def get_async(self, key: str, output_schema: type[Any], ttl: int) -> Optional[Any]:
+        """Look up a response without blocking the event loop."""
+        raw = self._memory_get(key)
+        if raw is not None:
+            result = self._decode(raw, output_schema)
+            if result is not None:
+                await self._record_async("memory_hits")
+                return result
+
+        if self._redis_available():
+            try:
+                raw = await self._get_async_redis().get(key)
+            except Exception as e:
+                self._redis_failed(e)
+                raw = None
+            if raw is not None:
+                raw = raw.decode("utf-8")
+                result = self._decode(raw, output_schema)
+                if result is not None:
+                    self._memory_set(key, raw, ttl)
+                    await self._record_async("redis_hits")
+                    return result
+
+        await self._record_async("misses")
+        return None
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store a validated model in both tiers (blocking)."""
+        raw = value.model_dump_json()
+        self._memory_set(key, raw, ttl)
+        if self._redis_available():
+            try:
+                self._get_sync_redis().set(key, raw, ex=ttl)
+            except Exception as e:
+                self._redis_failed(e)
+        self.stats["stores"] += 1
+
+    async def set_async(self, key: str, value: Any, ttl: int) -> None:
+        """Store a validated model in both tiers without blocking the event loop."""
+        raw = value.model_dump_json()
+        self._memory_set(key, raw, ttl)
+        if self._redis_available():
+            try:
+                await self._get_async_redis().set(key, raw, ex=ttl)
+            except Exception as e:
+                self._redis_failed(e)
+        self.stats["stores"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters for this process plus, when Redis is reachable,
+        the totals across all workers.
+        """
+        local = dict(self.stats)
+        lookups = local["memory_hits"] + local["redis_hits"] + local["misses"]
+        local["hit_rate"] = round((local["memory_hits"] + local["redis_hits"]) / lookups, 4) if lookups else 0.0
+        local["entries"] = len(self._entries)
+
+        snapshot: Dict[str, Any] = {"enabled": LLM_CACHE_ENABLED, "process": local}
+        if self._redis_available():
+            try:
+                totals = self._get_sync_redis().hgetall(STATS_KEY)
+                snapshot["global"] = {k.decode("utf-8"): int(v) for k, v in totals.items()}
+            except Exception as e:
+                self._redis_failed(e)
+        return snapshot
+
+
+# Module-level singleton shared by every GeminiService instance in the process
+response_cache = ResponseCache()
@@ -6,8 +6,8 @@ from .gemini_service import GeminiService
 class SEOService:
     """Service for SEO optimization using Gemini."""
     
-    def __init__(self):
-        self.gemini_service = GeminiService()
+    def __init__(self, gemini: Optional[GeminiService] = None):
+        self.gemini_service = gemini or GeminiService()
     
     async def optimize_content(self, title: str, description: str, platform: str = "YouTube") -> dict:
         """
@@ -1,19 +1,38 @@
 """Agent orchestrator - Coordinates agent execution flow."""
+import asyncio
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, timezone
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
 
-from ...agents.core.context_analyzer import ContextAnalyzer
-from ...agents.core.strategy_agent import StrategyAgent
-from ...agents.platform.forensics_agent import ForensicsAgent
-from ...agents.core.planner_agent import PlannerAgent
-from ...agents.core.content_agent import ContentAgent
-from ...agents.core.outcome_agent import OutcomeAgent
 from ...models.campaign.campaign import Campaign, CampaignStatus, DailyContent
-from ...models.db.campaign import CampaignDB, LearningMemoryDB
+from ...models.db.campaign import CampaignDB
 from ...models.db.user import CreatorProfileDB
+from ...agents.core.content_agent import content_platforms
+from ..platforms.competitor_store import load_competitor_items, preload_channel_resolutions, save_snapshots
+from ..platforms.channel_resolution import persist_resolutions
+from .container import container
+from .daily_store import upsert_daily_content
+from .learning_memory import retrieve_learnings, save_learning_memory
+from .progress import ProgressReporter
+from ...config import CONTENT_GENERATION_CONCURRENCY
+
+# Per-day workflow stages, in execution order (tracked in CampaignDB.workflow_checkpoint)
+DAY_STAGES = ("content", "thumbnail", "seo")
+
+# daily_content columns a workflow run writes (and reads back when resuming)
+DAILY_CONTENT_COLUMNS = (
+    "campaign_id", "day_number", "platform", "video_script", "video_title",
+    "seo_tags", "call_to_action", "tweet_text", "thread_tweets", "thumbnail_urls"
+)
+# daily_content.tweet_text is VARCHAR(280)
+MAX_TWEET_LENGTH = 280
+
+# Progress weights (relative share of the 0-100 bar); per-day content dominates the runtime
+WORKFLOW_PROGRESS_STAGES = (("strategy", 10), ("forensics", 15), ("planner", 10), ("content", 65))
+LEARNING_PROGRESS_STAGES = (("fetch", 40), ("summarize", 60))
 
 
 class AgentOrchestrator:
@@ -28,13 +47,13 @@ class AgentOrchestrator:
     """
     
     def __init__(self):
-        """Initialize all agents."""
-        self.context_analyzer = ContextAnalyzer()
-        self.strategy_agent = StrategyAgent()
-        self.forensics_agent = ForensicsAgent()
-        self.planner_agent = PlannerAgent()
-        self.content_agent = ContentAgent()
-        self.outcome_agent = OutcomeAgent()
+        """Bind the process-wide agents (cheap: one orchestrator per task/run)."""
+        self.context_analyzer = container.context_analyzer
+        self.strategy_agent = container.strategy_agent
+        self.forensics_agent = container.forensics_agent
+        self.planner_agent = container.planner_agent
+        self.content_agent = container.content_agent
+        self.outcome_agent = container.outcome_agent
         self.gemini_call_count = 0  # Track calls per campaign
     
     async def analyze_previous_campaigns(
@@ -50,10 +69,10 @@ class AgentOrchestrator:
         Args:
             user_id: User UUID
             db: Database session
-            progress_callback: Optional callback for progress updates (progress, message)
+            progress_callback: Optional callback for progress updates (progress, message, details=...)
         """
-        if progress_callback:
-            progress_callback(50, "Fetching past campaigns...")
+        progress = ProgressReporter(progress_callback, LEARNING_PROGRESS_STAGES)
+        progress.start_stage("fetch", message="Fetching past campaigns...")
         
         result = await db.execute(
             select(CampaignDB)
@@ -64,19 +83,20 @@ class AgentOrchestrator:
         completed = result.scalars().all()
         
         if not completed:
-            if progress_callback:
-                progress_callback(100, "No previous campaigns found")
+            progress.finish("No previous campaigns found")
             return None
         
         # Build analysis prompt
+        progress.start_stage("summarize", total_units=len(completed), message=f"Summarizing {len(completed)} past campaign(s)...")
         campaigns_summary = []
-        for campaign in completed:
+        for index, campaign in enumerate(completed, start=1):
             campaigns_summary.append({
                 "name": campaign.onboarding_data.get("name", "Unnamed") if campaign.onboarding_data else "Unnamed",
                 "goal": campaign.onboarding_data.get("goal", {}).get("goal_aim", "") if campaign.onboarding_data else "",
                 "duration": campaign.onboarding_data.get("goal", {}).get("duration_days", 0) if campaign.onboarding_data else 0,
                 "report": campaign.outcome_report or {}
             })
+            progress.advance(message=f"Summarized campaign {index}/{len(completed)}")
         
         # Return basic structure for now (will be enhanced with Gemini later)
         insights = {
@@ -87,8 +107,7 @@ class AgentOrchestrator:
             "recommended_adjustments": []
         }
         
-        if progress_callback:
-            progress_callback(100, "Analysis complete")
+        progress.finish("Analysis complete")
         
         return insights
     
@@ -105,8 +124,10 @@ class AgentOrchestrator:
         Args:
             campaign_id: Campaign UUID
             db: Database session
-            progress_callback: Optional callback for progress updates (progress, message)
+            progress_callback: Optional callback for progress updates (progress, message, details=...)
         """
+        progress = ProgressReporter(progress_callback, WORKFLOW_PROGRESS_STAGES)
+        
         result = await db.execute(select(CampaignDB).where(CampaignDB.campaign_id == campaign_id))
         campaign_db = result.scalar_one_or_none()
         
@@ -128,164 +149,191 @@ class AgentOrchestrator:
             # Get creator profile for niche
             result = await db.execute(select(CreatorProfileDB).where(CreatorProfileDB.user_id == campaign_db.user_id))
             profile = result.scalar_one_or_none()
-            niche = profile.niche if profile else None
-            
-            # Fetch relevant learnings (same goal_type, platform, niche)
-            goal_type = campaign_db.onboarding_data.get("goal", {}).get("goal_type")
-            platforms = campaign_db.onboarding_data.get("goal", {}).get("platforms", [])
-            platform = platforms[0] if platforms else None
-            
-            query = select(LearningMemoryDB).where(LearningMemoryDB.user_id == campaign_db.user_id)
-            
-            if goal_type:
-                query = query.where(LearningMemoryDB.goal_type == goal_type)
-            if platform:
-                query = query.where(LearningMemoryDB.platform == platform)
-            if niche:
-                query = query.where(LearningMemoryDB.niche == niche)
-            
-            query = query.order_by(LearningMemoryDB.created_at.desc()).limit(3)
-            
-            result = await db.execute(query)
-            learning_records = result.scalars().all()
-            
-            past_learnings = [
-                {
-                    "memory_id": lr.memory_id,
-                    "goal_type": lr.goal_type,
-                    "platform": lr.platform,
-                    "what_worked": lr.what_worked or [],
-                    "what_failed": lr.what_failed or [],
-                    "recommendations": lr.recommendations or []
-                }
-                for lr in learning_records
-            ]
+            
+            # Most relevant learnings (by niche, goal type and platform; see learning_memory)
+            goal = campaign_db.onboarding_data.get("goal", {})
+            past_learnings = await retrieve_learnings(
+                db,
+                user_id=campaign_db.user_id,
+                niche=profile.niche if profile else None,
+                goal_type=goal.get("goal_type"),
+                platforms=goal.get("platforms", []),
+                description=campaign_db.onboarding_data.get("description") or ""
+            )
             
             if past_learnings:
                 print(f"\n📚 Retrieved {len(past_learnings)} learning(s) from past campaigns")
         
         self.reset_call_count()
         
+        # Stage markers from a previous (failed or interrupted) run of this workflow
+        checkpoint = dict(campaign_db.workflow_checkpoint or {})
+        
         try:
             print("\n" + "="*60)
             print("🚀 CAMPAIGN WORKFLOW EXECUTION STARTED")
+            if checkpoint:
+                print(f"♻️  Resuming from checkpoint: {self._describe_checkpoint(checkpoint)}")
             print("="*60)
             
-            # STEP 1: Strategy Agent (required)
-            print("\n[1/4] 🎯 Executing Strategy Agent...")
+            onboarding = campaign_db.onboarding_data or {}
             
-            try:
-                onboarding = campaign_db.onboarding_data or {}
-                goal = onboarding.get("goal", {})
-                
-                strategy_output = self.strategy_agent.generate_strategy(
-                    goal=goal.get("goal_aim", ""),
-                    creator_context=profile_snapshot,
-                    duration_days=goal.get("duration_days", 3),
-                    goal_type=goal.get("goal_type", "growth"),
-                    past_learnings=past_learnings
-                )
-                
-                campaign_db.strategy_output = strategy_output.model_dump()
-                self.gemini_call_count += 1
-                print("      ✅ Strategy analysis complete")
-                
-                if progress_callback:
-                    progress_callback(33, "Strategy analysis complete")
+            # STEP 1: Strategy Agent (required)
+            progress.start_stage("strategy", message="Analyzing strategy...")
+            if checkpoint.get("strategy"):
+                print("\n[1/4] 🎯 Strategy Agent already complete (checkpoint)")
+            else:
+                print("\n[1/4] 🎯 Executing Strategy Agent...")
                 
-            except Exception as strategy_error:
-                print(f"      ❌ Strategy failed: {str(strategy_error)[:100]}")
-                campaign_db.strategy_output = {"error": str(strategy_error)[:200]}
+                try:
+                    goal = onboarding.get("goal", {})
+                    
+                    strategy_output = await self.strategy_agent.generate_strategy_async(
+                        goal=goal.get("goal_aim", ""),
+                        creator_context=profile_snapshot,
+                        duration_days=goal.get("duration_days", 3),
+                        goal_type=goal.get("goal_type", "growth"),
+                        past_learnings=past_learnings
+                    )
+                    
+                    campaign_db.strategy_output = strategy_output.model_dump()
+                    self.gemini_call_count += 1
+                    checkpoint["strategy"] = True
+                    await self._save_checkpoint(db, campaign_db, checkpoint)
+                    print("      ✅ Strategy analysis complete")
+                    
+                except Exception as strategy_error:
+                    print(f"      ❌ Strategy failed: {str(strategy_error)[:100]}")
+                    campaign_db.strategy_output = {"error": str(strategy_error)[:200]}
+            
+            progress.complete_stage("Strategy analysis complete")
             
             # STEP 2: Forensics Agent (if enabled)
             if agent_config and agent_config.get("run_forensics", True):
                 print("\n[2/4] 🔍 Executing Forensics Agent...")
-                forensics_output = {}
+                progress.start_stage("forensics", message="Analyzing competitors...")
+                # {platform: ForensicsAgentOutput dict} for platforms finished in a previous run
+                forensics_done = checkpoint.setdefault("forensics", {})
+                
+                platforms = onboarding.get("goal", {}).get("platforms", [])
+                competitors_data = onboarding.get("competitors", {})
                 
-                if campaign_db.onboarding_data:
-                    onboarding = campaign_db.onboarding_data
-                    platforms = onboarding.get("goal", {}).get("platforms", [])
-                    competitors_data = onboarding.get("competitors", {})
+                competitors_by_platform = {}
+                for platform in platforms:
+                    # Get competitors for this platform
+                    platform_competitors = [
+                        cp for cp in competitors_data.get("platforms", [])
+                        if cp.get("platform") == platform
+                    ]
                     
-                    for platform in platforms:
-                        # Get competitors for this platform
-                        platform_competitors = [
-                            cp for cp in competitors_data.get("platforms", [])
-                            if cp.get("platform") == platform
+                    if platform_competitors and platform_competitors[0].get("urls"):
+                        competitors_by_platform[platform] = [
+                            c.get("url") if isinstance(c, dict) else c
+                            for c in platform_competitors[0]["urls"]
                         ]
-                        
-                        if platform_competitors and platform_competitors[0].get("urls"):
-                            print(f"      📊 Analyzing {len(platform_competitors[0]['urls'])} competitors on {platform}...")
-                            
-                            platform_patterns = []
-                            for competitor_url in platform_competitors[0]["urls"]:
-                                try:
-                                    forensics_result = self.forensics_agent.analyze_competitor(
-                                        platform=platform,
-                                        competitor_url=competitor_url.get("url") if isinstance(competitor_url, dict) else competitor_url
-                                    )
-                                    platform_patterns.append(forensics_result.model_dump())
-                                    self.gemini_call_count += 1
-                                except Exception as forensics_error:
-                                    print(f"         ⚠️  Competitor analysis failed: {str(forensics_error)[:80]}")
-                                    continue
-                            
-                            if platform_patterns:
-                                forensics_output[platform] = {
-                                    "status": "completed",
-                                    "patterns": platform_patterns
-                                }
+                
+                pending = {p: urls for p, urls in competitors_by_platform.items() if p not in forensics_done}
+                if len(pending) < len(competitors_by_platform):
+                    print(f"      ♻️  {len(competitors_by_platform) - len(pending)} platform(s) restored from checkpoint")
+                
+                if pending:
+                    # Warm competitors come from the shared snapshot store; stale ones are
+                    # served now and refreshed in the background
+                    prefetched, stale = await load_competitor_items(db, pending)
+                    total = sum(len(urls) for urls in pending.values())
+                    print(f"      📊 {total} competitors across {len(pending)} platform(s): "
+                          f"{len(prefetched)} from snapshots ({len(stale)} stale), {total - len(prefetched)} to fetch...")
+                    
+                    # Remaining competitors fetched concurrently; channel IDs already in
+                    # the shared resolution index skip the search.list lookup
+                    to_fetch = {
+                        p: [url for url in urls if (p, url) not in prefetched]
+                        for p, urls in pending.items()
+                    }
+                    await preload_channel_resolutions(db, to_fetch)
+                    fetched = await self.forensics_agent.fetch_competitors_async(pending, prefetched)
+                    try:
+                        # Savepoint: a failed upsert must not abort the workflow transaction
+                        async with db.begin_nested():
+                            await save_snapshots(db, fetched.values())
+                            await persist_resolutions(db)
+                    except Exception as snapshot_error:
+                        print(f"      ⚠️  Could not save competitor snapshots: {str(snapshot_error)[:80]}")
+                    
+                    items = dict(prefetched)
+                    items.update({ref: f.items for ref, f in fetched.items() if f is not None})
+                    self._enqueue_snapshot_refresh(stale)
+                    
+                    # One Gemini call per platform
+                    platform_results = await self.forensics_agent.analyze_fetched_async(pending, items)
+                    for platform, forensics_result in platform_results.items():
+                        if forensics_result is None:
+                            continue
+                        forensics_done[platform] = forensics_result.model_dump()
+                        self.gemini_call_count += 1
+                    await self._save_checkpoint(db, campaign_db, checkpoint)
+                
+                forensics_output = {
+                    platform: {
+                        "status": "completed",
+                        "patterns": [forensics_done[platform]],
+                        "competitors": competitors_by_platform[platform]
+                    }
+                    for platform in competitors_by_platform
+                    if platform in forensics_done
+                }
                 
                 campaign_db.forensics_output = forensics_output
                 print("      ✅ Forensics analysis complete")
                 
-                if progress_callback:
-                    progress_callback(50, "Forensics analysis complete")
+                progress.complete_stage("Forensics analysis complete")
             else:
-                if progress_callback:
-                    progress_callback(50, "Forensics skipped")
+                progress.start_stage("forensics", message="Forensics skipped")
+                progress.complete_stage("Forensics skipped")
             
             # STEP 3: Planner Agent (required)
-            print("\n[3/4] 📋 Executing Planner Agent...")
-            
-            try:
-                onboarding = campaign_db.onboarding_data or {}
-                goal_data = onboarding.get("goal", {})
-                
-                # Extract forensics by platform
-                forensics_yt = None
-                forensics_x = None
-                if campaign_db.forensics_output:
-                    forensics_yt = campaign_db.forensics_output.get("youtube")
-                    forensics_x = campaign_db.forensics_output.get("twitter")
-                
-                # Import goal model for planner
-                from ...models.campaign.campaign import CampaignGoal
-                goal_obj = CampaignGoal(**goal_data) if goal_data else None
-                
-                planner_output = self.planner_agent.create_plan(
-                    goal=goal_obj,
-                    strategy=campaign_db.strategy_output or {},
-                    forensics_yt=forensics_yt,
-                    forensics_x=forensics_x,
-                    content_intensity=goal_data.get("intensity", "moderate"),
-                    past_learnings=past_learnings
-                )
-                
-                campaign_db.campaign_plan = planner_output.model_dump()
-                self.gemini_call_count += 1
-                duration = goal_data.get("duration_days", 3)
-                print(f"      ✅ {duration}-day campaign plan created")
-                
-                if progress_callback:
-                    progress_callback(66, f"{duration}-day campaign plan created")
+            goal_data = onboarding.get("goal", {})
+            progress.start_stage("planner", message="Planning campaign...")
+            if checkpoint.get("planner"):
+                print("\n[3/4] 📋 Planner Agent already complete (checkpoint)")
+            else:
+                print("\n[3/4] 📋 Executing Planner Agent...")
                 
-            except Exception as planner_error:
-                print(f"      ❌ Planner failed: {str(planner_error)[:100]}")
-                campaign_db.campaign_plan = {"error": str(planner_error)[:200]}
+                try:
+                    # Extract forensics by platform
+                    forensics_yt = None
+                    forensics_x = None
+                    if campaign_db.forensics_output:
+                        forensics_yt = campaign_db.forensics_output.get("youtube")
+                        forensics_x = campaign_db.forensics_output.get("twitter")
+                    
+                    # Import goal model for planner
+                    from ...models.campaign.campaign import CampaignGoal
+                    goal_obj = CampaignGoal(**goal_data) if goal_data else None
+                    
+                    planner_output = await self.planner_agent.create_plan_async(
+                        goal=goal_obj,
+                        strategy=campaign_db.strategy_output or {},
+                        forensics_yt=forensics_yt,
+                        forensics_x=forensics_x,
+                        content_intensity=goal_data.get("intensity", "moderate"),
+                        past_learnings=past_learnings
+                    )
+                    
+                    campaign_db.campaign_plan = planner_output.model_dump()
+                    self.gemini_call_count += 1
+                    checkpoint["planner"] = True
+                    await self._save_checkpoint(db, campaign_db, checkpoint)
+                    duration = goal_data.get("duration_days", 3)
+                    print(f"      ✅ {duration}-day campaign plan created")
+                    
+                except Exception as planner_error:
+                    print(f"      ❌ Planner failed: {str(planner_error)[:100]}")
+                    campaign_db.campaign_plan = {"error": str(planner_error)[:200]}
+            
+            progress.complete_stage(f"{goal_data.get('duration_days', 3)}-day campaign plan created")
             
             # Reality check (optional)
-            onboarding = campaign_db.onboarding_data or {}
             if onboarding.get("goal", {}).get("duration_days", 3) < 7:
                 campaign_db.content_warnings = {
                     "warning": "Short campaign duration may limit results",
@@ -293,93 +341,129 @@ class AgentOrchestrator:
                 }
             
             # STEP 4: Content Agent (required)
-            duration_days = onboarding.get("goal", {}).get("duration_days", 3)
-            print(f"\n[4/4] ✍️  Executing Content Agent ({duration_days} days)...")
+            goal = onboarding.get("goal", {})
+            duration_days = goal.get("duration_days", 3)
+            # One row per (day, platform), all written from the same Content Agent call
+            platforms = content_platforms(goal.get("platforms"))
+            print(f"\n[4/4] ✍️  Executing Content Agent ({duration_days} days, {', '.join(platforms)})...")
             
-            # Import DailyContentDB for saving
             from ...models.db.campaign import DailyContentDB
-            import uuid
             
-            for day in range(1, duration_days + 1):
-                print(f"\n      📅 Day {day}/{duration_days}:")
+            # Rows written by a previous run are resumed as column dicts and upserted back
+            result = await db.execute(
+                select(*(getattr(DailyContentDB, column) for column in DAILY_CONTENT_COLUMNS))
+                .where(DailyContentDB.campaign_id == campaign_id)
+            )
+            # {day: {platform: row}}
+            existing_rows: Dict[int, Dict[str, Dict[str, Any]]] = {}
+            for row in result.mappings().all():
+                existing_rows.setdefault(row["day_number"], {})[row["platform"]] = dict(row)
+            
+            def has_all_platforms(day: int) -> bool:
+                return set(platforms).issubset(existing_rows.get(day, {}))
+            
+            # {day: [completed stages]}; complete days from runs that predate checkpoints count as finished
+            days_done = checkpoint.setdefault("days", {})
+            for day_number in existing_rows:
+                if has_all_platforms(day_number):
+                    days_done.setdefault(str(day_number), list(DAY_STAGES))
+            
+            pending_days = [
+                day for day in range(1, duration_days + 1)
+                if not set(DAY_STAGES).issubset(days_done.get(str(day), []))
+            ]
+            if len(pending_days) < duration_days:
+                print(f"      ♻️  {duration_days - len(pending_days)} day(s) restored from checkpoint")
+            
+            # Units are days; restored days count as done. Days finish out of order
+            # within a wave, so progress counts completions rather than day numbers.
+            progress.start_stage("content", total_units=duration_days, message=f"Generating content for {duration_days} days...")
+            progress.advance(duration_days - len(pending_days))
+            
+            def announce_title(day: int):
+                """Stream a day's title to progress as soon as the model has written it."""
+                def on_field(name: str, value) -> None:
+                    if name == "title" and value:
+                        progress.note(f"Day {day}/{duration_days}: drafting \"{value}\"")
+                return on_field
+            
+            def announce_batch_day(name: str, value) -> None:
+                if name.startswith("days[") and getattr(value, "title", None):
+                    progress.note(f"Day {value.day_number}/{duration_days}: drafting \"{value.title}\"")
+            
+            async def generate_day(day: int, content_output=None):
+                outcome = await self._generate_day_content(
+                    campaign_id=campaign_id,
+                    campaign_plan=campaign_db.campaign_plan,
+                    profile_snapshot=profile_snapshot,
+                    onboarding=onboarding,
+                    day=day,
+                    duration_days=duration_days,
+                    platforms=platforms,
+                    existing_rows=existing_rows.get(day),
+                    completed_stages=days_done.get(str(day), []),
+                    content_output=content_output,
+                    on_content_field=announce_title(day)
+                )
+                progress.advance(message=f"Day {day}/{duration_days} content generated")
+                return outcome
+            
+            # Fan out days in waves; each day runs content → thumbnail → SEO. A wave
+            # is up to CONTENT_GENERATION_CONCURRENCY full content batches (K days per
+            # call), so batching isn't capped by the wave size, and at most
+            # CONTENT_GENERATION_CONCURRENCY days run thumbnail/SEO at once. Each
+            # wave's rows are written in one upsert and committed together with its
+            # stage markers, so a failure loses at most one wave of work and a retry
+            # updates rather than duplicates rows.
+            concurrency = max(1, CONTENT_GENERATION_CONCURRENCY)
+            batch_size = self.content_agent.batch_size(
+                {day: self._day_plan(campaign_db.campaign_plan, day) for day in pending_days},
+                profile_snapshot, platforms
+            ) if pending_days else 1
+            wave_size = batch_size * concurrency
+            day_slots = asyncio.Semaphore(concurrency)
+            
+            async def generate_day_bounded(day: int, content_output=None):
+                async with day_slots:
+                    return await generate_day(day, content_output)
+            
+            for wave_start in range(0, len(pending_days), wave_size):
+                wave = pending_days[wave_start:wave_start + wave_size]
                 
-                # Prepare day plan (from planner output)
-                day_plan = {}
-                if campaign_db.campaign_plan:
-                    if isinstance(campaign_db.campaign_plan, dict):
-                        day_plan = campaign_db.campaign_plan.get(f"day_{day}", {})
+                # Content for the wave's new days comes from batched calls (K days
+                # per call); a day missing from its batch is generated on its own
+                needs_content = [
+                    day for day in wave
+                    if "content" not in days_done.get(str(day), []) or not has_all_platforms(day)
+                ]
+                batched = await self._generate_content_batches(
+                    needs_content, campaign_db.campaign_plan, profile_snapshot, goal, duration_days,
+                    platforms=platforms, on_field=announce_batch_day, batch_size=batch_size
+                )
                 
-                # Generate actual content using ContentAgent
-                try:
-                    content_output = self.content_agent.generate_content(
-                        day_plan=day_plan,
-                        creator_context=profile_snapshot,
-                        day_number=day,
-                        duration_days=duration_days,
-                        content_intensity=onboarding.get("goal", {}).get("intensity", "moderate"),
-                        goal_type=onboarding.get("goal", {}).get("goal_type", "growth")
-                    )
-                    
-                    # Save to DailyContentDB
-                    daily_content_db = DailyContentDB(
-                        content_id=str(uuid.uuid4()),
-                        campaign_id=campaign_id,
-                        day_number=day,
-                        platform="youtube",  # Default platform
-                        video_script=content_output.youtube_script,
-                        video_title=content_output.title,
-                        seo_tags=content_output.seo_tags or [],
-                        call_to_action=content_output.cta,
-                        thumbnail_urls={}
-                    )
-                    
-                    db.add(daily_content_db)
-                    self.gemini_call_count += 1
-                    print(f"         ✓ Content generated")
-                    
-                    # Image Generation (if enabled)
-                    if onboarding.get("image_generation_enabled", True):
-                        print(f"         🎨 Generating thumbnail...")
-                        try:
-                            content_dict = {
-                                "youtube_title": content_output.title,
-                                "youtube_script": content_output.youtube_script
-                            }
-                            image_url = await self.generate_image_for_content(content_dict)
-                            if image_url:
-                                daily_content_db.thumbnail_urls = {"youtube": image_url}
-                                print(f"         ✓ Thumbnail generated ({len(image_url)} bytes)")
-                            else:
-                                print(f"         ⚠️  Thumbnail generation returned None")
-                        except Exception as img_error:
-                            print(f"         ⚠️  Thumbnail failed: {str(img_error)[:50]}")
-                    
-                    # SEO Optimization (if enabled)
-                    if onboarding.get("seo_optimization_enabled", True):
-                        print(f"         🔍 Optimizing SEO...")
-                        try:
-                            content_dict = {
-                                "youtube_title": daily_content_db.video_title,
-                                "youtube_seo_tags": daily_content_db.seo_tags
-                            }
-                            optimized_content = await self.optimize_content_seo(content_dict)
-                            if optimized_content and 'youtube_seo_tags' in optimized_content:
-                                daily_content_db.seo_tags = optimized_content['youtube_seo_tags']
-                            print(f"         ✓ SEO optimized")
-                        except Exception as seo_error:
-                            print(f"         ⚠️  SEO optimization failed: {str(seo_error)[:50]}")
-                    
-                except Exception as content_error:
-                    print(f"         ❌ Content generation failed: {str(content_error)[:100]}")
-                    continue
+                day_results = await asyncio.gather(*(
+                    generate_day_bounded(day, batched.get(day)) for day in wave
+                ))
+                
+                wave_rows = []
+                for day, (rows, stages) in zip(wave, day_results):
+                    if rows is None:
+                        continue
+                    wave_rows.extend(rows.values())
+                    existing_rows[day] = rows
+                    days_done[str(day)] = stages
+                
+                await upsert_daily_content(db, wave_rows)
+                await self._save_checkpoint(db, campaign_db, checkpoint)
             
             # Save campaign updates
             campaign_db.updated_at = datetime.now(timezone.utc)
             await db.commit()
             
-            # Count generated content
+            # Count days with generated content (rows are per day and platform)
             result = await db.execute(
-                select(func.count(DailyContentDB.content_id)).where(DailyContentDB.campaign_id == campaign_id)
+                select(func.count(func.distinct(DailyContentDB.day_number)))
+                .where(DailyContentDB.campaign_id == campaign_id)
             )
             content_count = result.scalar() or 0
             
@@ -389,8 +473,7 @@ class AgentOrchestrator:
             print(f"📅 Content generated for {content_count} days")
             print("="*60 + "\n")
             
-            if progress_callback:
-                progress_callback(100, f"Workflow complete - {content_count} days generated")
+            progress.finish(f"Workflow complete - {content_count} days generated")
             
         except Exception as e:
             print(f"\n❌ Campaign workflow failed: {e}")
@@ -400,11 +483,230 @@ class AgentOrchestrator:
             await db.commit()
             raise
     
+    async def _save_checkpoint(self, db: AsyncSession, campaign_db: CampaignDB, checkpoint: Dict[str, Any]) -> None:
+        """Persist stage markers (and any pending agent output) so a retry can resume here."""
+        campaign_db.workflow_checkpoint = checkpoint
+        # The dict is mutated in place between saves; JSONB columns don't track that
+        flag_modified(campaign_db, "workflow_checkpoint")
+        campaign_db.updated_at = datetime.now(timezone.utc)
+        await db.commit()
+    
+    @staticmethod
+    def _enqueue_snapshot_refresh(stale) -> None:
+        """Queue background refreshes for stale competitor snapshots (best effort)."""
+        if not stale:
+            return
+        try:
+            from ...tasks.competitor_tasks import refresh_competitor_snapshot_task
+            for platform, competitor_url in stale:
+                refresh_competitor_snapshot_task.delay(platform, competitor_url)
+        except Exception as e:
+            # Stale data was already served; a missed refresh only delays the update
+            print(f"      ⚠️  Could not enqueue competitor snapshot refresh: {str(e)[:80]}")
+    
+    @staticmethod
+    def _describe_checkpoint(checkpoint: Dict[str, Any]) -> str:
+        """Short human-readable summary of completed stages."""
+        parts = []
+        if checkpoint.get("strategy"):
+            parts.append("strategy")
+        forensics_platforms = list(checkpoint.get("forensics", {}))
+        if forensics_platforms:
+            parts.append(f"forensics ({', '.join(forensics_platforms)})")
+        if checkpoint.get("planner"):
+            parts.append("planner")
+        days = [d for d, stages in checkpoint.get("days", {}).items() if set(DAY_STAGES).issubset(stages)]
+        if days:
+            parts.append(f"{len(days)} day(s) of content")
+        return ", ".join(parts) or "nothing completed"
+    
+    @staticmethod
+    def _day_plan(campaign_plan: Optional[Dict[str, Any]], day: int) -> Dict[str, Any]:
+        """Day plan from planner output ({} if missing)."""
+        if campaign_plan and isinstance(campaign_plan, dict):
+            return campaign_plan.get(f"day_{day}", {})
+        return {}
+    
+    async def _generate_content_batches(
+        self,
+        days: List[int],
+        campaign_plan: Optional[Dict[str, Any]],
+        profile_snapshot: Dict[str, Any],
+        goal: Dict[str, Any],
+        duration_days: int,
+        platforms: Optional[List[str]] = None,
+        on_field=None,
+        batch_size: Optional[int] = None
+    ) -> Dict[int, Any]:
+        """
+        Generate content for several days with batched Content Agent calls.
+        
+        Days are split into batches sized to the context window (or of
+        batch_size days) and up to CONTENT_GENERATION_CONCURRENCY batches run
+        concurrently. Returns {day: ContentAgentOutput} for the days that
+        came back; the rest fall back to per-day calls.
+        """
+        if len(days) < 2:
+            return {}
+        day_plans = {day: self._day_plan(campaign_plan, day) for day in days}
+        if batch_size is None:
+            batch_size = self.content_agent.batch_size(day_plans, profile_snapshot, platforms)
+        if batch_size < 2:
+            return {}
+        
+        batches = [days[i:i + batch_size] for i in range(0, len(days), batch_size)]
+        batch_slots = asyncio.Semaphore(max(1, CONTENT_GENERATION_CONCURRENCY))
+        
+        async def generate_batch(batch: List[int]):
+            async with batch_slots:
+                return await self.content_agent.generate_content_batch_async(
+                    day_plans={day: day_plans[day] for day in batch},
+                    creator_context=profile_snapshot,
+                    duration_days=duration_days,
+                    content_intensity=goal.get("intensity", "moderate"),
+                    goal_type=goal.get("goal_type", "growth"),
+                    on_field=on_field,
+                    platforms=platforms
+                )
+        
+        batch_results = await asyncio.gather(*(generate_batch(batch) for batch in batches))
+        self.gemini_call_count += len(batches)
+        
+        generated = {}
+        for results in batch_results:
+            generated.update(results)
+        print(f"      📦 Days {days[0]}-{days[-1]}: {len(generated)}/{len(days)} generated in {len(batches)} batched call(s)")
+        return generated
+    
+    async def _generate_day_content(
+        self,
+        campaign_id: str,
+        campaign_plan: Optional[Dict[str, Any]],
+        profile_snapshot: Dict[str, Any],
+        onboarding: Dict[str, Any],
+        day: int,
+        duration_days: int,
+        platforms: Optional[List[str]] = None,
+        existing_rows: Optional[Dict[str, Dict[str, Any]]] = None,
+        completed_stages: Optional[List[str]] = None,
+        content_output=None,
+        on_content_field=None
+    ):
+        """
+        Generate content for every platform, thumbnail and SEO for a single day.
+        
+        One Content Agent call covers all platforms. Stages already in
+        completed_stages are skipped, and existing_rows (the day's
+        {platform: columns} from a previous run) are carried forward instead
+        of starting over. content_output (from a batched call) replaces the
+        per-day content call; otherwise on_content_field receives the content
+        fields as they stream in. Thumbnail and SEO apply to the YouTube row.
+        
+        Returns (rows, completed_stages), where rows is {platform: daily_content
+        columns (DAILY_CONTENT_COLUMNS)} for upsert_daily_content. rows is
+        None if content generation failed; failures are contained to the day
+        so other days still complete.
+        """
+        goal = onboarding.get("goal", {})
+        platforms = platforms or ["youtube"]
+        stages = list(completed_stages or [])
+        rows = {
+            platform: dict(row) for platform, row in (existing_rows or {}).items()
+            if platform in platforms
+        }
+        
+        if "content" not in stages or not set(platforms).issubset(rows):
+            if content_output is None:
+                try:
+                    content_output = await self.content_agent.generate_content_async(
+                        day_plan=self._day_plan(campaign_plan, day),
+                        creator_context=profile_snapshot,
+                        day_number=day,
+                        duration_days=duration_days,
+                        content_intensity=goal.get("intensity", "moderate"),
+                        goal_type=goal.get("goal_type", "growth"),
+                        on_field=on_content_field,
+                        platforms=platforms
+                    )
+                    self.gemini_call_count += 1
+                except Exception as content_error:
+                    print(f"      ❌ Day {day}/{duration_days}: content generation failed: {str(content_error)[:100]}")
+                    return None, stages
+            
+            rows = {
+                platform: self._content_row(campaign_id, day, platform, content_output)
+                for platform in platforms
+            }
+            stages = ["content"]
+            print(f"      📅 Day {day}/{duration_days}: ✓ Content generated ({', '.join(platforms)})")
+        
+        row = rows.get("youtube")
+        
+        # Image Generation (if enabled)
+        if "thumbnail" not in stages:
+            if row is None or not onboarding.get("image_generation_enabled", True):
+                stages.append("thumbnail")
+            else:
+                try:
+                    content_dict = {
+                        "youtube_title": row["video_title"],
+                        "youtube_script": row["video_script"]
+                    }
+                    image_key = await self.generate_image_for_content(content_dict)
+                    if image_key:
+                        # Blob key only; the URL is built at read time
+                        row["thumbnail_urls"] = {"youtube": image_key}
+                        stages.append("thumbnail")
+                        print(f"      📅 Day {day}/{duration_days}: ✓ Thumbnail generated ({image_key})")
+                    else:
+                        print(f"      📅 Day {day}/{duration_days}: ⚠️  Thumbnail generation returned None")
+                except Exception as img_error:
+                    print(f"      📅 Day {day}/{duration_days}: ⚠️  Thumbnail failed: {str(img_error)[:50]}")
+        
+        # SEO Optimization (if enabled)
+        if "seo" not in stages:
+            if row is None or not onboarding.get("seo_optimization_enabled", True):
+                stages.append("seo")
+            else:
+                try:
+                    content_dict = {
+                        "youtube_title": row["video_title"],
+                        "youtube_seo_tags": row["seo_tags"]
+                    }
+                    optimized_content = await self.optimize_content_seo(content_dict)
+                    if optimized_content and 'youtube_seo_tags' in optimized_content:
+                        row["seo_tags"] = optimized_content['youtube_seo_tags']
+                    stages.append("seo")
+                    print(f"      📅 Day {day}/{duration_days}: ✓ SEO optimized")
+                except Exception as seo_error:
+                    print(f"      📅 Day {day}/{duration_days}: ⚠️  SEO optimization failed: {str(seo_error)[:50]}")
+        
+        return rows, stages
+    
+    @staticmethod
+    def _content_row(campaign_id: str, day: int, platform: str, content_output) -> Dict[str, Any]:
+        """A platform's daily_content columns (DAILY_CONTENT_COLUMNS) from a ContentAgentOutput."""
+        row = dict.fromkeys(DAILY_CONTENT_COLUMNS)
+        row.update(campaign_id=campaign_id, day_number=day, platform=platform, seo_tags=[], thumbnail_urls={})
+        if platform == "youtube":
+            row.update(
+                video_script=content_output.youtube_script,
+                video_title=content_output.title,
+                seo_tags=content_output.seo_tags or [],
+                call_to_action=content_output.cta
+            )
+        elif platform == "twitter":
+            tweet = content_output.x_tweet
+            row.update(
+                tweet_text=tweet[:MAX_TWEET_LENGTH] if tweet else None,
+                thread_tweets=content_output.x_thread or None
+            )
+        return row
+    
     async def generate_image_for_content(self, content: Dict[str, Any]) -> Optional[str]:
-        """Generate thumbnail image for content using ImageService."""
+        """Generate thumbnail image for content using ImageService (returns its blob key)."""
         try:
-            from ..ai.image_service import ImageService
-            image_service = ImageService()
+            image_service = container.image
             
             # Extract title and hook from content (using correct field names)
             title = content.get("youtube_title", "Content thumbnail")
@@ -413,8 +715,7 @@ class AgentOrchestrator:
             hook = script[:200] if script else "YouTube content"
             
             # Generate thumbnail
-            image_url = await image_service.generate_thumbnail(title, hook, platform="YouTube")
-            return image_url
+            return await image_service.generate_thumbnail(title, hook, platform="YouTube")
         except Exception as e:
             print(f"Image generation failed: {e}")
             return None
@@ -422,8 +723,7 @@ class AgentOrchestrator:
     async def optimize_content_seo(self, content: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize content for SEO using SEOService."""
         try:
-            from ..ai.seo_service import SEOService
-            seo_service = SEOService()
+            seo_service = container.seo
             
             # Extract title and description from content
             title = content.get("title", "")
@@ -569,7 +869,8 @@ class AgentOrchestrator:
                 creator_context=creator_context_for_content,
                 day_number=day,
                 duration_days=duration_days,
-                content_intensity=campaign.content_intensity
+                content_intensity=campaign.content_intensity,
+                platforms=content_platforms(getattr(campaign.goal, 'platforms', None))
             )
             
             daily_content = DailyContent(
@@ -577,7 +878,9 @@ class AgentOrchestrator:
                 youtube_script=content_output.youtube_script,
                 youtube_title=content_output.title,
                 youtube_seo_tags=content_output.seo_tags,
-                youtube_cta=content_output.cta
+                youtube_cta=content_output.cta,
+                x_tweet=content_output.x_tweet,
+                x_thread=content_output.x_thread
             )
             
             campaign.daily_content[day] = daily_content
@@ -629,7 +932,8 @@ class AgentOrchestrator:
                 creator_context=creator_context,
                 day_number=day,
                 duration_days=duration_days,
-                content_intensity=campaign.content_intensity
+                content_intensity=campaign.content_intensity,
+                platforms=content_platforms(getattr(campaign.goal, 'platforms', None))
             )
             
             daily_content = DailyContent(
@@ -637,7 +941,9 @@ class AgentOrchestrator:
                 youtube_script=content_output.youtube_script,
                 youtube_title=content_output.title,
                 youtube_seo_tags=content_output.seo_tags,
-                youtube_cta=content_output.cta
+                youtube_cta=content_output.cta,
+                x_tweet=content_output.x_tweet,
+                x_thread=content_output.x_thread
             )
             
             campaign.daily_content[day] = daily_content
@@ -666,14 +972,15 @@ class AgentOrchestrator:
             campaign: Campaign Pydantic model
             actual_metrics: Actual performance metrics
             db: Database session
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates (progress, message, details=...)
         """
+        progress = ProgressReporter(progress_callback, (("outcome", 1),))
+        
         # Allow both IN_PROGRESS and GENERATING_REPORT status
         if campaign.status not in [CampaignStatus.IN_PROGRESS, CampaignStatus.GENERATING_REPORT]:
             raise ValueError(f"Campaign must be in progress or generating report to analyze outcome. Current status: {campaign.status}")
         
-        if progress_callback:
-            progress_callback(50, "Analyzing campaign outcomes...")
+        progress.start_stage("outcome", message="Analyzing campaign outcomes...")
         
         # Convert daily_execution to dict for prompt
         daily_execution_dict = {
@@ -684,7 +991,7 @@ class AgentOrchestrator:
         # Extract goal from onboarding_data (Pydantic model)
         goal_dict = campaign.onboarding_data.goal.model_dump() if campaign.onboarding_data and campaign.onboarding_data.goal else {}
         
-        outcome = self.outcome_agent.analyze_outcome(
+        outcome = await self.outcome_agent.analyze_outcome_async(
             goal_dict,
             actual_metrics,
             campaign.campaign_plan or {},
@@ -705,8 +1012,7 @@ class AgentOrchestrator:
         campaign.status = CampaignStatus.COMPLETED
         self.gemini_call_count += 1
         
-        if progress_callback:
-            progress_callback(100, "Outcome report complete")
+        progress.finish("Outcome report complete")
         
         # Save learning memory for future campaigns
         await self._save_learning_memory(campaign, outcome, db)
@@ -715,9 +1021,6 @@ class AgentOrchestrator:
     
     async def _save_learning_memory(self, campaign: Campaign, outcome, db: AsyncSession) -> None:
         """Save campaign outcome as learning memory for future campaigns."""
-        from ...models.campaign.learning_memory import LearningMemory
-        import uuid
-        
         if not campaign.onboarding_data:
             return
         
@@ -740,9 +1043,9 @@ class AgentOrchestrator:
             else:
                 goal_summary = str(outcome.goal_vs_result)
         
-        # Create learning memory in database
-        learning_db = LearningMemoryDB(
-            memory_id=str(uuid.uuid4()),
+        # Stored with its term vector; the user's cached learnings are invalidated
+        learning_db = await save_learning_memory(
+            db,
             user_id=campaign.user_id,
             campaign_id=campaign.campaign_id,
             goal_type=goal.goal_type if goal else "growth",
@@ -755,9 +1058,6 @@ class AgentOrchestrator:
             recommendations=outcome.next_campaign_suggestions or [],
             goal_achievement_summary=goal_summary
         )
-        
-        db.add(learning_db)
-        await db.commit()
         print(f"      💡 Learning memory saved: {learning_db.memory_id}")
     
     def reset_call_count(self):
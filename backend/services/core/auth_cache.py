@@ -0,0 +1,158 @@
+"""Auth hot-path caches for get_current_user_id.
+
+- VerifiedTokenCache: token -> user_id for tokens that already passed
+  signature verification and user lookup. Entries never outlive the
+  token's exp claim, and live at most AUTH_TOKEN_CACHE_TTL seconds so a
+  revoked Clerk session stops working quickly. The cache is per process:
+  invalidate_user() (user.deleted webhook) only clears the worker that
+  received the webhook, so other uvicorn workers keep accepting a deleted
+  user's cached tokens for up to AUTH_TOKEN_CACHE_TTL seconds.
+- LastLoginRecorder: last_login_at updates coalesced in memory and
+  written in one batched UPDATE per interval, so authenticated reads
+  don't open a write transaction.
+"""
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, update
+
+from ...config import AUTH_TOKEN_CACHE_TTL, AUTH_TOKEN_CACHE_MAX_ENTRIES, LAST_LOGIN_FLUSH_INTERVAL
+from ...database.session import AsyncSessionLocal
+from ...models.db.user import UserDB
+
+logger = logging.getLogger(__name__)
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified tokens (keyed by SHA-256, raw tokens aren't kept)."""
+
+    def __init__(self, ttl: int = AUTH_TOKEN_CACHE_TTL, max_entries: int = AUTH_TOKEN_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # token hash -> (user_id, clerk_user_id, expires_at)
+        self._entries: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[str]:
+        """user_id for a still-valid verified token, else None."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user_id, _, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user_id
+
+    def put(self, token: str, user_id: str, clerk_user_id: str, token_exp: Optional[float]) -> None:
+        """Remember a verified token until min(exp, now + ttl)."""
+        expires_at = time.time() + self.ttl
+        if token_exp:
+            expires_at = min(expires_at, float(token_exp))
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            self._entries[self._key(token)] = (user_id, clerk_user_id, expires_at)
+            self._entries.move_to_end(self._key(token))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, clerk_user_id: str) -> None:
+        """Drop every cached token for a Clerk user (e.g. user.deleted webhook)."""
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if entry[1] == clerk_user_id]:
+                del self._entries[key]
+
+
+class LastLoginRecorder:
+    """Coalesces last_login_at per user and flushes them in batches."""
+
+    def __init__(self, interval: int = LAST_LOGIN_FLUSH_INTERVAL):
+        self.interval = interval
+        self._pending: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def touch(self, user_id: str) -> None:
+        """Record activity for a user (memory only)."""
+        with self._lock:
+            self._pending[user_id] = datetime.now(timezone.utc)
+
+    def pending_for(self, user_id: str) -> Optional[datetime]:
+        """Unflushed last_login_at for a user, if any."""
+        with self._lock:
+            return self._pending.get(user_id)
+
+    async def flush(self) -> int:
+        """
+        Write pending timestamps in one executemany UPDATE.
+
+        Returns:
+            Number of users updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        users = UserDB.__table__
+        stmt = (
+            update(users)
+            .where(users.c.user_id == bindparam("b_user_id"))
+            .values(last_login_at=bindparam("b_last_login_at"))
+        )
+        try:
+            async with AsyncSessionLocal() as session:
+                connection = await session.connection()
+                await connection.execute(
+                    stmt,
+                    [{"b_user_id": user_id, "b_last_login_at": ts} for user_id, ts in pending.items()],
+                )
+                await session.commit()
+        except Exception as e:
+            # Put them back (newer touches win) and retry next interval
+            with self._lock:
+                for user_id, ts in pending.items():
+                    self._pending.setdefault(user_id, ts)
+            logger.warning(f"last_login_at flush failed for {len(pending)} user(s): {e}")
+            return 0
+        return len(pending)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the periodic flush on the running event loop (app startup)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write whatever is pending (app shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+# Module-level singletons shared by every request in the process
+verified_token_cache = VerifiedTokenCache()
+last_login_recorder = LastLoginRecorder()
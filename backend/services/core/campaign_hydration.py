@@ -0,0 +1,106 @@
+"""Campaign hydration - load a campaign and its day rows together.
+
+The campaign row comes back with its daily_content and daily_execution
+children attached (selectin loading: one IN-query per child table,
+issued by the ORM in the same call), so read paths never run per-table
+follow-up queries. Callers pick a content projection to avoid pulling
+scripts and thumbnails when they only need titles or day presence.
+"""
+from typing import Optional, Sequence
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, noload, selectinload
+
+from ...models.db.campaign import CampaignDB, DailyContentDB
+
+
+# Content projections (None = every column)
+FULL_CONTENT = None
+# Everything except the large text/JSON fields (outcome analysis, summaries)
+CONTENT_WITHOUT_MEDIA = (
+    DailyContentDB.day_number,
+    DailyContentDB.platform,
+    DailyContentDB.video_title,
+    DailyContentDB.seo_tags,
+    DailyContentDB.call_to_action,
+    DailyContentDB.tweet_text,
+    DailyContentDB.thread_tweets,
+)
+# Just enough to know which days have content (schedule view)
+CONTENT_PRESENCE = (
+    DailyContentDB.day_number,
+    DailyContentDB.platform,
+)
+
+
+def campaign_load_options(
+    content_columns: Optional[Sequence] = FULL_CONTENT,
+    include_content: bool = True,
+    include_execution: bool = True
+) -> list:
+    """Loader options for select(CampaignDB) that attach the requested children."""
+    options = []
+    if include_content:
+        content_loader = selectinload(CampaignDB.daily_content)
+        if content_columns is not None:
+            # campaign_id too: the ORM needs it to cascade deletes/flushes through the parent
+            content_loader = content_loader.options(
+                load_only(DailyContentDB.campaign_id, *content_columns, raiseload=True)
+            )
+        options.append(content_loader)
+    else:
+        options.append(noload(CampaignDB.daily_content))
+
+    if include_execution:
+        options.append(selectinload(CampaignDB.daily_execution))
+    else:
+        options.append(noload(CampaignDB.daily_execution))
+    return options
+
+
+async def load_campaign(
+    db: AsyncSession,
+    campaign_id: str,
+    content_columns: Optional[Sequence] = FULL_CONTENT,
+    include_content: bool = True,
+    include_execution: bool = True
+) -> Optional[CampaignDB]:
+    """
+    Load a campaign with its day rows attached.
+
+    Args:
+        db: Database session
+        campaign_id: Campaign UUID
+        content_columns: DailyContentDB columns to load (FULL_CONTENT,
+            CONTENT_WITHOUT_MEDIA, CONTENT_PRESENCE or a custom tuple)
+        include_content: Attach daily_content
+        include_execution: Attach daily_execution
+
+    Returns:
+        CampaignDB or None if not found
+    """
+    result = await db.execute(
+        select(CampaignDB)
+        .where(CampaignDB.campaign_id == campaign_id)
+        .options(*campaign_load_options(content_columns, include_content, include_execution))
+        # An identity-map hit would otherwise keep a stale (or unloaded) collection
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def ensure_children_loaded(db: AsyncSession, campaign_db: CampaignDB) -> CampaignDB:
+    """Attach day rows to a campaign that was loaded without them (no-op if already loaded)."""
+    unloaded = inspect(campaign_db).unloaded
+    missing = [name for name in ("daily_content", "daily_execution") if name in unloaded]
+    if missing:
+        await db.refresh(campaign_db, attribute_names=missing)
+    return campaign_db
+
+
+def loaded_value(record, attribute: str, default=None):
+    """Attribute value, or default if the projection left it unloaded."""
+    if attribute in inspect(record).unloaded:
+        return default
+    return getattr(record, attribute)
@@ -1,11 +1,15 @@
 """Clerk authentication service for JWT verification."""
+import asyncio
+import time
 import jwt
 import httpx
-from typing import Optional, Dict
-from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Dict
 from functools import lru_cache
 
-from ...config import CLERK_SECRET_KEY, CLERK_JWKS_URL
+from ...config import (
+    CLERK_SECRET_KEY, CLERK_JWKS_URL,
+    JWKS_CACHE_TTL, JWKS_REFRESH_AHEAD, JWKS_MIN_REFRESH_INTERVAL, JWKS_MAX_STALENESS
+)
 
 
 class ClerkService:
@@ -16,28 +20,150 @@ class ClerkService:
         self.secret_key = CLERK_SECRET_KEY
         self.jwks_url = CLERK_JWKS_URL
         self._jwks_cache: Optional[Dict] = None
-        self._jwks_cache_time: Optional[datetime] = None
-        self._cache_ttl = timedelta(hours=1)  # Refresh JWKS every hour
+        self._jwks_cache_time: Optional[float] = None  # time.monotonic() of last successful fetch
+        self._cache_ttl = JWKS_CACHE_TTL
+        self._refresh_ahead = min(JWKS_REFRESH_AHEAD, JWKS_CACHE_TTL)
+        self._min_refresh_interval = JWKS_MIN_REFRESH_INTERVAL
+        self._max_staleness = JWKS_MAX_STALENESS
+        # kid -> parsed RSA public key (built once per JWKS fetch, not per request)
+        self._signing_keys: Dict[str, Any] = {}
+        # Single-flight: concurrent callers share one in-flight fetch
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._last_refresh_attempt: Optional[float] = None
+        self._rotation_task: Optional[asyncio.Task] = None
     
     async def get_jwks(self) -> Dict:
         """
         Fetch JWKS (JSON Web Key Set) from Clerk with caching.
         
+        Only the first call waits on the network. Once a key set is cached,
+        a stale or nearly-expired one is returned immediately and refreshed
+        in the background (stale-while-revalidate), with failed refreshes
+        retried at most once per min refresh interval. A key set more than
+        max staleness past its TTL is never served: callers wait for a fresh
+        fetch, and if that fails the cache is dropped and the error raised
+        so token verification fails closed.
+        
         Returns:
             Dict containing public keys for JWT verification
         """
-        # Return cached JWKS if still valid
-        if (self._jwks_cache and self._jwks_cache_time and 
-            datetime.now(timezone.utc) - self._jwks_cache_time < self._cache_ttl):
-            return self._jwks_cache
+        if self._jwks_cache is not None:
+            age = time.monotonic() - self._jwks_cache_time
+            if age < self._cache_ttl + self._max_staleness:
+                if age >= self._cache_ttl - self._refresh_ahead and self._refresh_allowed():
+                    self._start_refresh()
+                return self._jwks_cache
         
-        # Fetch fresh JWKS
+        try:
+            return await self._refresh_jwks()
+        except Exception:
+            # Don't keep verifying against keys Clerk may have revoked
+            self._jwks_cache = None
+            self._jwks_cache_time = None
+            self._signing_keys = {}
+            raise
+    
+    def _refresh_allowed(self) -> bool:
+        """Whether a non-blocking refresh may start (or join one in flight) now."""
+        in_flight = self._refresh_task is not None and not self._refresh_task.done()
+        return (
+            in_flight
+            or self._last_refresh_attempt is None
+            or time.monotonic() - self._last_refresh_attempt >= self._min_refresh_interval
+        )
+    
+    def _start_refresh(self) -> asyncio.Task:
+        """Return the in-flight JWKS fetch, starting one if none is running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._last_refresh_attempt = time.monotonic()
+            self._refresh_task = asyncio.get_running_loop().create_task(self._fetch_jwks())
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+        return self._refresh_task
+    
+    async def _refresh_jwks(self) -> Dict:
+        """Wait for the shared JWKS fetch (shielded so one cancelled caller doesn't abort it)."""
+        return await asyncio.shield(self._start_refresh())
+    
+    async def _fetch_jwks(self) -> Dict:
+        """Fetch the key set and swap in its parsed signing keys."""
         async with httpx.AsyncClient() as client:
             response = await client.get(self.jwks_url, timeout=10.0)
             response.raise_for_status()
-            self._jwks_cache = response.json()
-            self._jwks_cache_time = datetime.now(timezone.utc)
-            return self._jwks_cache
+            jwks = response.json()
+        self._signing_keys = self._parse_signing_keys(jwks)
+        self._jwks_cache = jwks
+        self._jwks_cache_time = time.monotonic()
+        return jwks
+    
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        """Keep serving the cached key set if a refresh fails."""
+        if not task.cancelled() and task.exception() is not None:
+            print(f"JWKS refresh failed: {task.exception()}")
+    
+    async def _get_signing_key(self, key_id: str) -> Optional[Any]:
+        """
+        Signing key for a kid, refreshing the key set once if it's unknown.
+        
+        Unknown kids usually mean Clerk rotated its keys. Forced refreshes
+        are rate-limited so garbage kids can't hammer the JWKS endpoint.
+        """
+        await self.get_jwks()
+        signing_key = self._signing_keys.get(key_id)
+        if signing_key is not None:
+            return signing_key
+        
+        if self._refresh_allowed():
+            try:
+                await self._refresh_jwks()
+            except Exception:
+                return None
+        return self._signing_keys.get(key_id)
+    
+    async def _rotate_keys(self) -> None:
+        """Refresh the key set shortly before it expires."""
+        while True:
+            if self._jwks_cache_time is None:
+                delay = self._min_refresh_interval
+            else:
+                expires_in = self._cache_ttl - (time.monotonic() - self._jwks_cache_time)
+                delay = max(expires_in - self._refresh_ahead, self._min_refresh_interval)
+            await asyncio.sleep(delay)
+            try:
+                await self._refresh_jwks()
+            except Exception:
+                pass  # Logged by _log_refresh_failure; retry after min interval
+    
+    def start_key_rotation(self) -> None:
+        """Start proactive background JWKS refresh on the running loop (app startup)."""
+        if self._rotation_task is None or self._rotation_task.done():
+            self._rotation_task = asyncio.get_running_loop().create_task(self._rotate_keys())
+    
+    async def stop_key_rotation(self) -> None:
+        """Stop the background JWKS refresh (app shutdown)."""
+        for task in (self._rotation_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._rotation_task = None
+        self._refresh_task = None
+    
+    @staticmethod
+    def _parse_signing_keys(jwks: Dict) -> Dict[str, Any]:
+        """Parse every JWK in the set into an RSA public key, keyed by kid."""
+        signing_keys = {}
+        for key in jwks.get("keys", []):
+            kid = key.get("kid")
+            if not kid:
+                continue
+            try:
+                signing_keys[kid] = jwt.algorithms.RSAAlgorithm.from_jwk(key)
+            except Exception as e:
+                print(f"Skipping unparseable JWK {kid}: {e}")
+        return signing_keys
     
     async def verify_token(self, token: str) -> Optional[Dict]:
         """
@@ -50,9 +176,6 @@ class ClerkService:
             Decoded token payload with user info, or None if invalid
         """
         try:
-            # Get JWKS for verification
-            jwks = await self.get_jwks()
-            
             # Decode JWT header to get key ID
             unverified_header = jwt.get_unverified_header(token)
             key_id = unverified_header.get("kid")
@@ -60,12 +183,8 @@ class ClerkService:
             if not key_id:
                 return None
             
-            # Find matching public key in JWKS
-            signing_key = None
-            for key in jwks.get("keys", []):
-                if key.get("kid") == key_id:
-                    signing_key = jwt.algorithms.RSAAlgorithm.from_jwk(key)
-                    break
+            # Find matching public key (parsed when the JWKS was fetched)
+            signing_key = await self._get_signing_key(key_id)
             
             if not signing_key:
                 return None
@@ -0,0 +1,126 @@
+"""Process-wide service container - shared, lazily constructed clients and agents.
+
+The LLM service, platform API clients and agents hold no per-request
+state (only process-level caches), so one instance of each serves every
+router, Celery task and AgentOrchestrator in the process. Nothing is
+built at import time: each service is created on first use, so API
+start-up and Celery worker boot don't pay for clients a process may
+never need.
+"""
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from ...agents.core.content_agent import ContentAgent
+    from ...agents.core.context_analyzer import ContextAnalyzer
+    from ...agents.core.outcome_agent import OutcomeAgent
+    from ...agents.core.planner_agent import PlannerAgent
+    from ...agents.core.strategy_agent import StrategyAgent
+    from ...agents.platform.forensics_agent import ForensicsAgent
+    from ..ai.gemini_service import GeminiService
+    from ..ai.image_service import ImageService
+    from ..ai.seo_service import SEOService
+    from ..platforms.twitter_service import TwitterService
+    from ..platforms.youtube_service import YouTubeService
+
+
+def _optional(factory: Callable[[], Any], name: str) -> Callable[[], Any]:
+    """Wrap a client factory that raises ValueError when its API key is missing."""
+    def build():
+        try:
+            return factory()
+        except ValueError as e:
+            print(f"Warning: {name} not initialized: {e}")
+            return None
+    return build
+
+
+class ServiceContainer:
+    """Lazily constructed singletons, built at most once per process."""
+
+    def __init__(self):
+        self._instances: Dict[str, Any] = {}
+        # Re-entrant: factories resolve their own dependencies from the container
+        self._lock = threading.RLock()
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        try:
+            return self._instances[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+            return self._instances[name]
+
+    def reset(self) -> None:
+        """Drop all instances (tests); the next access rebuilds them."""
+        with self._lock:
+            self._instances.clear()
+
+    # ---- clients ----
+
+    @property
+    def gemini(self) -> "GeminiService":
+        from ..ai.gemini_service import GeminiService
+        return self._get("gemini", GeminiService)
+
+    @property
+    def youtube(self) -> Optional["YouTubeService"]:
+        """YouTube Data API client, or None when YOUTUBE_API_KEY is not set."""
+        from ..platforms.youtube_service import YouTubeService
+        return self._get("youtube", _optional(YouTubeService, "YouTubeService"))
+
+    @property
+    def twitter(self) -> Optional["TwitterService"]:
+        """twitterapi.io client, or None when TWITTER_API_KEY is not set."""
+        from ..platforms.twitter_service import TwitterService
+        return self._get("twitter", _optional(TwitterService, "TwitterService"))
+
+    @property
+    def seo(self) -> "SEOService":
+        from ..ai.seo_service import SEOService
+        return self._get("seo", lambda: SEOService(gemini=self.gemini))
+
+    @property
+    def image(self) -> "ImageService":
+        from ..ai.image_service import ImageService
+        return self._get("image", ImageService)
+
+    # ---- agents ----
+
+    @property
+    def context_analyzer(self) -> "ContextAnalyzer":
+        from ...agents.core.context_analyzer import ContextAnalyzer
+        return self._get("context_analyzer", lambda: ContextAnalyzer(gemini=self.gemini))
+
+    @property
+    def strategy_agent(self) -> "StrategyAgent":
+        from ...agents.core.strategy_agent import StrategyAgent
+        return self._get("strategy_agent", lambda: StrategyAgent(gemini=self.gemini))
+
+    @property
+    def forensics_agent(self) -> "ForensicsAgent":
+        from ...agents.platform.forensics_agent import ForensicsAgent
+        return self._get("forensics_agent", lambda: ForensicsAgent(
+            gemini=self.gemini, youtube_service=self.youtube, twitter_service=self.twitter
+        ))
+
+    @property
+    def planner_agent(self) -> "PlannerAgent":
+        from ...agents.core.planner_agent import PlannerAgent
+        return self._get("planner_agent", lambda: PlannerAgent(gemini=self.gemini))
+
+    @property
+    def content_agent(self) -> "ContentAgent":
+        from ...agents.core.content_agent import ContentAgent
+        return self._get("content_agent", lambda: ContentAgent(gemini=self.gemini))
+
+    @property
+    def outcome_agent(self) -> "OutcomeAgent":
+        from ...agents.core.outcome_agent import OutcomeAgent
+        return self._get("outcome_agent", lambda: OutcomeAgent(gemini=self.gemini))
+
+
+# Module-level singleton shared by the API process and each Celery worker process
+container = ServiceContainer()
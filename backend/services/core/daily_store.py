@@ -0,0 +1,98 @@
+"""Bulk writes for per-day campaign rows (daily_content, daily_execution).
+
+Both tables hold one row per (campaign_id, day_number, platform), enforced
+by unique_content_per_day_platform / unique_execution_per_day_platform.
+Rows are written with a single multi-row INSERT ... ON CONFLICT DO UPDATE
+on that key instead of select-then-add through the ORM:
+
+- a wave of generated days is one statement rather than one INSERT per
+  row plus UPDATEs for the thumbnail and SEO fields set after add()
+- a retried workflow or a repeated confirmation updates the existing row
+  in place (its content_id / execution_id and created_at are kept)
+"""
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...database.upsert import dialect_insert
+from ...models.db.campaign import DailyContentDB, DailyExecutionDB
+
+# Conflict target shared by both tables
+DAY_PLATFORM_KEY = ("campaign_id", "day_number", "platform")
+
+# Columns an upsert never overwrites
+_PRESERVED_COLUMNS = {"content_id", "execution_id", "created_at", "updated_at"}
+
+
+def _upsert_statement(db: AsyncSession, model, id_column: str, rows: List[Dict[str, Any]]):
+    """INSERT ... ON CONFLICT (campaign_id, day_number, platform) DO UPDATE for rows of one model."""
+    # Multi-row VALUES needs the same keys in every row
+    columns = sorted({key for row in rows for key in row} - {id_column})
+    values = [
+        {id_column: str(uuid.uuid4()), **{column: row.get(column) for column in columns}}
+        for row in rows
+    ]
+
+    insert = dialect_insert(db)
+    stmt = insert(model).values(values)
+    set_ = {
+        column: stmt.excluded[column]
+        for column in columns
+        if column not in _PRESERVED_COLUMNS and column not in DAY_PLATFORM_KEY
+    }
+    set_["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(
+        index_elements=[getattr(model, column) for column in DAY_PLATFORM_KEY],
+        set_=set_
+    )
+
+
+def _dedupe(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Last row wins per (campaign_id, day_number, platform); Postgres rejects a key twice in one statement."""
+    latest = {tuple(row[key] for key in DAY_PLATFORM_KEY): row for row in rows}
+    return list(latest.values())
+
+
+async def upsert_daily_content(db: AsyncSession, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Insert or update daily_content rows in one statement (caller commits).
+
+    Args:
+        db: Database session
+        rows: Column dicts with campaign_id, day_number, platform and the
+            content columns to write; columns no row sets keep their stored
+            value on update (rows missing a column another row sets write NULL)
+
+    Returns:
+        Number of rows written
+    """
+    rows = _dedupe(rows)
+    if not rows:
+        return 0
+    await db.execute(_upsert_statement(db, DailyContentDB, "content_id", rows))
+    return len(rows)
+
+
+async def upsert_daily_execution(db: AsyncSession, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Insert or update daily_execution rows in one statement (caller commits).
+
+    executed_at defaults to now for rows that don't set it.
+
+    Args:
+        db: Database session
+        rows: Column dicts with campaign_id, day_number, platform and the
+            execution columns to write
+
+    Returns:
+        Number of rows written
+    """
+    now = datetime.now(timezone.utc)
+    rows = _dedupe({"executed_at": now, **row} for row in rows)
+    if not rows:
+        return 0
+    await db.execute(_upsert_statement(db, DailyExecutionDB, "execution_id", rows))
+    return len(rows)
@@ -0,0 +1,442 @@
+"""Learning memory retrieval - past campaign learnings for the Strategy and Planner agents.
+
+Niches are free text ("tech tutorials" vs "Tech tutorials for beginners"),
+so filtering on exact niche equality rarely finds anything. In ranked
+mode (LEARNING_RETRIEVAL_MODE) a user's most recent memories are ranked
+instead:
+
+- every memory has a lexical term vector (relevance_terms), computed
+  once when it is saved; rows saved before the column existed are
+  vectorized at read time
+- similarity is TF-IDF cosine between the new campaign (niche, goal,
+  platforms) and each memory, with IDF over the user's memories, plus a
+  bonus for the same goal type and platform
+- the similarity is blended with recency (exponential decay,
+  LEARNING_RECENCY_HALF_LIFE_DAYS)
+
+Candidates and ranked results are cached per user for LEARNING_CACHE_TTL
+seconds. Each user also has a generation counter in Redis (REDIS_URL) that
+save_learning_memory() increments; an entry cached under an older
+generation is dropped, so a memory saved by one process (a Celery worker)
+is seen by every other process on its next lookup. If Redis is down,
+entries fall back to expiring after the TTL.
+"""
+import logging
+import math
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import (
+    LEARNING_CACHE_TTL,
+    LEARNING_MEMORY_CANDIDATES,
+    LEARNING_MEMORY_TOP_K,
+    LEARNING_RECENCY_HALF_LIFE_DAYS,
+    LEARNING_RECENCY_WEIGHT,
+    LEARNING_RETRIEVAL_MODE,
+)
+from ...models.db.campaign import LearningMemoryDB
+from .redis_clients import RedisBackoff, get_async_redis
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each text in a term vector: the niche says most about relevance
+NICHE_WEIGHT = 2.0
+CONTEXT_WEIGHT = 1.0
+INSIGHT_WEIGHT = 0.5
+# Similarity bonus for a memory from the same goal type / platform
+GOAL_TYPE_BONUS = 0.25
+PLATFORM_BONUS = 0.15
+
+GENERATION_KEY_PREFIX = "learning-memory:generation:"
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or our so that the their "
+    "this to was were what when which who will with you your more less very than then into about".split()
+)
+
+# Columns retrieval reads (term vectors included, scripts and IDs of other tables not)
+LEARNING_COLUMNS = (
+    "memory_id", "goal_type", "platform", "niche", "what_worked", "what_failed",
+    "recommendations", "goal_achievement_summary", "relevance_terms", "created_at",
+)
+
+
+def tokenize(text: Any) -> List[str]:
+    """Lowercase word tokens without stopwords; plural 's' is stripped so "tutorials" matches "tutorial"."""
+    tokens = []
+    for token in re.findall(r"[a-z0-9]+", str(text or "").lower()):
+        if len(token) < 2 or token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def term_vector(weighted_texts: Iterable[Tuple[Any, float]]) -> Dict[str, float]:
+    """
+    Sublinear term-frequency vector over (text, weight) pairs.
+
+    Lists are flattened; each occurrence adds its text's weight and the
+    total is damped as 1 + log(count), so long insight lists don't drown
+    out the niche.
+    """
+    counts: Counter = Counter()
+    for text, weight in weighted_texts:
+        items = text if isinstance(text, (list, tuple)) else [text]
+        for item in items:
+            for token in tokenize(item):
+                counts[token] += weight
+    return {term: round(1 + math.log(count), 4) for term, count in counts.items() if count > 0}
+
+
+def memory_terms(
+    niche: str,
+    goal_type: str,
+    platform: str,
+    what_worked: Sequence[str] = (),
+    what_failed: Sequence[str] = (),
+    recommendations: Sequence[str] = (),
+) -> Dict[str, float]:
+    """Term vector stored with a learning memory (LearningMemoryDB.relevance_terms)."""
+    return term_vector([
+        (niche, NICHE_WEIGHT),
+        (goal_type, CONTEXT_WEIGHT),
+        (platform, CONTEXT_WEIGHT),
+        (list(what_worked or []), INSIGHT_WEIGHT),
+        (list(what_failed or []), INSIGHT_WEIGHT),
+        (list(recommendations or []), INSIGHT_WEIGHT),
+    ])
+
+
+def query_terms(niche: Optional[str], goal_type: Optional[str], platforms: Sequence[str], description: str = "") -> Dict[str, float]:
+    """Term vector describing a new campaign."""
+    return term_vector([
+        (niche, NICHE_WEIGHT),
+        (goal_type, CONTEXT_WEIGHT),
+        (list(platforms or []), CONTEXT_WEIGHT),
+        (description, INSIGHT_WEIGHT),
+    ])
+
+
+def _to_learning(record: Dict[str, Any], relevance: Optional[float] = None) -> Dict[str, Any]:
+    """Learning dict passed to the agents (the shape GeminiService formats)."""
+    learning = {
+        "memory_id": record["memory_id"],
+        "goal_type": record["goal_type"],
+        "platform": record["platform"],
+        "niche": record["niche"],
+        "what_worked": record["what_worked"] or [],
+        "what_failed": record["what_failed"] or [],
+        "recommendations": record["recommendations"] or [],
+        "goal_achievement_summary": record["goal_achievement_summary"] or "",
+    }
+    if relevance is not None:
+        learning["relevance"] = round(relevance, 4)
+    return learning
+
+
+def rank_learnings(
+    candidates: List[Dict[str, Any]],
+    query: Dict[str, float],
+    goal_type: Optional[str],
+    platforms: Sequence[str],
+    top_k: int = LEARNING_MEMORY_TOP_K,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Top-k candidates by similarity to the query blended with recency.
+
+    Args:
+        candidates: Memory rows (LEARNING_COLUMNS) with relevance_terms filled in
+        query: query_terms() of the new campaign
+        goal_type: New campaign's goal type (same-goal bonus)
+        platforms: New campaign's platforms (same-platform bonus)
+        top_k: Number of learnings to return
+        now: Reference time for recency (defaults to now)
+
+    Returns:
+        Learning dicts, best first, each with its relevance score
+    """
+    if not candidates or top_k <= 0:
+        return []
+    now = now or datetime.now(timezone.utc)
+
+    # IDF over the user's memories: terms every memory shares (their usual platform) count little
+    document_frequency: Counter = Counter()
+    for candidate in candidates:
+        document_frequency.update(candidate["relevance_terms"].keys())
+    total = len(candidates)
+
+    def idf(term: str) -> float:
+        return math.log((1 + total) / (1 + document_frequency.get(term, 0))) + 1
+
+    def weighted(vector: Dict[str, float]) -> Dict[str, float]:
+        return {term: weight * idf(term) for term, weight in vector.items()}
+
+    def norm(vector: Dict[str, float]) -> float:
+        return math.sqrt(sum(weight * weight for weight in vector.values()))
+
+    query_vector = weighted(query)
+    query_norm = norm(query_vector)
+    wanted_platforms = {platform.lower() for platform in platforms or []}
+    max_similarity = 1 + GOAL_TYPE_BONUS + PLATFORM_BONUS
+    recency_weight = min(max(LEARNING_RECENCY_WEIGHT, 0.0), 1.0)
+
+    scored = []
+    for candidate in candidates:
+        vector = weighted(candidate["relevance_terms"])
+        denominator = query_norm * norm(vector)
+        cosine = sum(weight * vector.get(term, 0.0) for term, weight in query_vector.items()) / denominator if denominator else 0.0
+        similarity = cosine
+        if goal_type and candidate["goal_type"] == goal_type:
+            similarity += GOAL_TYPE_BONUS
+        if (candidate["platform"] or "").lower() in wanted_platforms:
+            similarity += PLATFORM_BONUS
+
+        created_at = candidate["created_at"] or now
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        age_days = max((now - created_at).total_seconds(), 0) / 86400
+        recency = 0.5 ** (age_days / LEARNING_RECENCY_HALF_LIFE_DAYS) if LEARNING_RECENCY_HALF_LIFE_DAYS > 0 else 1.0
+
+        score = (1 - recency_weight) * similarity / max_similarity + recency_weight * recency
+        scored.append((score, created_at, candidate))
+
+    # Ties (e.g. empty query) go to the newest memory
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [_to_learning(candidate, score) for score, _, candidate in scored[:top_k]]
+
+
+class LearningMemoryCache:
+    """Per-user candidate memories and ranked results, dropped on a newer generation or after ttl seconds."""
+
+    def __init__(self, ttl: int = LEARNING_CACHE_TTL):
+        self.ttl = ttl
+        # user_id -> (expires_at, generation, candidates, {query key: ranked learnings})
+        self._entries: Dict[
+            str, Tuple[float, Optional[int], List[Dict[str, Any]], Dict[Any, List[Dict[str, Any]]]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, generation: Optional[int] = None):
+        """
+        (candidates, ranked results) for a user, or None if missing, expired
+        or cached under a different generation (None skips the check).
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, cached_generation, candidates, ranked = entry
+            if expires_at <= time.monotonic() or (
+                generation is not None and cached_generation != generation
+            ):
+                del self._entries[user_id]
+                return None
+            return candidates, ranked
+
+    def put(
+        self, user_id: str, candidates: List[Dict[str, Any]], generation: Optional[int] = None
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+        """Store a user's candidates; returns the (empty) ranked-results dict to fill."""
+        ranked: Dict[Any, List[Dict[str, Any]]] = {}
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, generation, candidates, ranked)
+        return ranked
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's entry (a memory was saved)."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries (tests)."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Module-level singleton shared by every AgentOrchestrator in the process
+learning_memory_cache = LearningMemoryCache()
+
+# After a Redis error generation checks are skipped for a while (entries still expire after the TTL)
+_redis_backoff = RedisBackoff()
+
+
+def generation_key(user_id: str) -> str:
+    """Redis key holding a user's learning memory generation."""
+    return f"{GENERATION_KEY_PREFIX}{user_id}"
+
+
+def _redis_failed(error: Exception) -> None:
+    _redis_backoff.failed()
+    logger.warning(f"Learning memory generation unavailable, caching by TTL only: {error}")
+
+
+async def _current_generation(user_id: str) -> Optional[int]:
+    """A user's generation (0 if never bumped), or None if Redis is unavailable."""
+    if not _redis_backoff.available():
+        return None
+    try:
+        raw = await get_async_redis().get(generation_key(user_id))
+    except Exception as e:
+        _redis_failed(e)
+        return None
+    return int(raw) if raw else 0
+
+
+async def _bump_generation(user_id: str) -> None:
+    """Invalidate the user's cached memories in every process."""
+    if not _redis_backoff.available():
+        return
+    try:
+        pipe = get_async_redis().pipeline(transaction=False)
+        pipe.incr(generation_key(user_id))
+        # Outlives every entry cached under the previous generation
+        pipe.expire(generation_key(user_id), 2 * LEARNING_CACHE_TTL)
+        await pipe.execute()
+    except Exception as e:
+        _redis_failed(e)
+
+
+async def _load_candidates(db: AsyncSession, user_id: str) -> List[Dict[str, Any]]:
+    """A user's most recent memories, with term vectors filled in for rows saved without one."""
+    result = await db.execute(
+        select(*(getattr(LearningMemoryDB, column) for column in LEARNING_COLUMNS))
+        .where(LearningMemoryDB.user_id == user_id)
+        .order_by(LearningMemoryDB.created_at.desc())
+        .limit(LEARNING_MEMORY_CANDIDATES)
+    )
+    candidates = []
+    for row in result.mappings().all():
+        candidate = dict(row)
+        if not candidate["relevance_terms"]:
+            candidate["relevance_terms"] = memory_terms(
+                candidate["niche"], candidate["goal_type"], candidate["platform"],
+                candidate["what_worked"], candidate["what_failed"], candidate["recommendations"]
+            )
+        candidates.append(candidate)
+    return candidates
+
+
+async def _exact_learnings(
+    db: AsyncSession,
+    user_id: str,
+    niche: Optional[str],
+    goal_type: Optional[str],
+    platform: Optional[str],
+    top_k: int
+) -> List[Dict[str, Any]]:
+    """Latest memories with the same goal type, platform and niche (served by the composite index)."""
+    query = select(*(getattr(LearningMemoryDB, column) for column in LEARNING_COLUMNS)).where(
+        LearningMemoryDB.user_id == user_id
+    )
+    if goal_type:
+        query = query.where(LearningMemoryDB.goal_type == goal_type)
+    if platform:
+        query = query.where(LearningMemoryDB.platform == platform)
+    if niche:
+        query = query.where(LearningMemoryDB.niche == niche)
+    query = query.order_by(LearningMemoryDB.created_at.desc()).limit(top_k)
+
+    result = await db.execute(query)
+    return [_to_learning(row) for row in result.mappings().all()]
+
+
+async def retrieve_learnings(
+    db: AsyncSession,
+    user_id: str,
+    niche: Optional[str],
+    goal_type: Optional[str],
+    platforms: Sequence[str],
+    description: str = "",
+    top_k: int = LEARNING_MEMORY_TOP_K,
+    mode: str = LEARNING_RETRIEVAL_MODE
+) -> List[Dict[str, Any]]:
+    """
+    Past learnings most relevant to a new campaign.
+
+    Args:
+        db: Database session
+        user_id: Campaign owner
+        niche: Creator's niche (free text)
+        goal_type: New campaign's goal type
+        platforms: New campaign's platforms (the first is the primary one)
+        description: Extra campaign text (name/description) to match on
+        top_k: Number of learnings to return
+        mode: "ranked" or "exact" (see LEARNING_RETRIEVAL_MODE)
+
+    Returns:
+        Learning dicts (memory_id, goal_type, platform, niche, what_worked,
+        what_failed, recommendations, goal_achievement_summary and, when
+        ranked, relevance), best first
+    """
+    platforms = list(platforms or [])
+    if mode == "exact":
+        return await _exact_learnings(db, user_id, niche, goal_type, platforms[0] if platforms else None, top_k)
+
+    # Read before loading, so a save landing in between leaves the entry outdated
+    generation = await _current_generation(user_id)
+    cached = learning_memory_cache.get(user_id, generation)
+    if cached is None:
+        candidates = await _load_candidates(db, user_id)
+        ranked = learning_memory_cache.put(user_id, candidates, generation)
+    else:
+        candidates, ranked = cached
+
+    key = (niche, goal_type, tuple(platforms), description, top_k)
+    if key not in ranked:
+        ranked[key] = rank_learnings(
+            candidates, query_terms(niche, goal_type, platforms, description), goal_type, platforms, top_k
+        )
+    return ranked[key]
+
+
+async def save_learning_memory(
+    db: AsyncSession,
+    user_id: str,
+    campaign_id: str,
+    goal_type: str,
+    platform: str,
+    niche: str,
+    campaign_duration_days: int,
+    posting_frequency: str,
+    what_worked: List[str],
+    what_failed: List[str],
+    recommendations: List[str],
+    goal_achievement_summary: str = ""
+) -> LearningMemoryDB:
+    """
+    Store a campaign's learnings with their term vector and invalidate the user's cache in every process.
+
+    Returns:
+        The committed LearningMemoryDB row
+    """
+    learning_db = LearningMemoryDB(
+        memory_id=str(uuid.uuid4()),
+        user_id=user_id,
+        campaign_id=campaign_id,
+        goal_type=goal_type,
+        platform=platform,
+        niche=niche,
+        campaign_duration_days=campaign_duration_days,
+        posting_frequency=posting_frequency,
+        what_worked=what_worked,
+        what_failed=what_failed,
+        recommendations=recommendations,
+        goal_achievement_summary=goal_achievement_summary,
+        relevance_terms=memory_terms(niche, goal_type, platform, what_worked, what_failed, recommendations)
+    )
+    db.add(learning_db)
+    await db.commit()
+    learning_memory_cache.invalidate(user_id)
+    await _bump_generation(user_id)
+    return learning_db
@@ -0,0 +1,165 @@
+"""Background Context Analyzer runs for creator profiles.
+
+Onboarding and profile updates no longer wait for the Context Analyzer
+(an LLM call of up to 30s per attempt). They hand the analyzer input to
+analyze_creator_profile_task and return immediately, with the profile
+marked analysis_pending and the task ID to follow.
+
+Each request is identified by a fingerprint of the analyzer input:
+
+- a profile whose stored analysis was made from the same input is not
+  re-analyzed
+- while an analysis of the same input is pending, its task ID is reused
+- a task whose input was superseded by a newer submission discards its
+  result instead of overwriting the newer analysis
+
+Within a run, only the output sections whose inputs changed are
+regenerated (ContextAnalyzer.analyze_incremental_async); per-section
+input fingerprints are kept in agent_context["_context_section_fingerprints"].
+"""
+import hashlib
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models.db.user import CreatorProfileDB
+
+logger = logging.getLogger(__name__)
+
+# recommended_frequency is VARCHAR(50)
+MAX_FREQUENCY_LENGTH = 50
+
+
+def context_analyzer_input(profile_db: CreatorProfileDB) -> Dict[str, Any]:
+    """
+    Context Analyzer input for a profile (Phase 1 fields plus whatever Phase 2 fields are set).
+
+    Keys are the ones GeminiService._context_request reads, so onboarding
+    and Phase 2 updates describe the same profile the same way.
+    """
+    platform_urls = profile_db.platform_urls or {}
+    creator_data = {
+        "category": profile_db.niche,
+        "target_audience": profile_db.target_audience_niche,
+        "platforms": profile_db.existing_platforms or [],
+        "youtube_url": platform_urls.get("YouTube"),
+        "twitter_url": platform_urls.get("Twitter"),
+        "instagram_url": platform_urls.get("Instagram"),
+        "linkedin_url": platform_urls.get("LinkedIn"),
+        "tiktok_url": platform_urls.get("TikTok"),
+        "facebook_url": platform_urls.get("Facebook"),
+        "reddit_url": platform_urls.get("Reddit"),
+        # Phase 2
+        "unique_angle": profile_db.unique_angle,
+        "content_purpose": profile_db.self_purpose,
+        "self_strengths": profile_db.self_strengths or None,
+        "audience_demographics": profile_db.target_audience_demographics,
+        "why_create": profile_db.self_motivation,
+        "competitor_urls": profile_db.competitor_accounts or [],
+    }
+    # Unset URLs/Phase 2 fields are left out (the prompt shows its own placeholder)
+    return {key: value for key, value in creator_data.items() if value is not None}
+
+
+def analysis_fingerprint(creator_data: Dict[str, Any]) -> str:
+    """SHA-256 over the analyzer input (key order and JSON formatting don't matter)."""
+    material = json.dumps(creator_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+async def request_profile_analysis(
+    db: AsyncSession,
+    profile_db: CreatorProfileDB,
+    creator_data: Dict[str, Any]
+) -> Optional[str]:
+    """
+    Queue a Context Analyzer run for a profile unless it is already current.
+
+    Commits the profile's pending state before the task is sent, so the
+    worker always sees it.
+
+    Args:
+        db: Database session the profile was loaded with
+        profile_db: Creator profile (already committed)
+        creator_data: Analyzer input (JSON-serializable)
+
+    Returns:
+        Task ID of the queued (or already pending) analysis, or None if the
+        stored analysis is already for this input or the task couldn't be sent
+    """
+    fingerprint = analysis_fingerprint(creator_data)
+    agent_context = profile_db.agent_context or {}
+
+    if agent_context.get("_context_fingerprint") == fingerprint:
+        if profile_db.analysis_pending or profile_db.analysis_fingerprint != fingerprint:
+            # Reverted to the analyzed input: an in-flight run for other input must not store its result
+            profile_db.analysis_pending = False
+            profile_db.analysis_task_id = None
+            profile_db.analysis_fingerprint = fingerprint
+            await db.commit()
+        logger.info(f"Context analysis for user_id={profile_db.user_id} is up to date")
+        return None
+    if profile_db.analysis_pending and profile_db.analysis_fingerprint == fingerprint:
+        logger.info(f"Context analysis for user_id={profile_db.user_id} already pending")
+        return profile_db.analysis_task_id
+
+    from ...tasks.profile_tasks import analyze_creator_profile_task
+
+    task_id = str(uuid.uuid4())
+    profile_db.analysis_pending = True
+    profile_db.analysis_task_id = task_id
+    profile_db.analysis_fingerprint = fingerprint
+    await db.commit()
+
+    try:
+        analyze_creator_profile_task.apply_async(
+            args=[profile_db.user_id, creator_data, fingerprint], task_id=task_id
+        )
+    except Exception as e:
+        # Analysis is not critical for onboarding: keep the profile, drop the pending state
+        logger.error(f"Failed to queue context analysis for user_id={profile_db.user_id}: {e}", exc_info=True)
+        profile_db.analysis_pending = False
+        profile_db.analysis_task_id = None
+        await db.commit()
+        return None
+
+    await db.refresh(profile_db)
+    logger.info(f"Context analysis queued for user_id={profile_db.user_id} (task_id={task_id})")
+    return task_id
+
+
+def apply_context_analysis(
+    profile_db: CreatorProfileDB,
+    context_output: Any,
+    fingerprint: str,
+    section_fingerprints: Optional[Dict[str, str]] = None
+) -> None:
+    """
+    Store a ContextAnalyzerOutput on the profile and clear its pending state.
+
+    Args:
+        profile_db: Creator profile to update (caller commits)
+        context_output: ContextAnalyzerOutput
+        fingerprint: analysis_fingerprint() of the input it was made from
+        section_fingerprints: Per-section input fingerprints (see context_analyzer.section_fingerprints)
+    """
+    agent_context = dict(profile_db.agent_context or {})
+    agent_context["_analyzed_context"] = context_output.model_dump()
+    agent_context["_context_analyzed_at"] = datetime.now(timezone.utc).isoformat()
+    agent_context["_context_fingerprint"] = fingerprint
+    if section_fingerprints is not None:
+        agent_context["_context_section_fingerprints"] = section_fingerprints
+    profile_db.agent_context = agent_context
+
+    raw_frequency = context_output.strategic_insights.get(
+        'realistic_posting_frequency',
+        'Not yet determined'
+    )
+    profile_db.recommended_frequency = raw_frequency[:MAX_FREQUENCY_LENGTH] if raw_frequency else 'Not yet determined'
+
+    profile_db.analysis_pending = False
+    profile_db.analysis_task_id = None
@@ -0,0 +1,132 @@
+"""Structured workflow progress - weighted stages, unit counts and ETA.
+
+ProgressReporter turns "stage X, N of M units done" into a single 0-100
+percentage and forwards it to a progress callback (e.g.
+CallbackTask.update_progress) together with the structured details.
+Updates are throttled so long loops don't write a task state per unit,
+and the reported percentage never goes backwards, even when units
+(campaign days) finish out of order.
+"""
+import time
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from ...config import PROGRESS_MIN_INTERVAL
+
+
+class ProgressReporter:
+    """Reports progress for a fixed sequence of weighted stages."""
+
+    def __init__(
+        self,
+        callback: Optional[Callable[..., None]],
+        stages: Sequence[Tuple[str, float]],
+        min_interval: float = PROGRESS_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            callback: Called as callback(progress, message, details=...) or None
+            stages: (name, weight) pairs in execution order; weights are relative
+            min_interval: Minimum seconds between non-boundary updates
+            clock: Time source (monotonic seconds)
+        """
+        self.callback = callback
+        self.min_interval = min_interval
+        self._clock = clock
+        self._started_at = clock()
+
+        total_weight = sum(weight for _, weight in stages) or 1
+        # name -> (index, start %, span %)
+        self._stages: Dict[str, Tuple[int, float, float]] = {}
+        offset = 0.0
+        for index, (name, weight) in enumerate(stages):
+            span = 100.0 * weight / total_weight
+            self._stages[name] = (index, offset, span)
+            offset += span
+
+        self._stage: Optional[str] = None
+        self._unit = 0
+        self._unit_total: Optional[int] = None
+        self._reported = 0
+        self._last_emit: Optional[float] = None
+
+    def start_stage(self, name: str, total_units: Optional[int] = None, message: Optional[str] = None) -> None:
+        """Enter a stage, optionally made of total_units units (days, campaigns, ...)."""
+        self._stage = name
+        self._unit = 0
+        self._unit_total = total_units
+        self._emit(message or f"Starting {name}...", force=True)
+
+    def advance(self, units: int = 1, message: Optional[str] = None) -> None:
+        """Mark units of the current stage complete (throttled)."""
+        self._unit += units
+        if self._unit_total is not None:
+            self._unit = min(self._unit, self._unit_total)
+        self._emit(message, force=self._unit == self._unit_total)
+
+    def note(self, message: str) -> None:
+        """Report an intermediate result (e.g. a streamed title) without moving the bar (throttled)."""
+        self._emit(message, allow_same=True)
+
+    def complete_stage(self, message: Optional[str] = None) -> None:
+        """Mark the current stage finished."""
+        if self._unit_total is not None:
+            self._unit = self._unit_total
+        self._emit(message or f"{self._stage} complete", force=True, stage_done=True)
+
+    def finish(self, message: str) -> None:
+        """Report 100% (always sent)."""
+        self._reported = 100
+        self._send(100, message)
+
+    # ---- internals ----
+
+    def _percent(self, stage_done: bool) -> int:
+        if self._stage is None:
+            return self._reported
+        _, start, span = self._stages[self._stage]
+        if stage_done:
+            fraction = 1.0
+        elif self._unit_total:
+            fraction = self._unit / self._unit_total
+        else:
+            fraction = 0.0
+        return int(start + span * fraction)
+
+    def _emit(
+        self,
+        message: Optional[str],
+        force: bool = False,
+        stage_done: bool = False,
+        allow_same: bool = False
+    ) -> None:
+        # Monotonic: parallel units or a re-entered stage never move it back
+        progress = max(self._reported, min(self._percent(stage_done), 99))
+        now = self._clock()
+        throttled = self._last_emit is not None and now - self._last_emit < self.min_interval
+        if not force and (throttled or (progress == self._reported and not allow_same)):
+            return
+        self._reported = progress
+        self._send(progress, message or "")
+
+    def _details(self) -> Dict[str, Any]:
+        """Structured state for the current update."""
+        elapsed = self._clock() - self._started_at
+        eta = None
+        if 0 < self._reported < 100:
+            eta = round(elapsed * (100 - self._reported) / self._reported, 1)
+        index = self._stages[self._stage][0] if self._stage in self._stages else None
+        return {
+            "stage": self._stage,
+            "stage_index": index,
+            "stage_count": len(self._stages),
+            "unit": self._unit if self._unit_total is not None else None,
+            "unit_total": self._unit_total,
+            "elapsed_seconds": round(elapsed, 1),
+            "eta_seconds": 0.0 if self._reported >= 100 else eta,
+        }
+
+    def _send(self, progress: int, message: str) -> None:
+        self._last_emit = self._clock()
+        if self.callback:
+            self.callback(progress, message, details=self._details())
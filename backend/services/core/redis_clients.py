@@ -0,0 +1,98 @@
+"""Shared Redis clients (REDIS_URL) for caches and task events.
+
+One sync client and one async client per (url, socket timeout) are kept
+per process, so the LLM response cache, learning memory generations and
+task progress events share connection pools instead of each opening their
+own. redis.asyncio connections are bound to the loop that created them,
+so async clients are additionally keyed by event loop.
+
+RedisBackoff is the best-effort pattern every caller uses: after an error
+the feature skips Redis for REDIS_RETRY_AFTER_SECONDS instead of paying a
+connection timeout on every call.
+"""
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+from ...config import REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+# After a Redis error, skip Redis for this long
+REDIS_RETRY_AFTER_SECONDS = 30
+
+# Seconds; None = block indefinitely (pub/sub subscribers)
+DEFAULT_SOCKET_TIMEOUT = 2
+
+ClientKey = Tuple[str, Optional[float]]
+
+_sync_clients: Dict[ClientKey, Any] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ClientKey, Any]]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+class RedisBackoff:
+    """Down-until flag for one Redis-backed feature."""
+
+    def __init__(self, retry_after: float = REDIS_RETRY_AFTER_SECONDS):
+        self.retry_after = retry_after
+        self.down_until = 0.0
+
+    def available(self) -> bool:
+        """Whether Redis may be tried now."""
+        return time.time() >= self.down_until
+
+    def failed(self) -> None:
+        """Record an error: skip Redis for retry_after seconds."""
+        self.down_until = time.time() + self.retry_after
+
+    def reset(self) -> None:
+        """Try Redis again on the next call (tests)."""
+        self.down_until = 0.0
+
+
+def get_sync_redis(url: str = REDIS_URL, socket_timeout: Optional[float] = DEFAULT_SOCKET_TIMEOUT):
+    """Process-wide blocking client for url."""
+    key = (url, socket_timeout)
+    client = _sync_clients.get(key)
+    if client is None:
+        with _lock:
+            client = _sync_clients.get(key)
+            if client is None:
+                import redis
+                client = redis.Redis.from_url(url, socket_timeout=socket_timeout, socket_connect_timeout=2)
+                _sync_clients[key] = client
+    return client
+
+
+def get_async_redis(url: str = REDIS_URL, socket_timeout: Optional[float] = DEFAULT_SOCKET_TIMEOUT):
+    """Process-wide pooled async client for url on the running event loop."""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    key = (url, socket_timeout)
+    client = clients.get(key)
+    if client is None:
+        import redis.asyncio as aioredis
+        client = aioredis.Redis.from_url(url, socket_timeout=socket_timeout, socket_connect_timeout=2)
+        clients[key] = client
+    return client
+
+
+async def close_redis_clients() -> None:
+    """Close the running loop's async clients and every sync client (app shutdown)."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    with _lock:
+        sync_clients = list(_sync_clients.values())
+        _sync_clients.clear()
+    for client in clients.values():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing Redis client: {e}")
+    for client in sync_clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Redis client: {e}")
@@ -0,0 +1,207 @@
+"""Task progress events over Redis pub/sub.
+
+Celery tasks publish every progress update (and their final state) to a
+per-task channel, and also keep the latest event in a short-lived key so
+a subscriber that connects mid-task starts from the current state. The
+API relays the channel to the browser as Server-Sent Events, replacing
+2-second polling of GET /tasks/{task_id}. All SSE streams in a process
+share one pooled async Redis client (see redis_clients).
+"""
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ...config import TASK_EVENTS_TTL, TASK_EVENTS_KEEPALIVE
+from .redis_clients import RedisBackoff, get_async_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATES = {"SUCCESS", "FAILURE", "REVOKED"}
+
+# Publishing is skipped for a while after a Redis error
+_redis_backoff = RedisBackoff()
+
+
+def task_channel(task_id: str) -> str:
+    """Pub/sub channel carrying a task's progress events."""
+    return f"task-progress:{task_id}"
+
+
+def task_snapshot_key(task_id: str) -> str:
+    """Key holding the task's latest event."""
+    return f"task-progress:last:{task_id}"
+
+
+def build_task_status(task_id: str, state: str, info: Any = None) -> Dict[str, Any]:
+    """
+    Task status payload shared by the polling endpoint and the event stream.
+
+    Args:
+        task_id: Celery task ID
+        state: Celery state (PENDING, STARTED, SUCCESS, FAILURE, RETRY, ...)
+        info: Progress meta (STARTED), task return value (SUCCESS) or exception (FAILURE)
+
+    Returns:
+        Dict with task_id, state, progress, message, result, error,
+        campaign_id, redirect_url and details
+    """
+    response = {
+        "task_id": task_id,
+        "state": state,
+        "progress": 0,
+        "message": "",
+        "result": None,
+        "error": None,
+        "campaign_id": None,
+        "redirect_url": None,
+        "details": None
+    }
+
+    if state == "PENDING":
+        # Task not yet started or doesn't exist
+        response["message"] = "Task pending..."
+        response["progress"] = 0
+
+    elif state == "STARTED":
+        # Task is running - get progress from meta
+        info = info if isinstance(info, dict) else {}
+        response["progress"] = info.get("progress", 0)
+        response["message"] = info.get("message", "Processing...")
+        # Stage, unit/unit_total, elapsed_seconds, eta_seconds (see ProgressReporter)
+        response["details"] = info.get("details")
+
+    elif state == "SUCCESS":
+        # Task completed successfully
+        result = info if isinstance(info, dict) else {}
+        response["progress"] = 100
+        response["message"] = result.get("message", "Task completed")
+        response["result"] = result
+        response["campaign_id"] = result.get("campaign_id")
+
+        # Provide redirect URL for frontend
+        if response["campaign_id"]:
+            response["redirect_url"] = f"/campaigns/{response['campaign_id']}"
+
+    elif state == "FAILURE":
+        # Task failed
+        response["progress"] = 0
+        response["message"] = "Task failed"
+        response["error"] = str(info)  # Exception details
+
+        # Try to extract campaign_id from exception args if available
+        if hasattr(info, 'args') and info.args:
+            try:
+                # Tasks store campaign_id as first arg
+                response["campaign_id"] = info.args[0] if info.args else None
+            except:
+                pass
+
+    elif state == "RETRY":
+        # Task is retrying after failure
+        response["progress"] = 0
+        response["message"] = "Retrying after failure..."
+
+    elif state == "REVOKED":
+        # Task was cancelled via DELETE /tasks/{task_id}
+        response["message"] = "Task cancelled"
+
+    else:
+        # Unknown state
+        response["message"] = f"Unknown state: {state}"
+
+    return response
+
+
+def _encode_event(event: Dict[str, Any]) -> str:
+    return json.dumps(event, default=str)
+
+
+def publish_task_event(event: Dict[str, Any]) -> None:
+    """
+    Publish a task status event (blocking; called from Celery tasks).
+
+    Never raises: progress streaming is best-effort and must not fail the task.
+    """
+    if not _redis_backoff.available():
+        return
+    task_id = event["task_id"]
+    try:
+        payload = _encode_event(event)
+        pipe = get_sync_redis().pipeline(transaction=False)
+        pipe.set(task_snapshot_key(task_id), payload, ex=TASK_EVENTS_TTL)
+        pipe.publish(task_channel(task_id), payload)
+        pipe.execute()
+    except Exception as e:
+        _redis_backoff.failed()
+        logger.warning(f"Failed to publish progress for task {task_id}: {e}")
+
+
+async def publish_task_event_async(event: Dict[str, Any]) -> None:
+    """
+    Publish a task status event without blocking the event loop (API handlers).
+
+    Never raises, like publish_task_event.
+    """
+    if not _redis_backoff.available():
+        return
+    task_id = event["task_id"]
+    try:
+        payload = _encode_event(event)
+        pipe = get_async_redis().pipeline(transaction=False)
+        pipe.set(task_snapshot_key(task_id), payload, ex=TASK_EVENTS_TTL)
+        pipe.publish(task_channel(task_id), payload)
+        await pipe.execute()
+    except Exception as e:
+        _redis_backoff.failed()
+        logger.warning(f"Failed to publish progress for task {task_id}: {e}")
+
+
+async def stream_task_events(
+    task_id: str,
+    initial_event: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """
+    Yield a task's status events until it reaches a terminal state.
+
+    The latest stored event is yielded first (falling back to
+    initial_event when nothing was published yet), then live events from
+    the task's channel. None is yielded every TASK_EVENTS_KEEPALIVE seconds
+    without an event so the caller can send a keepalive and notice
+    disconnected clients.
+
+    Args:
+        task_id: Celery task ID
+        initial_event: Status to start from if no event was published
+    """
+    # No socket_timeout: subscribers block in get_message for up to TASK_EVENTS_KEEPALIVE
+    client = get_async_redis(socket_timeout=None)
+    # Holds one pooled connection for the life of the stream
+    pubsub = client.pubsub()
+    try:
+        # Subscribe before reading the snapshot so no event falls in between
+        await pubsub.subscribe(task_channel(task_id))
+        raw = await client.get(task_snapshot_key(task_id))
+        event = json.loads(raw) if raw else initial_event
+        if event is not None:
+            yield event
+            if event.get("state") in TERMINAL_STATES:
+                return
+
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=TASK_EVENTS_KEEPALIVE
+            )
+            if message is None:
+                yield None
+                continue
+            event = json.loads(message["data"])
+            yield event
+            if event.get("state") in TERMINAL_STATES:
+                return
+    finally:
+        try:
+            await pubsub.unsubscribe()
+            # Returns the connection to the shared pool
+            await pubsub.aclose()
+        except Exception:
+            pass
@@ -0,0 +1,175 @@
+"""YouTube channel resolution index (handle / username / channel URL → UC... ID).
+
+Two tiers:
+    1. In-process map consulted by YouTubeService before any API call
+    2. channel_resolutions table, shared by every worker and user
+
+YouTubeService is synchronous (it runs in worker threads), so it only
+touches the in-process tier. Async callers that hold a DB session warm it
+with preload_resolutions() before fetching and write back what the
+service resolved with persist_resolutions() afterwards.
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import CHANNEL_RESOLUTION_TTL, CHANNEL_RESOLUTION_NEGATIVE_TTL
+from ...database.upsert import dialect_insert
+from ...models.db.channel_resolution import ChannelResolutionDB
+
+# (identifier_type, normalized identifier_value)
+ResolutionKey = Tuple[str, str]
+
+
+def resolution_key(channel_identifier: Dict[str, str]) -> ResolutionKey:
+    """
+    Normalize an identifier from YouTubeService.extract_channel_identifier().
+
+    Handles and usernames are case-insensitive; channel IDs are not.
+    """
+    identifier_type = channel_identifier['type']
+    value = channel_identifier['value'].lstrip('@')
+    if identifier_type != 'id':
+        value = value.lower()
+    return identifier_type, value
+
+
+def is_current(channel_id: Optional[str], resolved_at: float, now: Optional[float] = None) -> bool:
+    """Whether a resolution is still trusted (negative entries expire sooner)."""
+    ttl = CHANNEL_RESOLUTION_TTL if channel_id else CHANNEL_RESOLUTION_NEGATIVE_TTL
+    return (now or time.time()) - resolved_at <= ttl
+
+
+class ChannelResolutionCache:
+    """Thread-safe in-process resolution map, tracking entries not yet persisted."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[ResolutionKey, Tuple[Optional[str], float]]" = OrderedDict()
+        self._pending: Dict[ResolutionKey, Tuple[Optional[str], float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: ResolutionKey) -> Tuple[bool, Optional[str]]:
+        """
+        Returns:
+            (hit, channel_id) - a hit with channel_id None is a cached "unresolvable"
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            channel_id, resolved_at = entry
+            if not is_current(channel_id, resolved_at):
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, channel_id
+
+    def put(
+        self,
+        key: ResolutionKey,
+        channel_id: Optional[str],
+        resolved_at: Optional[float] = None,
+        persist: bool = True
+    ) -> None:
+        """Record a resolution; persist=False for entries loaded from the table."""
+        entry = (channel_id, resolved_at or time.time())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if persist:
+                self._pending[key] = entry
+
+    def drain_pending(self) -> Dict[ResolutionKey, Tuple[Optional[str], float]]:
+        """Take the resolutions made since the last drain."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            return pending
+
+
+async def preload_resolutions(
+    db: AsyncSession,
+    channel_identifiers: Iterable[Optional[Dict[str, str]]]
+) -> int:
+    """
+    Batch-load stored resolutions into the in-process tier (one query).
+
+    Returns:
+        Number of resolutions loaded
+    """
+    keys = {
+        resolution_key(identifier)
+        for identifier in channel_identifiers
+        if identifier
+    }
+    keys = {key for key in keys if not channel_resolution_cache.get(key)[0]}
+    if not keys:
+        return 0
+
+    result = await db.execute(
+        select(ChannelResolutionDB).where(or_(*(
+            and_(
+                ChannelResolutionDB.identifier_type == identifier_type,
+                ChannelResolutionDB.identifier_value == value
+            )
+            for identifier_type, value in keys
+        )))
+    )
+    loaded = 0
+    for row in result.scalars().all():
+        resolved_at = row.resolved_at
+        if resolved_at.tzinfo is None:
+            resolved_at = resolved_at.replace(tzinfo=timezone.utc)
+        resolved_ts = resolved_at.timestamp()
+        if not is_current(row.channel_id, resolved_ts):
+            continue
+        channel_resolution_cache.put(
+            (row.identifier_type, row.identifier_value), row.channel_id, resolved_ts, persist=False
+        )
+        loaded += 1
+    return loaded
+
+
+async def persist_resolutions(db: AsyncSession) -> int:
+    """
+    Upsert resolutions made by YouTubeService since the last call (one statement).
+    The caller commits.
+
+    Returns:
+        Number of resolutions written
+    """
+    pending = channel_resolution_cache.drain_pending()
+    if not pending:
+        return 0
+
+    rows = [
+        {
+            "identifier_type": identifier_type,
+            "identifier_value": value,
+            "channel_id": channel_id,
+            "resolved_at": datetime.fromtimestamp(resolved_at, tz=timezone.utc),
+        }
+        for (identifier_type, value), (channel_id, resolved_at) in pending.items()
+    ]
+    insert = dialect_insert(db)
+    stmt = insert(ChannelResolutionDB).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ChannelResolutionDB.identifier_type, ChannelResolutionDB.identifier_value],
+        set_={
+            "channel_id": stmt.excluded["channel_id"],
+            "resolved_at": stmt.excluded["resolved_at"],
+        }
+    )
+    await db.execute(stmt)
+    return len(rows)
+
+
+# Module-level singleton shared by every YouTubeService instance in the process
+channel_resolution_cache = ChannelResolutionCache()
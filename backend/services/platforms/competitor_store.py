@@ -0,0 +1,281 @@
+"""Shared competitor snapshot store (competitor_snapshots table).
+
+Fetching a competitor costs YouTube quota (search.list = 100 units) or
+several paginated twitterapi.io calls, and popular competitors are listed
+by many creators. Snapshots are keyed by the platform-native account ID
+(YouTube channel ID, Twitter user ID). A competitor URL is mapped to that
+ID before lookup - directly for /channel/UC... URLs, through the channel
+resolution index for handles, usernames and custom URLs - so every URL
+form of a channel shares one snapshot. The URL-derived handle is only a
+fallback for identifiers not resolved yet (and for Twitter, where the
+user ID is only known after a fetch).
+
+Freshness policy (per platform, see config):
+    - age <= freshness: served as-is
+    - freshness < age <= max age: served, refreshed in the background
+    - missing or older than max age: fetched inline
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import COMPETITOR_SNAPSHOT_FRESHNESS, COMPETITOR_SNAPSHOT_MAX_AGE
+from ...database.upsert import dialect_insert
+from ...models.db.competitor import CompetitorSnapshotDB
+from .youtube_service import YouTubeService
+from .channel_resolution import channel_resolution_cache, preload_resolutions, resolution_key
+
+
+# Tweet fields kept in snapshots (classification + forensics prompt)
+TWEET_FIELDS = (
+    "id", "url", "text", "createdAt", "lang",
+    "likeCount", "retweetCount", "replyCount", "quoteCount", "viewCount", "bookmarkCount",
+    "conversationId", "isReply", "author_followers",
+)
+
+# (platform, competitor_url)
+CompetitorRef = Tuple[str, str]
+
+
+class CompetitorFetch(NamedTuple):
+    """Normalized result of fetching one competitor from its platform API."""
+    platform: str
+    handle: str
+    external_id: Optional[str]  # None when the account could not be resolved
+    items: List[Dict[str, Any]]
+
+
+def competitor_lookup_key(platform: str, competitor_url: str) -> Optional[str]:
+    """
+    Normalized identifier for a competitor URL (the snapshot lookup key).
+
+    YouTube: "<type>:<value>" from the channel URL (id values keep their case).
+    Twitter: lowercase handle without @.
+    """
+    platform_lower = platform.lower()
+    if platform_lower == "youtube":
+        identifier = YouTubeService.extract_channel_identifier(competitor_url)
+        if not identifier:
+            return None
+        value = identifier["value"] if identifier["type"] == "id" else identifier["value"].lower()
+        return f"{identifier['type']}:{value}"
+    if platform_lower == "twitter":
+        handle = competitor_url.strip().rstrip("/").split("/")[-1].lstrip("@").lower()
+        return handle or None
+    return None
+
+
+def normalize_video(video: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop fields not used downstream (full description can be several KB)."""
+    return {k: v for k, v in video.items() if k != "description_full"}
+
+
+def normalize_tweet(tweet: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the engagement and text fields of a twitterapi.io tweet."""
+    return {k: tweet.get(k) for k in TWEET_FIELDS if k in tweet}
+
+
+def fetch_competitor(
+    platform: str,
+    competitor_url: str,
+    youtube_service=None,
+    twitter_service=None
+) -> CompetitorFetch:
+    """
+    Fetch and normalize one competitor's recent content (blocking).
+
+    Raises:
+        ValueError: If the platform's service is not configured or unsupported
+    """
+    platform_lower = platform.lower()
+    handle = competitor_lookup_key(platform_lower, competitor_url) or competitor_url
+
+    if platform_lower == "youtube":
+        if not youtube_service:
+            raise ValueError("YouTubeService not initialized. Set YOUTUBE_API_KEY environment variable.")
+        channel_id, videos = youtube_service.fetch_channel(competitor_url)
+        return CompetitorFetch(platform_lower, handle, channel_id, [normalize_video(v) for v in videos])
+
+    if platform_lower == "twitter":
+        if not twitter_service:
+            raise ValueError("TwitterService not initialized. Set TWITTER_API_KEY environment variable.")
+        twitter_data = twitter_service.fetch_tweets(competitor_url)
+        tweets = twitter_data.get('data', twitter_data.get('tweets', []))
+        user_id = twitter_data.get('meta', {}).get('user_id')
+        return CompetitorFetch(platform_lower, handle, user_id, [normalize_tweet(t) for t in tweets])
+
+    raise ValueError(f"Unsupported platform: {platform}")
+
+
+def snapshot_age_seconds(snapshot: CompetitorSnapshotDB, now: Optional[datetime] = None) -> float:
+    """Seconds since the snapshot was fetched."""
+    now = now or datetime.now(timezone.utc)
+    fetched_at = snapshot.fetched_at
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    return (now - fetched_at).total_seconds()
+
+
+def is_fresh(snapshot: CompetitorSnapshotDB, now: Optional[datetime] = None) -> bool:
+    """Within the platform's freshness window (no refresh needed)."""
+    return snapshot_age_seconds(snapshot, now) <= COMPETITOR_SNAPSHOT_FRESHNESS.get(snapshot.platform, 0)
+
+
+def is_servable(snapshot: CompetitorSnapshotDB, now: Optional[datetime] = None) -> bool:
+    """Young enough to serve while a background refresh runs."""
+    return snapshot_age_seconds(snapshot, now) <= COMPETITOR_SNAPSHOT_MAX_AGE.get(snapshot.platform, 0)
+
+
+def snapshot_external_id(platform: str, lookup_key: str) -> Optional[str]:
+    """
+    Platform-native account ID for a lookup key, if known without an API call.
+
+    YouTube channel-ID URLs carry it; handles, usernames and custom URLs
+    are looked up in the in-process channel resolution index (warm it with
+    preload_channel_resolutions()). Twitter handles aren't resolved.
+    """
+    if platform.lower() != "youtube" or ":" not in lookup_key:
+        return None
+    identifier_type, value = lookup_key.split(":", 1)
+    if identifier_type == "id":
+        return value
+    hit, channel_id = channel_resolution_cache.get(resolution_key({"type": identifier_type, "value": value}))
+    return channel_id if hit else None
+
+
+async def load_snapshots(
+    db: AsyncSession,
+    lookups: Iterable[Tuple[str, str]]
+) -> Dict[Tuple[str, str], CompetitorSnapshotDB]:
+    """
+    Batch-load the newest snapshot per (platform, lookup key) in one query.
+
+    Keys with a known account ID (snapshot_external_id) are matched on
+    (platform, external_id); the rest fall back to the stored handle.
+    """
+    lookups = {(platform.lower(), key) for platform, key in lookups if key}
+    if not lookups:
+        return {}
+
+    by_external_id = {}
+    by_handle = set()
+    for platform, key in lookups:
+        external_id = snapshot_external_id(platform, key)
+        if external_id:
+            by_external_id[(platform, key)] = external_id
+        else:
+            by_handle.add((platform, key))
+
+    conditions = [
+        and_(CompetitorSnapshotDB.platform == platform, CompetitorSnapshotDB.external_id == external_id)
+        for (platform, _), external_id in by_external_id.items()
+    ] + [
+        and_(CompetitorSnapshotDB.platform == platform, CompetitorSnapshotDB.handle == key)
+        for platform, key in by_handle
+    ]
+    result = await db.execute(
+        select(CompetitorSnapshotDB)
+        .where(or_(*conditions))
+        .order_by(CompetitorSnapshotDB.fetched_at.desc())
+    )
+    newest_by_id: Dict[Tuple[str, str], CompetitorSnapshotDB] = {}
+    newest_by_handle: Dict[Tuple[str, str], CompetitorSnapshotDB] = {}
+    for snapshot in result.scalars().all():
+        newest_by_id.setdefault((snapshot.platform, snapshot.external_id), snapshot)
+        newest_by_handle.setdefault((snapshot.platform, snapshot.handle), snapshot)
+
+    snapshots: Dict[Tuple[str, str], CompetitorSnapshotDB] = {}
+    for (platform, key), external_id in by_external_id.items():
+        if (platform, external_id) in newest_by_id:
+            snapshots[(platform, key)] = newest_by_id[(platform, external_id)]
+    for platform, key in by_handle:
+        if (platform, key) in newest_by_handle:
+            snapshots[(platform, key)] = newest_by_handle[(platform, key)]
+    return snapshots
+
+
+async def load_competitor_items(
+    db: AsyncSession,
+    competitors_by_platform: Dict[str, List[str]]
+) -> Tuple[Dict[CompetitorRef, List[Dict[str, Any]]], List[CompetitorRef]]:
+    """
+    Resolve competitors against the snapshot store.
+
+    Returns:
+        (items for competitors that can be served from snapshots,
+         competitors whose served snapshot is stale and should be refreshed)
+    """
+    refs = {
+        (platform, url): competitor_lookup_key(platform, url)
+        for platform, urls in competitors_by_platform.items()
+        for url in urls
+    }
+    # Resolved channel IDs let any URL form of a channel find its snapshot
+    await preload_channel_resolutions(db, competitors_by_platform)
+    snapshots = await load_snapshots(db, ((platform, key) for (platform, _), key in refs.items()))
+
+    now = datetime.now(timezone.utc)
+    served: Dict[CompetitorRef, List[Dict[str, Any]]] = {}
+    stale: List[CompetitorRef] = []
+    for (platform, url), key in refs.items():
+        snapshot = snapshots.get((platform.lower(), key))
+        if snapshot is None or not is_servable(snapshot, now):
+            continue
+        served[(platform, url)] = snapshot.items or []
+        if not is_fresh(snapshot, now):
+            stale.append((platform, url))
+    return served, stale
+
+
+async def preload_channel_resolutions(
+    db: AsyncSession,
+    competitors_by_platform: Dict[str, List[str]]
+) -> int:
+    """Warm the channel resolution index for YouTube competitors about to be fetched."""
+    return await preload_resolutions(db, (
+        YouTubeService.extract_channel_identifier(url)
+        for platform, urls in competitors_by_platform.items()
+        if platform.lower() == "youtube"
+        for url in urls
+    ))
+
+
+async def save_snapshots(db: AsyncSession, fetches: Iterable[CompetitorFetch]) -> int:
+    """
+    Upsert fetched competitors (one statement). Unresolved accounts are skipped.
+
+    Returns:
+        Number of snapshots written
+    """
+    now = datetime.now(timezone.utc)
+    rows = {
+        (f.platform, f.external_id): {
+            "platform": f.platform,
+            "external_id": f.external_id,
+            "handle": f.handle,
+            "items": f.items,
+            "fetched_at": now,
+            "updated_at": now,
+        }
+        for f in fetches
+        if f is not None and f.external_id
+    }
+    if not rows:
+        return 0
+
+    insert = dialect_insert(db)
+    stmt = insert(CompetitorSnapshotDB).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CompetitorSnapshotDB.platform, CompetitorSnapshotDB.external_id],
+        set_={
+            # Subscript access: `excluded.items` would hit ColumnCollection.items()
+            "handle": stmt.excluded["handle"],
+            "items": stmt.excluded["items"],
+            "fetched_at": stmt.excluded["fetched_at"],
+            "updated_at": stmt.excluded["updated_at"],
+        }
+    )
+    await db.execute(stmt)
+    return len(rows)
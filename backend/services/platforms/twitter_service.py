@@ -128,7 +128,7 @@ class TwitterService:
             return {
                 'data': all_tweets,
                 'tweets': all_tweets,
-                'meta': {'total_fetched': len(all_tweets)}
+                'meta': {'total_fetched': len(all_tweets), 'user_id': user_id}
             }
             
         except requests.exceptions.RequestException as e:
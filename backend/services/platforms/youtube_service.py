@@ -1,10 +1,43 @@
 """YouTube data fetching service using YouTube Data API v3."""
+import asyncio
+import json
 import re
-from typing import Optional, List, Dict, Any
-from googleapiclient.discovery import build
+import threading
+from typing import Optional, List, Dict, Any, Tuple
 from googleapiclient.errors import HttpError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...config import YOUTUBE_MAX_ITEMS, YOUTUBE_API_KEY
+from .channel_resolution import (
+    channel_resolution_cache,
+    persist_resolutions,
+    preload_resolutions,
+    resolution_key,
+)
+
+# youtube/v3 discovery document, parsed once per process
+_discovery_doc: Optional[Dict[str, Any]] = None
+_discovery_lock = threading.Lock()
+
+
+def _youtube_discovery_doc() -> Dict[str, Any]:
+    """
+    Static (offline) discovery document for youtube/v3.
+    
+    Read from the copy bundled with google-api-python-client instead of
+    being fetched and re-parsed by build() for every client, so building a
+    per-thread client is cheap and never touches the network.
+    """
+    global _discovery_doc
+    if _discovery_doc is None:
+        with _discovery_lock:
+            if _discovery_doc is None:
+                from googleapiclient.discovery_cache import get_static_doc
+                content = get_static_doc('youtube', 'v3')
+                if content is None:
+                    raise RuntimeError("Bundled youtube/v3 discovery document not found (google-api-python-client >= 2.0 required)")
+                _discovery_doc = json.loads(content)
+    return _discovery_doc
 
 
 class YouTubeService:
@@ -14,7 +47,20 @@ class YouTubeService:
         """Initialize YouTube API client."""
         if not YOUTUBE_API_KEY:
             raise ValueError("YOUTUBE_API_KEY environment variable is not set")
-        self.youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+        # googleapiclient resources wrap a non-thread-safe httplib2 connection,
+        # so each thread (forensics fetches competitors concurrently) gets its own
+        self._local = threading.local()
+    
+    @property
+    def youtube(self):
+        """YouTube API client for the calling thread."""
+        client = getattr(self._local, "youtube", None)
+        if client is None:
+            # Imported here: googleapiclient.discovery is slow to import and only workers need it
+            from googleapiclient.discovery import build_from_document
+            client = build_from_document(_youtube_discovery_doc(), developerKey=YOUTUBE_API_KEY)
+            self._local.youtube = client
+        return client
     
     @staticmethod
     def extract_channel_identifier(url: str) -> Optional[Dict[str, str]]:
@@ -41,7 +87,11 @@ class YouTubeService:
     
     def extract_channel_id_from_url(self, url: str) -> Optional[str]:
         """
-        Extract and resolve channel ID from URL (convenience method for onboarding).
+        Extract and resolve channel ID from URL (blocking).
+        
+        Only consults this process's resolution cache; callers holding a
+        database session should use extract_channel_id_from_url_async so
+        stored resolutions are reused and new ones are saved.
         
         Args:
             url: YouTube channel URL
@@ -54,9 +104,34 @@ class YouTubeService:
             return None
         return self._get_channel_id_from_api(identifier)
     
+    async def extract_channel_id_from_url_async(self, db: AsyncSession, url: str) -> Optional[str]:
+        """
+        Extract and resolve channel ID from URL through the shared resolution
+        index (convenience method for onboarding).
+        
+        Loads a stored resolution for the URL first, resolves it through the
+        API (in a worker thread) only on a miss, and writes any new
+        resolution back. The caller commits.
+        
+        Args:
+            db: Database session
+            url: YouTube channel URL
+        
+        Returns:
+            Channel ID (UC...) or None if not found
+        """
+        identifier = self.extract_channel_identifier(url)
+        if not identifier:
+            return None
+        await preload_resolutions(db, [identifier])
+        channel_id = await asyncio.to_thread(self._get_channel_id_from_api, identifier)
+        await persist_resolutions(db)
+        return channel_id
+    
     def _get_channel_id_from_api(self, channel_identifier: Dict[str, str]) -> Optional[str]:
         """
-        Resolve channel identifier to channel ID using API.
+        Resolve channel identifier to channel ID, consulting the shared
+        resolution index first (see channel_resolution).
         
         Args:
             channel_identifier: Dict with 'type' ('id', 'username', 'handle') and 'value'
@@ -64,60 +139,85 @@ class YouTubeService:
         Returns:
             Channel ID (UC...) or None if not found
         """
+        key = resolution_key(channel_identifier)
+        hit, channel_id = channel_resolution_cache.get(key)
+        if hit:
+            return channel_id
+        
         try:
-            if channel_identifier['type'] == 'id':
-                # Already a channel ID, verify it exists
-                request = self.youtube.channels().list(
-                    part='id',
-                    id=channel_identifier['value']
-                )
-                response = request.execute()
-                if response.get('items'):
-                    return channel_identifier['value']
-                return None
-            
-            elif channel_identifier['type'] == 'handle':
-                # Use search with exact handle match (works in all API versions)
-                handle = channel_identifier['value'].lstrip('@')
-                # Try search with @handle for better accuracy
-                request = self.youtube.search().list(
-                    part='id,snippet',
-                    type='channel',
-                    q=f'@{handle}',
-                    maxResults=5
-                )
-                response = request.execute()
-                
-                # Find exact match by custom URL or handle
-                for item in response.get('items', []):
-                    snippet = item.get('snippet', {})
-                    # Check if customUrl matches (case-insensitive)
-                    custom_url = snippet.get('customUrl', '').lower()
-                    if custom_url == f'@{handle.lower()}' or custom_url == handle.lower():
-                        return item['id']['channelId']
-                
-                # Fallback: return first result if no exact match
-                if response.get('items'):
-                    return response['items'][0]['id']['channelId']
-                return None
-            
-            elif channel_identifier['type'] == 'username':
-                # Use forUsername parameter (legacy)
-                request = self.youtube.channels().list(
-                    part='id',
-                    forUsername=channel_identifier['value']
-                )
-                response = request.execute()
-                if response.get('items'):
-                    return response['items'][0]['id']
-                return None
-            
+            channel_id = self._resolve_channel_id(channel_identifier)
         except HttpError as e:
+            # Quota/transport errors say nothing about the handle - don't cache them
             print(f"Error resolving channel ID: {e}")
             return None
         except Exception as e:
             print(f"Unexpected error resolving channel ID: {e}")
             return None
+        
+        channel_resolution_cache.put(key, channel_id)
+        if channel_id and key[0] != 'id':
+            # Later /channel/UC... URLs for the same channel skip the verify call
+            channel_resolution_cache.put(resolution_key({'type': 'id', 'value': channel_id}), channel_id)
+        return channel_id
+    
+    def _resolve_channel_id(self, channel_identifier: Dict[str, str]) -> Optional[str]:
+        """
+        Resolve channel identifier to channel ID using API (uncached).
+        
+        Returns:
+            Channel ID (UC...) or None if the API has no such channel
+        
+        Raises:
+            HttpError: If the API call fails
+        """
+        if channel_identifier['type'] == 'id':
+            # Already a channel ID, verify it exists
+            request = self.youtube.channels().list(
+                part='id',
+                id=channel_identifier['value']
+            )
+            response = request.execute()
+            if response.get('items'):
+                return channel_identifier['value']
+            return None
+        
+        elif channel_identifier['type'] == 'handle':
+            # Use search with exact handle match (works in all API versions)
+            handle = channel_identifier['value'].lstrip('@')
+            # Try search with @handle for better accuracy
+            request = self.youtube.search().list(
+                part='id,snippet',
+                type='channel',
+                q=f'@{handle}',
+                maxResults=5
+            )
+            response = request.execute()
+            
+            # Find exact match by custom URL or handle
+            for item in response.get('items', []):
+                snippet = item.get('snippet', {})
+                # Check if customUrl matches (case-insensitive)
+                custom_url = snippet.get('customUrl', '').lower()
+                if custom_url == f'@{handle.lower()}' or custom_url == handle.lower():
+                    return item['id']['channelId']
+            
+            # Fallback: return first result if no exact match
+            if response.get('items'):
+                return response['items'][0]['id']['channelId']
+            return None
+        
+        elif channel_identifier['type'] == 'username':
+            # Use forUsername parameter (legacy)
+            request = self.youtube.channels().list(
+                part='id',
+                forUsername=channel_identifier['value']
+            )
+            response = request.execute()
+            if response.get('items'):
+                return response['items'][0]['id']
+            return None
+        
+        return None
     
     def _fetch_video_ids_from_api(self, channel_id: str, max_results: int = YOUTUBE_MAX_ITEMS) -> List[str]:
         """
@@ -252,28 +352,38 @@ class YouTubeService:
         Returns:
             List of video dictionaries with full metadata
         """
+        _, videos = self.fetch_channel(channel_url, max_items)
+        return videos
+    
+    def fetch_channel(self, channel_url: str, max_items: int = YOUTUBE_MAX_ITEMS) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """
+        Like fetch_channel_videos, but also returns the resolved channel ID.
+        
+        Returns:
+            (channel_id or None if unresolvable, videos)
+        """
         # Extract channel identifier from URL
         channel_identifier = self.extract_channel_identifier(channel_url)
         if not channel_identifier:
             print(f"Could not extract channel identifier from URL: {channel_url}")
-            return []
+            return None, []
         
         # Resolve to channel ID
         channel_id = self._get_channel_id_from_api(channel_identifier)
         if not channel_id:
             print(f"Could not resolve channel ID for: {channel_identifier}")
-            return []
+            return None, []
         
         # Fetch video IDs
         video_ids = self._fetch_video_ids_from_api(channel_id, max_items)
         if not video_ids:
             print(f"No videos found for channel: {channel_id}")
-            return []
+            return channel_id, []
         
         # Fetch video details
         videos = self._get_video_details_from_api(video_ids)
         
-        return videos[:max_items]
+        return channel_id, videos[:max_items]
     
     @staticmethod
     def classify_videos_by_traction(videos: List[Dict[str, Any]]) -> tuple[List[Dict], List[Dict]]:
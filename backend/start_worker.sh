@@ -10,13 +10,14 @@ echo "⏸️  Press Ctrl+C to stop"
 echo ""
 
 # Start Celery worker with:
-# - 2 concurrent workers (adjust based on CPU cores)
+# - Prefork pool: each child process keeps its own event loop and pooled
+#   DB engine for its lifetime (see celery_app.init_worker_runtime)
+# - CELERY_CONCURRENCY child processes (default 2, adjust based on CPU cores)
 # - INFO log level (change to DEBUG for troubleshooting)
-# - Autoreload on code changes (disable in production)
 
 celery -A backend.celery_app worker \
     --loglevel=info \
-    --concurrency=2 \
-    --pool=solo \
+    --concurrency="${CELERY_CONCURRENCY:-2}" \
+    --pool=prefork \
     --task-events \
     --without-heartbeat
@@ -0,0 +1,182 @@
+"""Content-addressed blob storage for generated media (thumbnails)."""
+import hashlib
+import os
+import re
+import tempfile
+from typing import Iterator, NamedTuple, Optional
+
+from ..config import (
+    BLOB_STORE_BACKEND,
+    BLOB_STORE_PATH,
+    BLOB_STORE_BUCKET,
+    BLOB_STORE_ENDPOINT_URL,
+    MEDIA_BASE_URL,
+)
+
+# "<sha256>.<ext>" - also guards the filesystem backend against path traversal
+BLOB_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}\.[a-z0-9]{1,5}$")
+
+CONTENT_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "webp": "image/webp",
+    "gif": "image/gif",
+}
+EXTENSIONS = {content_type: ext for ext, content_type in CONTENT_TYPES.items()}
+
+CHUNK_SIZE = 64 * 1024
+
+
+class BlobInfo(NamedTuple):
+    """Metadata needed to serve a blob."""
+    size: int
+    content_type: str
+
+
+def is_blob_key(value: Optional[str]) -> bool:
+    """Whether a stored value is a blob key (vs. a legacy data URI or external URL)."""
+    return bool(value) and bool(BLOB_KEY_PATTERN.match(value))
+
+
+def blob_key_for(data: bytes, content_type: str) -> str:
+    """Key derived from content, so identical images are stored once."""
+    extension = EXTENSIONS.get(content_type.split(";")[0].strip().lower(), "png")
+    return f"{hashlib.sha256(data).hexdigest()}.{extension}"
+
+
+def content_type_for(key: str) -> str:
+    """Content type from the key's extension."""
+    return CONTENT_TYPES.get(key.rsplit(".", 1)[-1], "application/octet-stream")
+
+
+def media_url(value: Optional[str]) -> Optional[str]:
+    """
+    Public URL for a stored media reference, built at read time.
+
+    Blob keys become MEDIA_BASE_URL/media/{key}; anything else (legacy data
+    URIs, external URLs) is returned unchanged.
+    """
+    if is_blob_key(value):
+        return f"{MEDIA_BASE_URL}/media/{value}"
+    return value
+
+
+class FilesystemBlobStore:
+    """Blobs as files under a local directory (dev/test, single-host deployments)."""
+
+    def __init__(self, root: str = BLOB_STORE_PATH):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        # Two-level fan-out keeps directories small
+        return os.path.join(self.root, key[:2], key)
+
+    def put(self, data: bytes, content_type: str = "image/png") -> str:
+        """Store bytes and return their key (no-op if already stored)."""
+        key = blob_key_for(data, content_type)
+        path = self._path(key)
+        if os.path.exists(path):
+            return key
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return key
+
+    def stat(self, key: str) -> Optional[BlobInfo]:
+        """Size and content type, or None if the blob does not exist."""
+        try:
+            size = os.path.getsize(self._path(key))
+        except OSError:
+            return None
+        return BlobInfo(size=size, content_type=content_type_for(key))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Whole blob, or None if it does not exist."""
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def iter_range(self, key: str, start: int, end: int) -> Iterator[bytes]:
+        """Yield bytes start..end (inclusive) in chunks."""
+        remaining = end - start + 1
+        with open(self._path(key), "rb") as f:
+            f.seek(start)
+            while remaining > 0:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+class S3BlobStore:
+    """Blobs in an S3-compatible bucket (AWS S3, R2, MinIO)."""
+
+    def __init__(self, bucket: Optional[str] = BLOB_STORE_BUCKET, endpoint_url: Optional[str] = BLOB_STORE_ENDPOINT_URL):
+        if not bucket:
+            raise ValueError("BLOB_STORE_BUCKET environment variable is required for the s3 blob store")
+        try:
+            import boto3
+        except ImportError as e:
+            raise ValueError("The s3 blob store requires boto3 (pip install boto3)") from e
+        self.bucket = bucket
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def put(self, data: bytes, content_type: str = "image/png") -> str:
+        """Store bytes and return their key."""
+        key = blob_key_for(data, content_type)
+        if self.stat(key) is None:
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=data,
+                ContentType=content_type_for(key),
+            )
+        return key
+
+    def stat(self, key: str) -> Optional[BlobInfo]:
+        """Size and content type, or None if the blob does not exist."""
+        from botocore.exceptions import ClientError
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError:
+            return None
+        return BlobInfo(size=head["ContentLength"], content_type=content_type_for(key))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Whole blob, or None if it does not exist."""
+        from botocore.exceptions import ClientError
+        try:
+            obj = self.client.get_object(Bucket=self.bucket, Key=key)
+        except ClientError:
+            return None
+        return obj["Body"].read()
+
+    def iter_range(self, key: str, start: int, end: int) -> Iterator[bytes]:
+        """Yield bytes start..end (inclusive) in chunks."""
+        obj = self.client.get_object(Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end}")
+        yield from obj["Body"].iter_chunks(CHUNK_SIZE)
+
+
+def create_blob_store():
+    """Blob store for the configured backend."""
+    if BLOB_STORE_BACKEND == "s3":
+        return S3BlobStore()
+    if BLOB_STORE_BACKEND == "filesystem":
+        return FilesystemBlobStore()
+    raise ValueError(f"Unsupported BLOB_STORE_BACKEND: {BLOB_STORE_BACKEND}")
+
+
+# Global singleton instance
+blob_store = create_blob_store()
@@ -4,9 +4,13 @@ from .campaign_tasks import (
     analyze_campaign_outcome_task,
     analyze_previous_campaigns_task
 )
+from .competitor_tasks import refresh_competitor_snapshot_task
+from .profile_tasks import analyze_creator_profile_task
 
 __all__ = [
     "run_campaign_workflow_task",
     "analyze_campaign_outcome_task",
-    "analyze_previous_campaigns_task"
+    "analyze_previous_campaigns_task",
+    "refresh_competitor_snapshot_task",
+    "analyze_creator_profile_task"
 ]
@@ -1,27 +1,42 @@
 """Celery tasks for campaign workflow execution."""
-import asyncio
 from datetime import datetime, timezone
+from typing import Any, Dict, Optional
 from sqlalchemy import select
 from celery import Task
-from ..celery_app import celery_app, get_async_session
+from ..celery_app import celery_app, get_async_session, run_async
 from ..models.db.campaign import CampaignDB
 from ..services.core.agent_orchestrator import AgentOrchestrator
+from ..services.core.campaign_hydration import CONTENT_WITHOUT_MEDIA, load_campaign
+from ..services.core.task_events import build_task_status, publish_task_event
 
 
 class CallbackTask(Task):
-    """Base task class with progress tracking support."""
+    """Base task class with progress tracking support.
     
-    def update_progress(self, progress: int, message: str):
-        """Update task progress and message."""
-        self.update_state(
-            state="STARTED",
-            meta={
-                "progress": progress,
-                "message": message,
-                "current": progress,
-                "total": 100
-            }
-        )
+    Progress and final state are also published to the task's Redis
+    channel for GET /tasks/{task_id}/events.
+    """
+    
+    def update_progress(self, progress: int, message: str, details: Optional[Dict[str, Any]] = None):
+        """Update task progress and message (details: stage, unit counts, elapsed/ETA)."""
+        meta = {
+            "progress": progress,
+            "message": message,
+            "current": progress,
+            "total": 100,
+            "details": details
+        }
+        self.update_state(state="STARTED", meta=meta)
+        publish_task_event(build_task_status(self.request.id, "STARTED", meta))
+    
+    def on_success(self, retval, task_id, args, kwargs):
+        publish_task_event(build_task_status(task_id, "SUCCESS", retval))
+    
+    def on_retry(self, exc, task_id, args, kwargs, einfo):
+        publish_task_event(build_task_status(task_id, "RETRY", exc))
+    
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        publish_task_event(build_task_status(task_id, "FAILURE", exc))
 
 
 @celery_app.task(bind=True, base=CallbackTask, max_retries=3, default_retry_delay=60)
@@ -29,14 +44,11 @@ def run_campaign_workflow_task(self, campaign_id: str):
     """
     Execute complete 6-agent campaign workflow asynchronously.
     
-    Progress checkpoints:
-    - 0%: Started
-    - 16%: Context analysis complete
-    - 33%: Strategy complete
-    - 50%: Forensics complete
-    - 66%: Planner complete
-    - 83%: Content generation complete
-    - 100%: Workflow complete
+    Progress (see WORKFLOW_PROGRESS_STAGES, throttled):
+    - 0-10%: Strategy
+    - 10-25%: Forensics
+    - 25-35%: Planner
+    - 35-100%: Content, advancing as each day finishes
     
     Args:
         campaign_id: Campaign UUID
@@ -72,9 +84,9 @@ def run_campaign_workflow_task(self, campaign_id: str):
                 # Create orchestrator with progress callback
                 orchestrator = AgentOrchestrator()
                 
-                def progress_callback(progress: int, message: str):
+                def progress_callback(progress: int, message: str, details=None):
                     """Callback for agent progress updates."""
-                    self.update_progress(progress, message)
+                    self.update_progress(progress, message, details)
                 
                 # Execute workflow with progress tracking
                 await orchestrator.run_campaign_workflow(
@@ -117,9 +129,9 @@ def run_campaign_workflow_task(self, campaign_id: str):
                 # Raise exception for Celery retry logic
                 raise
     
-    # Run async workflow in event loop
+    # Run async workflow on the worker event loop
     try:
-        return asyncio.run(run_workflow())
+        return run_async(run_workflow())
     except Exception as exc:
         # Retry on failure with exponential backoff
         raise self.retry(exc=exc, countdown=2 ** self.request.retries)
@@ -131,8 +143,7 @@ def analyze_campaign_outcome_task(self, campaign_id: str, actual_metrics: dict):
     Analyze campaign outcome and generate report asynchronously.
     
     Progress checkpoints:
-    - 0%: Started
-    - 50%: Analyzing outcomes
+    - 0%: Started / analyzing outcomes
     - 100%: Report complete
     
     Args:
@@ -148,11 +159,9 @@ def analyze_campaign_outcome_task(self, campaign_id: str, actual_metrics: dict):
                 # Update initial progress
                 self.update_progress(0, "Starting outcome analysis...")
                 
-                # Load campaign
-                result = await db.execute(
-                    select(CampaignDB).where(CampaignDB.campaign_id == campaign_id)
-                )
-                campaign_db = result.scalar_one_or_none()
+                # Load campaign with day rows attached (outcome analysis
+                # doesn't need scripts or thumbnails)
+                campaign_db = await load_campaign(db, campaign_id, content_columns=CONTENT_WITHOUT_MEDIA)
                 
                 if not campaign_db:
                     raise ValueError(f"Campaign {campaign_id} not found")
@@ -169,14 +178,9 @@ def analyze_campaign_outcome_task(self, campaign_id: str, actual_metrics: dict):
                 # Create orchestrator
                 orchestrator = AgentOrchestrator()
                 
-                def progress_callback(progress: int, message: str):
+                def progress_callback(progress: int, message: str, details=None):
                     """Callback for progress updates."""
-                    self.update_progress(progress, message)
-                
-                self.update_progress(50, "Analyzing campaign outcomes...")
-                
-                # Refresh object to load all attributes (avoid lazy-loading in wrong context)
-                await db.refresh(campaign_db)
+                    self.update_progress(progress, message, details)
                 
                 # Convert DB model to Pydantic (simplified for orchestrator)
                 from ..models.campaign.campaign import Campaign
@@ -226,9 +230,9 @@ def analyze_campaign_outcome_task(self, campaign_id: str, actual_metrics: dict):
                 
                 raise
     
-    # Run async analysis in event loop
+    # Run async analysis on the worker event loop
     try:
-        return asyncio.run(run_analysis())
+        return run_async(run_analysis())
     except Exception as exc:
         raise self.retry(exc=exc, countdown=2 ** self.request.retries)
 
@@ -238,10 +242,9 @@ def analyze_previous_campaigns_task(self, user_id: str, campaign_id: str):
     """
     Analyze previous campaigns for learning insights (future Gemini integration).
     
-    Progress checkpoints:
-    - 0%: Started
-    - 50%: Fetching past campaigns
-    - 100%: Analysis complete
+    Progress (see LEARNING_PROGRESS_STAGES):
+    - 0-40%: Fetching past campaigns
+    - 40-100%: Summarizing, one unit per campaign
     
     Args:
         user_id: User UUID
@@ -268,11 +271,9 @@ def analyze_previous_campaigns_task(self, user_id: str, campaign_id: str):
                 # Create orchestrator
                 orchestrator = AgentOrchestrator()
                 
-                def progress_callback(progress: int, message: str):
+                def progress_callback(progress: int, message: str, details=None):
                     """Callback for progress updates."""
-                    self.update_progress(progress, message)
-                
-                self.update_progress(50, "Fetching past campaigns...")
+                    self.update_progress(progress, message, details)
                 
                 # Analyze previous campaigns
                 insights = await orchestrator.analyze_previous_campaigns(
@@ -310,5 +311,5 @@ def analyze_previous_campaigns_task(self, user_id: str, campaign_id: str):
                 # Don't retry for this task - not critical
                 raise
     
-    # Run async analysis in event loop
-    return asyncio.run(run_analysis())
+    # Run async analysis on the worker event loop
+    return run_async(run_analysis())
@@ -0,0 +1,70 @@
+"""Celery tasks for the shared competitor snapshot store."""
+import asyncio
+from ..celery_app import celery_app, get_async_session, run_async
+from ..services.platforms.competitor_store import (
+    competitor_lookup_key,
+    fetch_competitor,
+    is_fresh,
+    load_snapshots,
+    preload_channel_resolutions,
+    save_snapshots,
+)
+from ..services.platforms.channel_resolution import persist_resolutions
+
+
+def _platform_services(platform: str):
+    """The shared platform client the refresh needs (the other slot is None)."""
+    from ..services.core.container import container
+    if platform == "youtube":
+        return container.youtube, None
+    if platform == "twitter":
+        return None, container.twitter
+    raise ValueError(f"Unsupported platform: {platform}")
+
+
+@celery_app.task(bind=True, max_retries=2, default_retry_delay=300)
+def refresh_competitor_snapshot_task(self, platform: str, competitor_url: str):
+    """
+    Re-fetch a stale competitor snapshot outside the campaign request path.
+    
+    Several campaigns may enqueue the same competitor; the freshness check
+    up front turns the duplicates into no-ops.
+    
+    Args:
+        platform: "youtube" or "twitter"
+        competitor_url: Competitor channel URL or Twitter handle
+    
+    Returns:
+        dict with platform, handle and refresh status
+    """
+    platform = platform.lower()
+    handle = competitor_lookup_key(platform, competitor_url)
+    
+    async def run_refresh():
+        async with get_async_session() as db:
+            # Resolved channel IDs let any URL form of the channel find its snapshot
+            await preload_channel_resolutions(db, {platform: [competitor_url]})
+            snapshots = await load_snapshots(db, [(platform, handle)])
+            snapshot = snapshots.get((platform, handle))
+            if snapshot is not None and is_fresh(snapshot):
+                return {"platform": platform, "handle": handle, "status": "already_fresh"}
+            
+            youtube_service, twitter_service = _platform_services(platform)
+            fetched = await asyncio.to_thread(
+                fetch_competitor, platform, competitor_url, youtube_service, twitter_service
+            )
+            saved = await save_snapshots(db, [fetched])
+            await persist_resolutions(db)
+            await db.commit()
+            
+            return {
+                "platform": platform,
+                "handle": handle,
+                "status": "refreshed" if saved else "unresolved",
+                "items": len(fetched.items)
+            }
+    
+    try:
+        return run_async(run_refresh())
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
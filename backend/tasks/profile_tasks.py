@@ -0,0 +1,83 @@
+"""Celery tasks for creator profile analysis."""
+from typing import Any, Dict
+from sqlalchemy import select
+from ..celery_app import celery_app, get_async_session, run_async
+from ..models.db.user import CreatorProfileDB
+from ..services.core.container import container
+from ..services.core.profile_analysis import apply_context_analysis
+from .campaign_tasks import CallbackTask
+
+
+async def _load_profile(db, user_id: str):
+    result = await db.execute(select(CreatorProfileDB).where(CreatorProfileDB.user_id == user_id))
+    return result.scalar_one_or_none()
+
+
+@celery_app.task(bind=True, base=CallbackTask, max_retries=2, default_retry_delay=30)
+def analyze_creator_profile_task(self, user_id: str, creator_data: Dict[str, Any], fingerprint: str):
+    """
+    Run the Context Analyzer for a creator profile and store its output.
+
+    Progress checkpoints:
+    - 0%: Started
+    - 100%: Analysis stored (or skipped because a newer submission superseded it)
+
+    Args:
+        user_id: User UUID (creator_profiles primary key)
+        creator_data: Analyzer input (profile_analysis.context_analyzer_input)
+        fingerprint: analysis_fingerprint(creator_data)
+
+    Returns:
+        dict with user_id, status ("analyzed", "superseded" or "missing")
+        and, once analyzed, the regenerated_sections
+    """
+    async def run_analysis():
+        async with get_async_session() as db:
+            self.update_progress(0, "Analyzing creator profile...")
+
+            profile_db = await _load_profile(db, user_id)
+            if not profile_db:
+                return {"user_id": user_id, "status": "missing", "message": "Profile no longer exists"}
+            if profile_db.analysis_fingerprint != fingerprint:
+                return {"user_id": user_id, "status": "superseded", "message": "Profile changed; newer analysis queued"}
+
+            # Only sections whose inputs changed since the stored analysis are regenerated
+            agent_context = profile_db.agent_context or {}
+            analysis = await container.context_analyzer.analyze_incremental_async(
+                creator_data,
+                previous_output=agent_context.get("_analyzed_context"),
+                previous_fingerprints=agent_context.get("_context_section_fingerprints")
+            )
+
+            # The profile may have been re-submitted during the LLM call
+            await db.refresh(profile_db)
+            if profile_db.analysis_fingerprint != fingerprint:
+                return {"user_id": user_id, "status": "superseded", "message": "Profile changed; newer analysis queued"}
+
+            apply_context_analysis(profile_db, analysis.output, fingerprint, analysis.section_fingerprints)
+            await db.commit()
+
+            self.update_progress(100, "Creator profile analyzed")
+            return {
+                "user_id": user_id,
+                "status": "analyzed",
+                "regenerated_sections": analysis.regenerated,
+                "message": "Context analysis complete"
+            }
+
+    async def clear_pending():
+        async with get_async_session() as db:
+            profile_db = await _load_profile(db, user_id)
+            if profile_db and profile_db.analysis_fingerprint == fingerprint:
+                profile_db.analysis_pending = False
+                profile_db.analysis_task_id = None
+                await db.commit()
+
+    try:
+        return run_async(run_analysis())
+    except Exception as exc:
+        if self.request.retries >= self.max_retries:
+            # Out of retries: the profile stays usable without analysis (a re-submission queues a new run)
+            run_async(clear_pending())
+            raise
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import asyncio
 from backend.services.ai.image_service import ImageService
+from backend.storage.blob_store import blob_store, media_url
 
 
 # Mock content data - simulating 3 days of campaign content
@@ -115,11 +116,11 @@ async def test_image_generation():
             )
             
             if image_data:
-                # Image data is a base64 data URI
-                size_kb = len(image_data) / 1024
+                # Image data is a blob store key; bytes live in the blob store
+                size_kb = blob_store.stat(image_data).size / 1024
                 print(f"   ✅ Thumbnail generated successfully!")
                 print(f"      Size: {size_kb:.2f} KB")
-                print(f"      Format: {image_data[:30]}...")
+                print(f"      URL: {media_url(image_data)}")
                 print()
                 
                 generated_images.append({
@@ -159,10 +160,8 @@ async def test_image_generation():
         print()
         print(f"   Total size: {total_size:.2f} KB")
         print()
-        print("💡 TIP: These images are base64 data URIs that can be:")
-        print("   1. Saved to database as-is")
-        print("   2. Displayed in HTML: <img src='data:image/...' />")
-        print("   3. Converted to files if needed")
+        print("💡 TIP: Images are stored in the blob store; the database keeps only the key")
+        print("   and the API serves the bytes at /media/{key}.")
     else:
         print("⚠️  No images were generated.")
         print("   Check your POLLINATIONS_API_KEY and API quota/balance.")
@@ -202,8 +201,8 @@ async def test_single_image():
         )
         
         if image_data:
-            print(f"✅ Success! Generated {len(image_data)/1024:.2f} KB image")
-            print(f"   Data URI prefix: {image_data[:50]}...")
+            print(f"✅ Success! Generated {blob_store.stat(image_data).size/1024:.2f} KB image")
+            print(f"   URL: {media_url(image_data)}")
         else:
             print("⚠️  No image returned")
             
@@ -2,7 +2,7 @@
 import pytest
 import asyncio
 from typing import AsyncGenerator
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -305,6 +305,8 @@ def mock_agents(mock_context_output):
         pass
     
     with patch('backend.agents.core.context_analyzer.ContextAnalyzer.analyze', return_value=mock_context_output), \
+         patch('backend.agents.core.context_analyzer.ContextAnalyzer.analyze_async', new_callable=AsyncMock, return_value=mock_context_output), \
          patch('backend.services.core.agent_orchestrator.AgentOrchestrator.run_campaign_workflow', side_effect=mock_run_campaign_workflow), \
-         patch('backend.services.core.agent_orchestrator.AgentOrchestrator.analyze_previous_campaigns', return_value={}):
+         patch('backend.services.core.agent_orchestrator.AgentOrchestrator.analyze_previous_campaigns', return_value={}), \
+         patch('backend.tasks.profile_tasks.analyze_creator_profile_task.apply_async'):
         yield
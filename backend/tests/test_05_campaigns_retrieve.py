@@ -62,6 +62,51 @@ class TestCampaignRetrieval:
         for cid in campaign_ids:
             assert cid in returned_ids
     
+    def test_list_campaigns_paginated(self, client, auth_headers, phase1_profile_data, campaign_create_data):
+        """Test GET /campaigns is paginated (20 per page by default) and the X-Next-Cursor pages cover every campaign exactly once."""
+        client.post("/onboarding", json=phase1_profile_data, headers=auth_headers)
+
+        campaign_ids = []
+        for i in range(5):
+            data = campaign_create_data.copy()
+            data["goal_aim"] = f"Goal {i}"
+            response = client.post("/campaigns", json=data, headers=auth_headers)
+            campaign_ids.append(response.json()["campaign_id"])
+
+        returned_ids = []
+        cursor = None
+        for _ in range(5):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/campaigns", params=params, headers=auth_headers)
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page) <= 2
+            # Summary projection only
+            assert all("campaign_plan" not in c for c in page)
+            returned_ids.extend(c["campaign_id"] for c in page)
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert sorted(returned_ids) == sorted(campaign_ids)
+
+    def test_next_cursor_exposed_to_browsers(self):
+        """Test cross-origin clients (Vite dev server) may read X-Next-Cursor."""
+        from fastapi.testclient import TestClient
+        from backend.main import app
+
+        response = TestClient(app).get("/health", headers={"Origin": "http://localhost:5173"})
+        assert "x-next-cursor" in response.headers["access-control-expose-headers"].lower()
+
+    def test_list_campaigns_invalid_cursor(self, client, auth_headers, phase1_profile_data):
+        """Test malformed cursor is rejected."""
+        client.post("/onboarding", json=phase1_profile_data, headers=auth_headers)
+
+        response = client.get("/campaigns", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+        assert response.status_code == 400
+
     def test_list_campaigns_empty(self, client, auth_headers, phase1_profile_data):
         """Test listing campaigns when user has none."""
         client.post("/onboarding", json=phase1_profile_data, headers=auth_headers)
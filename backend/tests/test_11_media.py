@@ -0,0 +1,91 @@
+"""Test media serving from the blob store."""
+import pytest
+
+from backend.api.media import RangeNotSatisfiable, _parse_range
+from backend.storage import blob_store as blob_store_module
+from backend.storage.blob_store import FilesystemBlobStore
+
+
+IMAGE_BYTES = bytes(range(256)) * 8
+
+
+@pytest.fixture
+def stored_key(tmp_path, monkeypatch):
+    """Store a fake image in a temporary filesystem blob store."""
+    store = FilesystemBlobStore(root=str(tmp_path))
+    monkeypatch.setattr(blob_store_module, "blob_store", store)
+    monkeypatch.setattr("backend.api.media.blob_store", store)
+    return store.put(IMAGE_BYTES, "image/png")
+
+
+@pytest.mark.unit
+class TestMedia:
+    """Test /media/{key} streaming, caching and range support."""
+
+    def test_get_full_image(self, client, stored_key):
+        """Test full download with immutable caching headers."""
+        response = client.get(f"/media/{stored_key}")
+
+        assert response.status_code == 200
+        assert response.content == IMAGE_BYTES
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["etag"] == f'"{stored_key.split(".")[0]}"'
+        assert "immutable" in response.headers["cache-control"]
+
+    def test_conditional_get(self, client, stored_key):
+        """Test If-None-Match returns 304 without a body."""
+        etag = client.get(f"/media/{stored_key}").headers["etag"]
+
+        response = client.get(f"/media/{stored_key}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_byte_range(self, client, stored_key):
+        """Test single byte range and suffix range requests."""
+        response = client.get(f"/media/{stored_key}", headers={"Range": "bytes=100-199"})
+        assert response.status_code == 206
+        assert response.content == IMAGE_BYTES[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(IMAGE_BYTES)}"
+
+        response = client.get(f"/media/{stored_key}", headers={"Range": "bytes=-16"})
+        assert response.status_code == 206
+        assert response.content == IMAGE_BYTES[-16:]
+
+    def test_unsatisfiable_range(self, client, stored_key):
+        """Test range past the end of the blob."""
+        response = client.get(f"/media/{stored_key}", headers={"Range": f"bytes={len(IMAGE_BYTES)}-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(IMAGE_BYTES)}"
+
+    def test_malformed_or_multi_range_ignored(self, client, stored_key):
+        """Test ranges the server doesn't parse are ignored and the full body is served."""
+        for header in ("bytes=0-1,5-6", "bytes=200-100", "items=0-10", "bytes=", "bytes=abc"):
+            response = client.get(f"/media/{stored_key}", headers={"Range": header})
+            assert response.status_code == 200, header
+            assert response.content == IMAGE_BYTES
+            assert "content-range" not in response.headers
+
+    def test_blob_store_get(self, tmp_path):
+        """Test whole-blob reads (used to rebuild data URIs on downgrade)."""
+        store = FilesystemBlobStore(root=str(tmp_path))
+        key = store.put(IMAGE_BYTES, "image/png")
+        assert store.get(key) == IMAGE_BYTES
+        assert store.get("0" * 64 + ".png") is None
+
+    def test_parse_range(self):
+        """Test which headers are served partially, ignored, or rejected with 416."""
+        assert _parse_range("bytes=10-", 100) == (10, 99)
+        assert _parse_range("bytes=10-500", 100) == (10, 99)
+        assert _parse_range("bytes=-500", 100) == (0, 99)
+        for ignored in ("bytes=0-1,5-6", "bytes=20-10", "items=0-10", "bytes=-"):
+            assert _parse_range(ignored, 100) is None
+        for unsatisfiable in ("bytes=100-", "bytes=100-200", "bytes=-0"):
+            with pytest.raises(RangeNotSatisfiable):
+                _parse_range(unsatisfiable, 100)
+        with pytest.raises(RangeNotSatisfiable):
+            _parse_range("bytes=0-", 0)
+
+    def test_unknown_or_invalid_key(self, client, stored_key):
+        """Test missing blobs and malformed keys return 404."""
+        assert client.get(f"/media/{'0' * 64}.png").status_code == 404
+        assert client.get("/media/not-a-key.png").status_code == 404
@@ -0,0 +1,104 @@
+"""Test incremental JSON parsing of LLM responses."""
+import json
+
+import pytest
+
+from backend.models.agents.agent_outputs import ContentAgentOutput, ContentBatchOutput
+from backend.services.ai.json_stream import IncrementalJSONParser, JSONStreamError, parse_json_response
+
+
+CONTENT = {
+    "title": "5 Python Tricks",
+    "youtube_script": "Hook: did you know...",
+    "seo_tags": ["python", "tips"],
+    "cta": "Subscribe for more"
+}
+
+
+def feed_in_chunks(parser, text, size=7):
+    for i in range(0, len(text), size):
+        parser.feed(text[i:i + size])
+
+
+@pytest.mark.unit
+class TestIncrementalJSONParser:
+    """Test streamed parsing, early field delivery and early aborts."""
+
+    def test_fields_delivered_as_they_complete(self):
+        """Test title is handed over before the script has streamed in."""
+        seen = []
+        parser = IncrementalJSONParser(ContentAgentOutput, lambda name, value: seen.append(name))
+        text = json.dumps(CONTENT)
+        title_end = text.index('"youtube_script"')
+
+        parser.feed(text[:title_end])
+        assert seen == ["title"]
+
+        feed_in_chunks(parser, text[title_end:])
+        result = parser.finish()
+        assert seen == ["title", "youtube_script", "seo_tags", "cta"]
+        assert result.title == CONTENT["title"]
+        assert result.seo_tags == ["python", "tips"]
+
+    def test_markdown_fence_and_trailing_text(self):
+        """Test preamble, fences and trailing commentary are tolerated."""
+        text = "Here you go:\n```json\n" + json.dumps(CONTENT) + "\n```\nHope this helps!"
+        result = parse_json_response(text, ContentAgentOutput)
+        assert result.cta == CONTENT["cta"]
+
+    def test_braces_inside_strings(self):
+        """Test brackets and escaped quotes inside strings don't affect nesting."""
+        content = dict(CONTENT, youtube_script='Say "{hi}" and [wave] \\ }')
+        result = parse_json_response(json.dumps(content), ContentAgentOutput)
+        assert result.youtube_script == content["youtube_script"]
+
+    def test_formatted_trailing_commas(self):
+        """Test trailing commas followed by whitespace/newlines are tolerated at any depth."""
+        text = (
+            '{\n  "title": "5 Python Tricks",\n'
+            '  "seo_tags": [\n    "python",\n    "tips",\n  ],\n'
+            '  "cta": "Subscribe",\n}'
+        )
+        result = parse_json_response(text, ContentAgentOutput)
+        assert result.seo_tags == ["python", "tips"] and result.cta == "Subscribe"
+
+    def test_commas_before_brackets_inside_strings_kept(self):
+        """Test ",}" and ",]" inside string values are not rewritten."""
+        content = dict(CONTENT, youtube_script="Use {a,} and [b,] as written")
+        text = json.dumps(content)[:-1] + ",\n}"
+        result = parse_json_response(text, ContentAgentOutput)
+        assert result.youtube_script == "Use {a,} and [b,] as written"
+
+    def test_wrong_field_type_aborts_early(self):
+        """Test a mistyped field fails before the rest of the response arrives."""
+        parser = IncrementalJSONParser(ContentAgentOutput)
+        with pytest.raises(JSONStreamError):
+            parser.feed('{"seo_tags": "not-a-list", "youtube_script": "')
+
+    def test_mismatched_bracket_aborts(self):
+        """Test structurally broken JSON fails immediately."""
+        parser = IncrementalJSONParser(ContentAgentOutput)
+        with pytest.raises(JSONStreamError):
+            parser.feed('{"seo_tags": ["a", "b"}')
+
+    def test_truncated_response(self):
+        """Test a response that ends mid-object is rejected."""
+        parser = IncrementalJSONParser(ContentAgentOutput)
+        parser.feed(json.dumps(CONTENT)[:-10])
+        with pytest.raises(JSONStreamError):
+            parser.finish()
+
+    def test_batch_items_delivered_individually(self):
+        """Test each day of a batched response is validated and delivered on its own."""
+        seen = []
+
+        def on_field(name, value):
+            if name.startswith("days["):
+                seen.append((name, value.day_number))
+
+        parser = IncrementalJSONParser(ContentBatchOutput, on_field)
+        days = [dict(CONTENT, day_number=1), dict(CONTENT, day_number=2)]
+        feed_in_chunks(parser, json.dumps({"days": days}))
+
+        assert seen == [("days[0]", 1), ("days[1]", 2)]
+        assert [day.day_number for day in parser.finish().days] == [1, 2]
@@ -0,0 +1,78 @@
+"""Test token-aware compaction of prompt sections."""
+import json
+
+import pytest
+
+from backend.services.ai.prompt_compaction import (
+    CompactionPolicy,
+    batch_policy,
+    compact_json,
+    estimate_tokens,
+)
+
+
+FOOTER = "Follow me on instagram: https://instagram.com/creator\nUse code CREATOR for 10% off"
+
+
+def make_video(i):
+    return {
+        "title": f"Video {i}",
+        "description": f"Breakdown of topic {i}.\n{FOOTER}",
+        "views": 1000 * i,
+        "likes": 0,
+        "thumbnail_url": "https://i.ytimg.com/vi/abc/default.jpg",
+        "tags": [],
+        "channel_id": "UC123",
+    }
+
+
+@pytest.mark.unit
+class TestCompactJSON:
+    """Test allow-lists, dedupe, budgets and minified output."""
+
+    def test_smaller_than_indented_json(self):
+        """Test the compact section is well under the pretty-printed size."""
+        videos = [make_video(i) for i in range(10)]
+        assert estimate_tokens(compact_json(videos, "videos")) < estimate_tokens(json.dumps(videos, indent=2)) / 2
+
+    def test_allow_list_and_empty_values(self):
+        """Test fields outside the allow-list and empty values are dropped, zeros kept."""
+        video = json.loads(compact_json([make_video(1)], "videos"))[0]
+        assert set(video) == {"title", "description", "views", "likes"}
+        assert video["likes"] == 0
+
+    def test_repeated_lines_emitted_once(self):
+        """Test description boilerplate shared by several videos appears once."""
+        text = compact_json([make_video(i) for i in range(5)], "videos")
+        assert text.count("instagram.com/creator") == 1
+        assert "Breakdown of topic 4." in text
+
+    def test_string_budget(self):
+        """Test long strings are cut to the field budget."""
+        policy = CompactionPolicy(field_budgets={"text": 50})
+        text = json.loads(compact_json({"text": "word " * 100}, policy=policy))["text"]
+        assert len(text) <= 50 and text.endswith("…")
+
+    def test_token_budget(self):
+        """Test a section is shrunk until it fits its token budget."""
+        policy = CompactionPolicy(default_budget=2000, max_items=50, max_tokens=300)
+        text = compact_json([{"text": f"item {i} " * 200} for i in range(50)], policy=policy)
+        assert estimate_tokens(text) <= 300
+        json.loads(text)
+
+    def test_over_budget_drops_whole_items(self, caplog):
+        """Test a section still too big after shrinking drops items and stays valid JSON."""
+        policy = CompactionPolicy(max_tokens=100)
+        value = {"themes": [f"theme number {i} " * 5 for i in range(30)], "goal": "Grow to 10k subscribers"}
+        with caplog.at_level("WARNING"):
+            text = compact_json(value, policy=policy)
+        parsed = json.loads(text)
+        assert estimate_tokens(text) <= 100
+        assert parsed["goal"] == "Grow to 10k subscribers"
+        # Leading items survive intact; trailing ones are dropped
+        assert 0 < len(parsed["themes"]) < 30 and parsed["themes"][0] == value["themes"][0]
+        assert "dropped" in caplog.text
+
+    def test_batch_policy_scales_budget(self):
+        """Test a batch section gets one token budget per entry."""
+        assert batch_policy(CompactionPolicy(max_tokens=600), 3).max_tokens == 1800
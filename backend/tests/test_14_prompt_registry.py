@@ -0,0 +1,83 @@
+"""Test the precompiled prompt template registry."""
+import pytest
+
+from backend.services.ai import gemini_service
+from backend.services.ai.gemini_service import PROMPT_ARGUMENTS, GeminiService, render_prompt
+from backend.services.ai.prompt_registry import PromptRegistry, PromptTemplateError, prompt_registry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    (tmp_path / "platform_specific").mkdir()
+    (tmp_path / "greeting.txt").write_text("Hello {name}! Output {{\"ok\": true}}", encoding="utf-8")
+    (tmp_path / "platform_specific" / "nested.txt").write_text("Platform: {platform}", encoding="utf-8")
+    return PromptRegistry(tmp_path)
+
+
+@pytest.mark.unit
+class TestPromptRegistry:
+    """Test loading, rendering, versions and startup validation."""
+
+    def test_render_matches_str_format(self, registry):
+        """Test compiled rendering is identical to str.format, including escaped braces."""
+        template = registry.get("greeting.txt")
+        assert template.render(name="Ada") == template.text.format(name="Ada")
+        assert registry.render("nested.txt", platform="youtube") == "Platform: youtube"
+
+    def test_version_tracks_content(self, registry, tmp_path):
+        """Test the version changes when the file content changes."""
+        before = registry.version("greeting.txt")
+        (tmp_path / "greeting.txt").write_text("Hi {name}", encoding="utf-8")
+        assert PromptRegistry(tmp_path).version("greeting.txt") != before
+        assert registry.cache_tag("greeting.txt") == f"greeting.txt@{before}"
+
+    def test_missing_argument(self, registry):
+        """Test rendering without a placeholder's argument fails clearly."""
+        with pytest.raises(PromptTemplateError):
+            registry.render("greeting.txt")
+
+    def test_validate_reports_unsupplied_placeholders(self, registry):
+        """Test validation fails when a caller doesn't supply every placeholder."""
+        registry.validate({"greeting.txt": {"name"}})
+        with pytest.raises(PromptTemplateError):
+            registry.validate({"greeting.txt": {"first_name"}})
+        with pytest.raises(PromptTemplateError):
+            registry.validate({"missing.txt": set()})
+
+    def test_shipped_prompts_match_request_builders(self):
+        """Test every agent prompt in the repo matches the arguments its builder passes."""
+        prompt_registry.validate(PROMPT_ARGUMENTS)
+        for name, arguments in PROMPT_ARGUMENTS.items():
+            assert prompt_registry.get(name).placeholders == arguments
+
+    def test_render_prompt_rejects_undeclared_arguments(self):
+        """Test rendering with arguments that differ from PROMPT_ARGUMENTS fails."""
+        arguments = {name: "x" for name in PROMPT_ARGUMENTS["agent6_outcome.txt"]}
+        assert render_prompt("agent6_outcome.txt", **arguments)
+        with pytest.raises(PromptTemplateError):
+            render_prompt("agent6_outcome.txt", extra="x", **arguments)
+        arguments.pop("goal")
+        with pytest.raises(PromptTemplateError):
+            render_prompt("agent6_outcome.txt", **arguments)
+
+    def test_every_request_builder_renders(self, monkeypatch):
+        """Test each request builder renders its template with the declared arguments."""
+        rendered = []
+
+        def recording_render(name, **kwargs):
+            rendered.append(name)
+            return render_prompt(name, **kwargs)
+
+        monkeypatch.setattr(gemini_service, "render_prompt", recording_render)
+        service = GeminiService()
+        day_plan = {"topic": "Async Python"}
+        service._context_request({"category": "Tech", "platforms": ["YouTube"]})
+        service._context_sections_request({"category": "Tech"}, ["content_dna"], {"creator_identity": {}})
+        service._strategy_request("Grow", {"creator_identity": {"niche": "Tech"}}, past_learnings=[])
+        service._forensics_request("youtube", [{"title": "Hit"}], [{"title": "Miss"}])
+        service._twitter_request("twitter", [{"text": "Hit"}], [{"text": "Miss"}])
+        service._plan_request({"goal_aim": "Grow"}, {"themes": []})
+        service._content_request(day_plan, {}, 1, platforms=["youtube", "twitter"])
+        service._content_batch_request({1: day_plan, 2: day_plan}, {}, 3)
+        service._outcome_request({"goal_aim": "Grow"}, {"views": 10}, {"day_1": day_plan})
+        assert set(rendered) == set(PROMPT_ARGUMENTS)
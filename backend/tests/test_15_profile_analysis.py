@@ -0,0 +1,151 @@
+"""Test background context analysis requests and their deduplication."""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from backend.agents.core.context_analyzer import CONTEXT_SECTIONS, ContextAnalyzer
+from backend.services.core.profile_analysis import (
+    analysis_fingerprint,
+    apply_context_analysis,
+    request_profile_analysis,
+)
+
+
+class FakeSession:
+    """Just enough of AsyncSession for request_profile_analysis."""
+
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, obj):
+        pass
+
+
+def make_profile(**overrides):
+    fields = dict(
+        user_id="user-1",
+        agent_context={},
+        analysis_pending=False,
+        analysis_task_id=None,
+        analysis_fingerprint=None,
+        recommended_frequency=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+CREATOR_DATA = {"user_id": "user-1", "category": "Tech", "platforms": ["YouTube"]}
+
+
+@pytest.mark.unit
+class TestProfileAnalysis:
+    """Test queueing, dedupe of unchanged input and storing results."""
+
+    def test_fingerprint_ignores_key_order(self):
+        """Test the fingerprint depends on content only."""
+        reordered = dict(reversed(list(CREATOR_DATA.items())))
+        assert analysis_fingerprint(reordered) == analysis_fingerprint(CREATOR_DATA)
+        assert analysis_fingerprint(dict(CREATOR_DATA, category="Cooking")) != analysis_fingerprint(CREATOR_DATA)
+
+    async def test_queues_and_marks_pending(self):
+        """Test a new input is committed as pending before the task is sent."""
+        db, profile = FakeSession(), make_profile()
+        with patch("backend.tasks.profile_tasks.analyze_creator_profile_task.apply_async") as send:
+            task_id = await request_profile_analysis(db, profile, CREATOR_DATA)
+
+        assert task_id and profile.analysis_pending and profile.analysis_task_id == task_id
+        assert profile.analysis_fingerprint == analysis_fingerprint(CREATOR_DATA)
+        assert send.call_args.kwargs["task_id"] == task_id
+        assert db.commits == 1
+
+    async def test_unchanged_input_not_reanalyzed(self):
+        """Test re-submitting the same data reuses the pending task, then skips once analyzed."""
+        db, profile = FakeSession(), make_profile()
+        with patch("backend.tasks.profile_tasks.analyze_creator_profile_task.apply_async") as send:
+            first = await request_profile_analysis(db, profile, CREATOR_DATA)
+            again = await request_profile_analysis(db, profile, dict(CREATOR_DATA))
+            assert again == first and send.call_count == 1
+
+            output = SimpleNamespace(model_dump=lambda: {"niche": "Tech"}, strategic_insights={})
+            apply_context_analysis(profile, output, profile.analysis_fingerprint)
+            assert not profile.analysis_pending and profile.analysis_task_id is None
+            assert await request_profile_analysis(db, profile, CREATOR_DATA) is None
+
+            changed = await request_profile_analysis(db, profile, dict(CREATOR_DATA, category="Cooking"))
+            assert changed and changed != first and send.call_count == 2
+
+    async def test_revert_to_analyzed_input_supersedes_pending_run(self):
+        """Test A analyzed, B queued, revert to A: the B run no longer matches the profile."""
+        db, profile = FakeSession(), make_profile()
+        data_a, data_b = CREATOR_DATA, dict(CREATOR_DATA, category="Cooking")
+        output = SimpleNamespace(model_dump=lambda: {"niche": "Tech"}, strategic_insights={})
+        apply_context_analysis(profile, output, analysis_fingerprint(data_a))
+        profile.analysis_fingerprint = analysis_fingerprint(data_a)
+
+        with patch("backend.tasks.profile_tasks.analyze_creator_profile_task.apply_async"):
+            task_b = await request_profile_analysis(db, profile, data_b)
+            assert task_b and profile.analysis_fingerprint == analysis_fingerprint(data_b)
+
+            assert await request_profile_analysis(db, profile, data_a) is None
+
+        # The B task compares its fingerprint with the profile's before and after the LLM call
+        assert profile.analysis_fingerprint == analysis_fingerprint(data_a) != analysis_fingerprint(data_b)
+        assert not profile.analysis_pending and profile.analysis_task_id is None
+
+    async def test_broker_failure_clears_pending(self):
+        """Test a profile isn't left pending forever when the task can't be sent."""
+        db, profile = FakeSession(), make_profile()
+        with patch(
+            "backend.tasks.profile_tasks.analyze_creator_profile_task.apply_async",
+            side_effect=ConnectionError("broker down")
+        ):
+            assert await request_profile_analysis(db, profile, CREATOR_DATA) is None
+        assert not profile.analysis_pending and profile.analysis_task_id is None
+
+
+class FakeGemini:
+    """Records which sections each partial re-analysis asked for (full runs use the mock_agents output)."""
+
+    def __init__(self):
+        self.requested = []
+
+    async def analyze_context_sections_async(self, creator_data, sections, known_sections):
+        assert not set(sections) & set(known_sections)
+        self.requested.append(list(sections))
+        return SimpleNamespace(model_dump=lambda: {section: {"regenerated": True} for section in sections})
+
+
+@pytest.mark.unit
+class TestIncrementalContextAnalysis:
+    """Test that only sections with changed inputs are regenerated."""
+
+    async def test_only_changed_sections_regenerated(self):
+        """Test a motivation edit re-runs identity/strategy and keeps the other sections."""
+        gemini = FakeGemini()
+        analyzer = ContextAnalyzer(gemini=gemini)
+        first = await analyzer.analyze_incremental_async(CREATOR_DATA)
+        assert first.regenerated == list(CONTEXT_SECTIONS)
+
+        updated = dict(CREATOR_DATA, why_create="Build a personal brand")
+        second = await analyzer.analyze_incremental_async(
+            updated, first.output.model_dump(), first.section_fingerprints
+        )
+        assert set(second.regenerated) == {"creator_identity", "strategic_insights"}
+        assert gemini.requested == [second.regenerated]
+        assert second.output.constraints == first.output.constraints
+        assert second.output.creator_identity == {"regenerated": True}
+
+    async def test_unchanged_input_makes_no_call(self):
+        """Test re-analysis with identical input reuses the stored output."""
+        gemini = FakeGemini()
+        analyzer = ContextAnalyzer(gemini=gemini)
+        first = await analyzer.analyze_incremental_async(CREATOR_DATA)
+        again = await analyzer.analyze_incremental_async(
+            CREATOR_DATA, first.output.model_dump(), first.section_fingerprints
+        )
+        assert again.regenerated == [] and gemini.requested == []
+        assert again.output == first.output
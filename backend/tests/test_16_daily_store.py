@@ -0,0 +1,80 @@
+"""Test bulk upserts of daily content and execution rows."""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.services.core.daily_store import upsert_daily_content, upsert_daily_execution
+
+
+class FakeSession:
+    """Records executed statements; reports the PostgreSQL dialect."""
+
+    def __init__(self):
+        self.statements = []
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+def compiled(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+def content_row(day, **overrides):
+    row = {
+        "campaign_id": "campaign-1",
+        "day_number": day,
+        "platform": "youtube",
+        "video_title": f"Day {day}",
+        "seo_tags": ["tag"],
+        "thumbnail_urls": {},
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.unit
+class TestDailyStore:
+    """Test one statement per batch, the conflict target and preserved columns."""
+
+    async def test_wave_is_one_statement(self):
+        """Test a batch of days becomes a single multi-row upsert."""
+        db = FakeSession()
+        assert await upsert_daily_content(db, [content_row(day) for day in range(1, 31)]) == 30
+        assert len(db.statements) == 1
+
+        sql = str(compiled(db.statements[0]))
+        assert "ON CONFLICT (campaign_id, day_number, platform) DO UPDATE" in sql
+        update_clause = sql.split("DO UPDATE SET", 1)[1]
+        assert "video_title = excluded.video_title" in update_clause
+        assert "updated_at = now()" in update_clause
+        # The stored row keeps its ID and creation time
+        assert "content_id" not in update_clause and "created_at" not in update_clause
+
+    async def test_duplicate_keys_collapse(self):
+        """Test the last row for a day/platform wins and empty batches skip the database."""
+        db = FakeSession()
+        assert await upsert_daily_content(db, []) == 0
+        assert db.statements == []
+
+        written = await upsert_daily_content(db, [content_row(1), content_row(1, video_title="Retry")])
+        assert written == 1
+        params = compiled(db.statements[0]).params
+        assert "Retry" in params.values()
+
+    async def test_execution_defaults_executed_at(self):
+        """Test confirmations get an executed_at and update posting flags on conflict."""
+        db = FakeSession()
+        await upsert_daily_execution(db, [{
+            "campaign_id": "campaign-1", "day_number": 2, "platform": "youtube",
+            "posted_to_youtube": True, "posted_to_twitter": False,
+        }])
+        stmt = compiled(db.statements[0])
+        assert stmt.params["executed_at_m0"] is not None
+        update_clause = str(stmt).split("DO UPDATE SET", 1)[1]
+        assert "posted_to_youtube = excluded.posted_to_youtube" in update_clause
+        assert "execution_id" not in update_clause
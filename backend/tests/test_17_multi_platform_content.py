@@ -0,0 +1,116 @@
+"""Test per-platform content rows generated from one Content Agent call."""
+import pytest
+
+from backend.agents.core.content_agent import content_platforms
+from backend.api.campaign.campaigns import _daily_content_from_rows
+from backend.models.agents.agent_outputs import ContentAgentOutput
+from backend.models.db.campaign import DailyContentDB
+from backend.services.core.agent_orchestrator import AgentOrchestrator
+
+
+class FakeContentAgent:
+    """Returns content for every platform and records the platforms asked for."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def generate_content_async(self, **kwargs):
+        self.calls.append(kwargs["platforms"])
+        return ContentAgentOutput(
+            youtube_script="Script",
+            title="Async Python in 10 minutes",
+            seo_tags=["python"],
+            cta="Subscribe",
+            x_tweet="t" * 300,
+            x_thread=["1/ Async Python", "2/ Event loops"],
+        )
+
+    async def generate_content_batch_async(self, day_plans, **kwargs):
+        self.calls.append(sorted(day_plans))
+        return {day: ContentAgentOutput(title=f"Day {day}") for day in day_plans}
+
+
+def make_orchestrator():
+    orchestrator = AgentOrchestrator()
+    orchestrator.content_agent = FakeContentAgent()
+    return orchestrator
+
+
+ONBOARDING = {
+    "goal": {"platforms": ["YouTube", "X"]},
+    "image_generation_enabled": False,
+    "seo_optimization_enabled": False,
+}
+
+
+@pytest.mark.unit
+class TestMultiPlatformContent:
+    """Test platform selection, row building and read-side merging."""
+
+    def test_content_platforms(self):
+        """Test names are normalized, X maps to Twitter and unsupported platforms fall back to YouTube."""
+        assert content_platforms(["Twitter", "YouTube"]) == ["youtube", "twitter"]
+        assert content_platforms(["X"]) == ["twitter"]
+        assert content_platforms(["LinkedIn"]) == ["youtube"]
+        assert content_platforms(None) == ["youtube"]
+
+    async def test_one_call_writes_every_platform_row(self):
+        """Test a day produces a YouTube and a Twitter row from a single call."""
+        orchestrator = make_orchestrator()
+        rows, stages = await orchestrator._generate_day_content(
+            campaign_id="campaign-1", campaign_plan={}, profile_snapshot={}, onboarding=ONBOARDING,
+            day=1, duration_days=3, platforms=["youtube", "twitter"]
+        )
+        assert orchestrator.content_agent.calls == [["youtube", "twitter"]]
+        assert set(rows) == {"youtube", "twitter"} and stages == ["content", "thumbnail", "seo"]
+        assert rows["youtube"]["video_title"] == "Async Python in 10 minutes"
+        assert rows["youtube"]["tweet_text"] is None
+        assert len(rows["twitter"]["tweet_text"]) == 280
+        assert rows["twitter"]["thread_tweets"] == ["1/ Async Python", "2/ Event loops"]
+        assert rows["twitter"]["video_title"] is None
+        # Same columns on every row, so a wave is one multi-row upsert
+        assert rows["youtube"].keys() == rows["twitter"].keys()
+
+    async def test_missing_platform_row_regenerates_content(self):
+        """Test a day resumed without its Twitter row is regenerated, a complete one is not."""
+        orchestrator = make_orchestrator()
+        youtube_only = {"youtube": AgentOrchestrator._content_row(
+            "campaign-1", 1, "youtube", ContentAgentOutput(title="Old")
+        )}
+        rows, _ = await orchestrator._generate_day_content(
+            campaign_id="campaign-1", campaign_plan={}, profile_snapshot={}, onboarding=ONBOARDING,
+            day=1, duration_days=3, platforms=["youtube", "twitter"],
+            existing_rows=youtube_only, completed_stages=["content", "thumbnail", "seo"]
+        )
+        assert len(orchestrator.content_agent.calls) == 1 and set(rows) == {"youtube", "twitter"}
+
+        again, _ = await orchestrator._generate_day_content(
+            campaign_id="campaign-1", campaign_plan={}, profile_snapshot={}, onboarding=ONBOARDING,
+            day=1, duration_days=3, platforms=["youtube", "twitter"],
+            existing_rows=rows, completed_stages=["content", "thumbnail", "seo"]
+        )
+        assert len(orchestrator.content_agent.calls) == 1 and again == rows
+
+    async def test_batches_not_capped_by_concurrency(self, monkeypatch):
+        """Test K days go to each call even when K exceeds CONTENT_GENERATION_CONCURRENCY."""
+        monkeypatch.setattr("backend.services.core.agent_orchestrator.CONTENT_GENERATION_CONCURRENCY", 2)
+        orchestrator = make_orchestrator()
+        generated = await orchestrator._generate_content_batches(
+            list(range(1, 11)), {}, {}, {}, 10, platforms=["youtube"], batch_size=5
+        )
+        assert orchestrator.content_agent.calls == [[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]]
+        assert sorted(generated) == list(range(1, 11))
+
+    def test_rows_merge_per_day(self):
+        """Test a day's YouTube and Twitter rows read back as one DailyContent."""
+        records = [
+            DailyContentDB(day_number=1, platform="twitter", tweet_text="Tweet", thread_tweets=["1/"],
+                           video_script=None, video_title=None, seo_tags=None, call_to_action=None,
+                           thumbnail_urls=None),
+            DailyContentDB(day_number=1, platform="youtube", tweet_text=None, thread_tweets=None,
+                           video_script="Script", video_title="Title", seo_tags=["python"],
+                           call_to_action="Subscribe", thumbnail_urls={}),
+        ]
+        content = _daily_content_from_rows(records)[1]
+        assert content.youtube_title == "Title" and content.youtube_seo_tags == ["python"]
+        assert content.x_tweet == "Tweet" and content.x_thread == ["1/"]
@@ -0,0 +1,177 @@
+"""Test relevance-ranked learning memory retrieval."""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.ai.gemini_service import format_learnings
+from backend.services.core import learning_memory
+from backend.services.core.learning_memory import (
+    LearningMemoryCache,
+    learning_memory_cache,
+    memory_terms,
+    query_terms,
+    rank_learnings,
+    retrieve_learnings,
+    save_learning_memory,
+    tokenize,
+)
+
+NOW = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+
+def memory(memory_id, niche, goal_type="growth", platform="YouTube", days_old=0, terms=True):
+    record = {
+        "memory_id": memory_id,
+        "goal_type": goal_type,
+        "platform": platform,
+        "niche": niche,
+        "what_worked": ["Short tutorials"],
+        "what_failed": ["Long intros"],
+        "recommendations": ["Post weekly"],
+        "goal_achievement_summary": "Reached 80% of goal",
+        "created_at": NOW - timedelta(days=days_old),
+    }
+    record["relevance_terms"] = memory_terms(niche, goal_type, platform, ["Short tutorials"]) if terms else None
+    return record
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Serves learning_memories rows; counts queries."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+        self.added = []
+
+    async def execute(self, stmt):
+        self.queries += 1
+        return FakeResult([dict(row) for row in self.rows])
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        pass
+
+
+class FakeRedis:
+    """In-memory stand-in for the shared Redis holding generation counters."""
+
+    def __init__(self):
+        self.values = {}
+        self.pending = []
+
+    async def get(self, key):
+        value = self.values.get(key)
+        return str(value).encode() if value is not None else None
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def incr(self, key):
+        self.pending.append(key)
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        for key in self.pending:
+            self.values[key] = self.values.get(key, 0) + 1
+        self.pending = []
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(learning_memory, "get_async_redis", lambda: redis)
+    learning_memory._redis_backoff.reset()
+    learning_memory_cache.clear()
+    yield redis
+    learning_memory_cache.clear()
+
+
+@pytest.mark.unit
+class TestLearningMemory:
+    """Test ranking by similarity and recency, caching and prompt formatting."""
+
+    def test_tokenize_normalizes_niches(self):
+        """Test case, punctuation, stopwords and plurals don't stop near-identical niches matching."""
+        assert tokenize("Tech Tutorials for Beginners!") == ["tech", "tutorial", "beginner"]
+        assert set(tokenize("tech tutorial")) <= set(tokenize("Tech Tutorials for Beginners"))
+
+    def test_similar_niche_outranks_newer_unrelated(self):
+        """Test a near-identical niche beats a newer memory from an unrelated niche."""
+        candidates = [
+            memory("cooking", "Home cooking recipes", days_old=1),
+            memory("tech", "Tech tutorials for beginners", days_old=60),
+            memory("fitness", "Fitness and workouts", days_old=5),
+        ]
+        ranked = rank_learnings(
+            candidates, query_terms("tech tutorial", "growth", ["YouTube"]), "growth", ["YouTube"], top_k=2, now=NOW
+        )
+        assert [learning["memory_id"] for learning in ranked][0] == "tech"
+        assert len(ranked) == 2 and ranked[0]["relevance"] > ranked[1]["relevance"]
+
+    def test_recency_breaks_ties(self):
+        """Test equally similar memories are ordered newest first."""
+        candidates = [memory("old", "Tech tutorials", days_old=200), memory("new", "Tech tutorials", days_old=2)]
+        ranked = rank_learnings(candidates, query_terms("Tech tutorials", "growth", ["YouTube"]), "growth", ["YouTube"], now=NOW)
+        assert [learning["memory_id"] for learning in ranked] == ["new", "old"]
+
+    async def test_cached_until_memory_saved(self):
+        """Test repeated lookups are served from the cache and a save invalidates it."""
+        db = FakeSession([memory("tech", "Tech tutorials", terms=False)])
+        first = await retrieve_learnings(db, "user-1", "tech tutorials", "growth", ["YouTube"])
+        again = await retrieve_learnings(db, "user-1", "tech tutorials", "growth", ["YouTube"])
+        assert first == again and first[0]["memory_id"] == "tech"
+        assert db.queries == 1
+
+        saved = await save_learning_memory(
+            db, user_id="user-1", campaign_id="campaign-2", goal_type="growth", platform="YouTube",
+            niche="Tech tutorials", campaign_duration_days=7, posting_frequency="moderate",
+            what_worked=["Shorts"], what_failed=[], recommendations=["Keep shorts"]
+        )
+        assert saved.relevance_terms and "tech" in saved.relevance_terms
+        await retrieve_learnings(db, "user-1", "tech tutorials", "growth", ["YouTube"])
+        assert db.queries == 2
+
+    async def test_save_in_another_process_invalidates(self, monkeypatch, clear_cache):
+        """Test a memory saved by another process (its own cache, shared Redis) is picked up."""
+        db = FakeSession([memory("tech", "Tech tutorials", terms=False)])
+        await retrieve_learnings(db, "user-1", "tech tutorials", "growth", ["YouTube"])
+        await retrieve_learnings(db, "user-1", "tech tutorials", "growth", ["YouTube"])
+        assert db.queries == 1
+
+        # The Celery worker saving the memory has its own in-process cache
+        monkeypatch.setattr(learning_memory, "learning_memory_cache", LearningMemoryCache())
+        await save_learning_memory(
+            db, user_id="user-1", campaign_id="campaign-2", goal_type="growth", platform="YouTube",
+            niche="Tech tutorials", campaign_duration_days=7, posting_frequency="moderate",
+            what_worked=["Shorts"], what_failed=[], recommendations=["Keep shorts"]
+        )
+        monkeypatch.setattr(learning_memory, "learning_memory_cache", learning_memory_cache)
+        assert clear_cache.values == {"learning-memory:generation:user-1": 1}
+
+        await retrieve_learnings(db, "user-1", "tech tutorials", "growth", ["YouTube"])
+        assert db.queries == 2
+
+    def test_format_learnings_accepts_dicts_and_objects(self):
+        """Test prompt formatting works for retrieved dicts and OutcomeAgentOutput-like objects."""
+        learning = rank_learnings([memory("tech", "Tech tutorials")], {}, "growth", [], now=NOW)[0]
+        text = format_learnings([learning], include_context=True)
+        assert "Niche: Tech tutorials" in text and "Suggestions: Post weekly" in text
+        outcome = SimpleNamespace(what_worked=["Hooks"], what_failed=[], next_campaign_suggestions=["More hooks"])
+        assert "Suggestions: More hooks" in format_learnings([outcome])
+        assert format_learnings([]) == "No previous campaign data available."
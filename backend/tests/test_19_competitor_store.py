@@ -0,0 +1,99 @@
+"""Test competitor snapshot lookups by resolved account ID."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.platforms.channel_resolution import channel_resolution_cache, resolution_key
+from backend.services.platforms.competitor_store import competitor_lookup_key, load_snapshots
+from backend.services.platforms.youtube_service import YouTubeService
+
+
+class FakeSession:
+    """Returns the given snapshots for any query; keeps the statements."""
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.statements = []
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        snapshots = self.snapshots
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: snapshots))
+
+
+def snapshot(external_id, handle, platform="youtube"):
+    return SimpleNamespace(
+        platform=platform, external_id=external_id, handle=handle, items=[{"id": "v1"}],
+        fetched_at=datetime.now(timezone.utc)
+    )
+
+
+@pytest.mark.unit
+class TestCompetitorSnapshotLookup:
+    """Test that every URL form of a channel finds the same snapshot."""
+
+    async def test_url_forms_share_snapshot_by_channel_id(self):
+        """Test a handle URL and a channel-ID URL both hit the row stored under the channel ID."""
+        channel_resolution_cache.put(resolution_key({"type": "handle", "value": "@FireshipTest"}), "UCfire", persist=False)
+        handle_key = competitor_lookup_key("youtube", "https://www.youtube.com/@FireshipTest")
+        id_key = competitor_lookup_key("youtube", "https://www.youtube.com/channel/UCfire")
+        # The row's handle is whichever URL form saved it last
+        stored = snapshot("UCfire", id_key)
+        db = FakeSession([stored])
+
+        found = await load_snapshots(db, [("youtube", handle_key), ("YouTube", id_key)])
+        assert found == {("youtube", handle_key): stored, ("youtube", id_key): stored}
+        assert "external_id" in str(db.statements[0])
+
+    async def test_unresolved_key_falls_back_to_handle(self):
+        """Test identifiers not in the resolution index (and Twitter handles) match on handle."""
+        stored_yt = snapshot("UCother", "handle:not-resolved-yet")
+        stored_x = snapshot("12345", "someone", platform="twitter")
+        db = FakeSession([stored_yt, stored_x])
+
+        found = await load_snapshots(db, [("youtube", "handle:not-resolved-yet"), ("twitter", "someone")])
+        assert found[("youtube", "handle:not-resolved-yet")] is stored_yt
+        assert found[("twitter", "someone")] is stored_x
+
+
+class FakeYouTubeService(YouTubeService):
+    """Counts API resolutions instead of calling YouTube."""
+
+    def __init__(self):
+        super().__init__()
+        self.api_calls = []
+
+    def _resolve_channel_id(self, channel_identifier):
+        self.api_calls.append(channel_identifier["value"])
+        return "UCnew"
+
+
+@pytest.mark.unit
+class TestChannelIdFromUrl:
+    """Test onboarding resolution goes through the shared resolution index."""
+
+    async def test_stored_resolution_skips_api(self):
+        """Test a resolution stored by another worker is loaded instead of calling the API."""
+        stored = SimpleNamespace(
+            identifier_type="handle", identifier_value="storedchannel", channel_id="UCstored",
+            resolved_at=datetime.now(timezone.utc)
+        )
+        service = FakeYouTubeService()
+        db = FakeSession([stored])
+
+        channel_id = await service.extract_channel_id_from_url_async(db, "https://www.youtube.com/@StoredChannel")
+        assert channel_id == "UCstored" and service.api_calls == []
+
+    async def test_new_resolution_is_persisted(self):
+        """Test an API resolution is written back for other workers."""
+        service = FakeYouTubeService()
+        db = FakeSession([])
+
+        channel_id = await service.extract_channel_id_from_url_async(db, "https://www.youtube.com/@BrandNewChannel")
+        assert channel_id == "UCnew" and service.api_calls == ["BrandNewChannel"]
+        assert "channel_resolutions" in str(db.statements[-1])
+        assert channel_resolution_cache.drain_pending() == {}
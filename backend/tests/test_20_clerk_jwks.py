@@ -0,0 +1,138 @@
+"""Test Clerk JWKS caching: single-flight, refresh-ahead, backoff and max staleness."""
+import asyncio
+import time
+
+import jwt
+import pytest
+
+from backend.services.core.clerk_service import ClerkService
+
+
+class FakeFetcher:
+    """Stands in for ClerkService._fetch_jwks; counts fetches and can fail or block."""
+
+    def __init__(self, service, keys=("kid-1",)):
+        self.service = service
+        self.keys = list(keys)
+        self.calls = 0
+        self.fail = False
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("JWKS endpoint down")
+        jwks = {"keys": [{"kid": kid} for kid in self.keys]}
+        self.service._signing_keys = {kid: f"key-{kid}" for kid in self.keys}
+        self.service._jwks_cache = jwks
+        self.service._jwks_cache_time = time.monotonic()
+        return jwks
+
+
+def make_service():
+    service = ClerkService()
+    service._cache_ttl = 3600
+    service._refresh_ahead = 300
+    service._min_refresh_interval = 30
+    service._max_staleness = 900
+    fetcher = FakeFetcher(service)
+    service._fetch_jwks = fetcher
+    return service, fetcher
+
+
+def age_cache(service, seconds):
+    """Pretend the cached key set and the last refresh attempt are `seconds` old."""
+    service._jwks_cache_time = time.monotonic() - seconds
+    service._last_refresh_attempt = time.monotonic() - seconds
+
+
+async def settle(service):
+    if service._refresh_task is not None:
+        await asyncio.gather(service._refresh_task, return_exceptions=True)
+
+
+@pytest.mark.unit
+class TestClerkJwksCache:
+    """Test the JWKS cache on the token verification path."""
+
+    async def test_concurrent_first_calls_share_one_fetch(self):
+        """Test callers arriving before the first fetch completes wait on the same request."""
+        service, fetcher = make_service()
+        fetcher.release.clear()
+        waiting = [asyncio.create_task(service.get_jwks()) for _ in range(5)]
+        await asyncio.sleep(0)
+        fetcher.release.set()
+        results = await asyncio.gather(*waiting)
+        assert fetcher.calls == 1
+        assert all(result == {"keys": [{"kid": "kid-1"}]} for result in results)
+
+    async def test_near_expiry_served_from_cache_and_refreshed_once(self):
+        """Test a key set inside the refresh-ahead window returns at once and refreshes in the background."""
+        service, fetcher = make_service()
+        await service.get_jwks()
+        age_cache(service, 3400)
+        fetcher.release.clear()
+        stale = service._jwks_cache
+
+        assert await service.get_jwks() is stale
+        assert await service.get_jwks() is stale
+        fetcher.release.set()
+        await settle(service)
+        assert fetcher.calls == 2
+        assert service._jwks_cache is not stale
+
+    async def test_failed_background_refresh_backs_off(self):
+        """Test a failed refresh isn't retried on every request within the min refresh interval."""
+        service, fetcher = make_service()
+        await service.get_jwks()
+        age_cache(service, 3700)
+        fetcher.fail = True
+
+        await service.get_jwks()
+        await settle(service)
+        for _ in range(3):
+            await service.get_jwks()
+        assert fetcher.calls == 2
+
+        service._last_refresh_attempt = time.monotonic() - 31
+        await service.get_jwks()
+        await settle(service)
+        assert fetcher.calls == 3
+
+    async def test_past_max_staleness_fails_closed(self):
+        """Test a key set past TTL + max staleness is not served when the refresh fails."""
+        service, fetcher = make_service()
+        await service.get_jwks()
+        age_cache(service, 3600 + 900)
+        fetcher.fail = True
+
+        with pytest.raises(RuntimeError):
+            await service.get_jwks()
+        assert service._jwks_cache is None and service._signing_keys == {}
+        token = jwt.encode({"sub": "user_1"}, "secret", headers={"kid": "kid-1"})
+        assert await service.verify_token(token) is None
+
+    async def test_past_max_staleness_waits_for_fresh_keys(self):
+        """Test a hard-expired key set is replaced before the call returns."""
+        service, fetcher = make_service()
+        await service.get_jwks()
+        age_cache(service, 3600 + 900)
+        fetcher.keys = ["kid-2"]
+
+        assert await service.get_jwks() == {"keys": [{"kid": "kid-2"}]}
+        assert fetcher.calls == 2
+
+    async def test_unknown_kid_refresh_is_rate_limited(self):
+        """Test unknown kids force one refresh, then none until the min interval passes."""
+        service, fetcher = make_service()
+        await service.get_jwks()
+        age_cache(service, 60)
+        fetcher.keys = ["kid-1", "kid-rotated"]
+
+        assert await service._get_signing_key("kid-rotated") == "key-kid-rotated"
+        assert fetcher.calls == 2
+        assert await service._get_signing_key("garbage") is None
+        assert await service._get_signing_key("garbage-2") is None
+        assert fetcher.calls == 2
@@ -0,0 +1,137 @@
+"""Test resuming the campaign workflow from workflow_checkpoint."""
+from types import SimpleNamespace
+
+import pytest
+
+from backend.models.agents.agent_outputs import ContentAgentOutput
+from backend.models.db.campaign import CampaignDB
+from backend.services.core import agent_orchestrator
+from backend.services.core.agent_orchestrator import DAY_STAGES, AgentOrchestrator
+
+# Captured at import: the autouse mock_agents fixture patches it out for API tests
+run_campaign_workflow = AgentOrchestrator.run_campaign_workflow
+
+FORENSICS_YT = {"hook_patterns": ["Question hooks"]}
+
+
+class FakeResult:
+    def __init__(self, scalar=None, rows=()):
+        self._scalar = scalar
+        self._rows = list(rows)
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+    def scalar(self):
+        return self._scalar
+
+    def mappings(self):
+        return SimpleNamespace(all=lambda: self._rows)
+
+
+class FakeSession:
+    """Serves the campaign and its stored day-1 row; records upserted day numbers."""
+
+    def __init__(self, campaign, content_rows):
+        self.campaign = campaign
+        self.content_rows = content_rows
+        self.upserted = []
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    async def execute(self, stmt):
+        sql = str(stmt)
+        if sql.startswith("INSERT INTO daily_content"):
+            params = stmt.compile().params
+            self.upserted.extend(value for key, value in params.items() if key.startswith("day_number"))
+            return FakeResult()
+        if "FROM campaigns" in sql:
+            return FakeResult(scalar=self.campaign)
+        if "FROM creator_profiles" in sql:
+            return FakeResult(scalar=None)
+        if "count(" in sql:
+            return FakeResult(scalar=3)
+        if "FROM daily_content" in sql:
+            return FakeResult(rows=self.content_rows)
+        raise AssertionError(f"Unexpected query: {sql}")
+
+    async def commit(self):
+        pass
+
+
+class MustNotRun:
+    """Agent stand-in that fails the test if a completed stage runs again."""
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            raise AssertionError(f"{name} ran although its stage is checkpointed")
+        return fail
+
+
+class FakeContentAgent:
+    def __init__(self):
+        self.days = []
+
+    def batch_size(self, day_plans, creator_context, platforms=None):
+        return 1
+
+    async def generate_content_async(self, **kwargs):
+        self.days.append(kwargs["day_number"])
+        return ContentAgentOutput(title=f"Day {kwargs['day_number']}", youtube_script="Script")
+
+
+def make_campaign():
+    return CampaignDB(
+        campaign_id="campaign-1",
+        user_id="user-1",
+        status="processing",
+        profile_snapshot={},
+        onboarding_data={
+            "goal": {"goal_aim": "Grow", "goal_type": "growth", "platforms": ["YouTube"], "duration_days": 3},
+            "competitors": {"platforms": [{"platform": "YouTube", "urls": ["https://www.youtube.com/@rival"]}]},
+            "agent_config": {"run_forensics": True},
+            "image_generation_enabled": False,
+            "seo_optimization_enabled": False,
+        },
+        strategy_output={"themes": ["Async Python"]},
+        campaign_plan={"day_1": {"topic": "Intro"}, "day_2": {"topic": "Loops"}, "day_3": {"topic": "Tasks"}},
+        workflow_checkpoint={
+            "strategy": True,
+            "planner": True,
+            "forensics": {"YouTube": FORENSICS_YT},
+            "days": {"1": list(DAY_STAGES)},
+        },
+    )
+
+
+@pytest.mark.unit
+class TestWorkflowResume:
+    """Test a retried workflow skips everything its checkpoint records."""
+
+    async def test_resume_skips_completed_stages(self, monkeypatch):
+        """Test strategy, planner, forensics and finished days are reused, not regenerated."""
+        async def no_learnings(*args, **kwargs):
+            return []
+
+        monkeypatch.setattr(agent_orchestrator, "retrieve_learnings", no_learnings)
+        orchestrator = AgentOrchestrator()
+        orchestrator.strategy_agent = MustNotRun()
+        orchestrator.planner_agent = MustNotRun()
+        orchestrator.forensics_agent = MustNotRun()
+        orchestrator.content_agent = FakeContentAgent()
+
+        campaign = make_campaign()
+        day_one = AgentOrchestrator._content_row("campaign-1", 1, "youtube", ContentAgentOutput(title="Day 1"))
+        db = FakeSession(campaign, [day_one])
+
+        await run_campaign_workflow(orchestrator, "campaign-1", db)
+
+        assert sorted(orchestrator.content_agent.days) == [2, 3]
+        assert sorted(db.upserted) == [2, 3]
+        assert orchestrator.gemini_call_count == 2
+        assert campaign.strategy_output == {"themes": ["Async Python"]}
+        assert campaign.campaign_plan["day_1"] == {"topic": "Intro"}
+        assert campaign.forensics_output["YouTube"]["patterns"] == [FORENSICS_YT]
+        assert set(campaign.workflow_checkpoint["days"]) == {"1", "2", "3"}
+        assert campaign.status == "processing"
@@ -0,0 +1,173 @@
+"""Test the verified-token cache and batched last_login_at writes."""
+from types import SimpleNamespace
+
+import pytest
+
+from backend.api import webhooks
+from backend.services.core import auth_cache
+from backend.services.core.auth_cache import LastLoginRecorder, VerifiedTokenCache
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(auth_cache, "time", fake)
+    return fake
+
+
+class FakeConnection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    async def execute(self, stmt, params):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.calls.append((str(stmt), params))
+
+
+class FakeAsyncSession:
+    """Stands in for AsyncSessionLocal(); every session shares one connection."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def connection(self):
+        return self._connection
+
+    async def commit(self):
+        self.commits += 1
+
+
+class WebhookSession:
+    """Serves the user being deleted; no webhook event was seen before."""
+
+    def __init__(self, user):
+        self.user = user
+        self.deleted = []
+
+    async def execute(self, stmt):
+        found = self.user if "FROM users" in str(stmt) else None
+        return SimpleNamespace(scalar_one_or_none=lambda: found)
+
+    def add(self, obj):
+        pass
+
+    async def delete(self, obj):
+        self.deleted.append(obj)
+
+    async def commit(self):
+        pass
+
+
+class FakeRequest:
+    headers = {"svix-id": "msg_1", "svix-timestamp": "1700000000", "svix-signature": "v1,sig"}
+
+    async def body(self):
+        return b"{}"
+
+
+@pytest.mark.unit
+class TestVerifiedTokenCache:
+    """Test expiry, eviction and invalidation of verified tokens."""
+
+    def test_expires_at_token_exp_before_ttl(self, clock):
+        """Test an entry expires at the token's exp when that comes before the TTL."""
+        cache = VerifiedTokenCache(ttl=60, max_entries=10)
+        cache.put("token", "user-1", "clerk_1", token_exp=clock.now + 10)
+        clock.now += 9
+        assert cache.get("token") == "user-1"
+        clock.now += 2
+        assert cache.get("token") is None
+
+    def test_expires_at_ttl_before_token_exp(self, clock):
+        """Test an entry expires after the TTL even if the token is valid for longer."""
+        cache = VerifiedTokenCache(ttl=60, max_entries=10)
+        cache.put("token", "user-1", "clerk_1", token_exp=clock.now + 3600)
+        clock.now += 59
+        assert cache.get("token") == "user-1"
+        clock.now += 2
+        assert cache.get("token") is None
+
+    def test_expired_token_not_cached(self, clock):
+        """Test a token already past its exp is never stored."""
+        cache = VerifiedTokenCache(ttl=60, max_entries=10)
+        cache.put("token", "user-1", "clerk_1", token_exp=clock.now - 1)
+        assert cache.get("token") is None
+
+    def test_least_recently_used_evicted(self, clock):
+        """Test the least recently used token is dropped when the cache is full."""
+        cache = VerifiedTokenCache(ttl=60, max_entries=2)
+        cache.put("a", "user-a", "clerk_a", None)
+        cache.put("b", "user-b", "clerk_b", None)
+        assert cache.get("a") == "user-a"
+        cache.put("c", "user-c", "clerk_c", None)
+        assert cache.get("b") is None
+        assert cache.get("a") == "user-a" and cache.get("c") == "user-c"
+
+    async def test_user_deleted_webhook_invalidates_tokens(self, monkeypatch):
+        """Test the user.deleted webhook drops every cached token of that user."""
+        cache = VerifiedTokenCache(ttl=60, max_entries=10)
+        cache.put("session-1", "user-1", "clerk_1", None)
+        cache.put("session-2", "user-1", "clerk_1", None)
+        cache.put("other", "user-2", "clerk_2", None)
+        monkeypatch.setattr(webhooks, "verified_token_cache", cache)
+        event = {"type": "user.deleted", "data": {"id": "clerk_1"}}
+        monkeypatch.setattr(webhooks, "Webhook", lambda secret: SimpleNamespace(verify=lambda payload, headers: event))
+        db = WebhookSession(SimpleNamespace(user_id="user-1", clerk_user_id="clerk_1"))
+
+        assert await webhooks.clerk_webhook(FakeRequest(), db) == {"status": "success"}
+        assert len(db.deleted) == 1
+        assert cache.get("session-1") is None and cache.get("session-2") is None
+        assert cache.get("other") == "user-2"
+
+
+@pytest.mark.unit
+class TestLastLoginRecorder:
+    """Test last_login_at touches are coalesced and flushed in one batch."""
+
+    async def test_flush_writes_one_batch(self, monkeypatch):
+        """Test repeated touches collapse to one row per user, written in a single executemany."""
+        connection = FakeConnection()
+        monkeypatch.setattr(auth_cache, "AsyncSessionLocal", lambda: FakeAsyncSession(connection))
+        recorder = LastLoginRecorder(interval=60)
+        recorder.touch("user-1")
+        first = recorder.pending_for("user-1")
+        recorder.touch("user-1")
+        recorder.touch("user-2")
+        assert recorder.pending_for("user-1") >= first
+
+        assert await recorder.flush() == 2
+        assert len(connection.calls) == 1
+        sql, params = connection.calls[0]
+        assert sql.startswith("UPDATE users")
+        assert sorted(row["b_user_id"] for row in params) == ["user-1", "user-2"]
+        assert recorder.pending_for("user-1") is None
+        assert await recorder.flush() == 0 and len(connection.calls) == 1
+
+    async def test_failed_flush_keeps_pending(self, monkeypatch):
+        """Test a failed write is retried on the next flush instead of being lost."""
+        connection = FakeConnection(fail=True)
+        monkeypatch.setattr(auth_cache, "AsyncSessionLocal", lambda: FakeAsyncSession(connection))
+        recorder = LastLoginRecorder(interval=60)
+        recorder.touch("user-1")
+
+        assert await recorder.flush() == 0
+        assert recorder.pending_for("user-1") is not None
+        connection.fail = False
+        assert await recorder.flush() == 1
@@ -0,0 +1,134 @@
+"""Test task event publishing and streaming over the shared Redis client."""
+import json
+
+import pytest
+
+from backend.api import tasks
+from backend.services.core import redis_clients, task_events
+from backend.services.core.task_events import build_task_status, stream_task_events
+
+
+class FakePubSub:
+    def __init__(self, client):
+        self.client = client
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channel = channel
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=None):
+        return {"data": json.dumps(build_task_status("task-1", "SUCCESS", {"campaign_id": "c1"}))}
+
+    async def unsubscribe(self):
+        pass
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeAsyncRedis:
+    """Records pubsubs, pipelined commands and whether the client was closed."""
+
+    def __init__(self):
+        self.pubsubs = []
+        self.commands = []
+        self.closed = False
+
+    def pubsub(self):
+        pubsub = FakePubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def get(self, key):
+        return None
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key))
+
+    def publish(self, channel, payload):
+        self.commands.append(("publish", channel, json.loads(payload)["state"]))
+
+    async def execute(self):
+        pass
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = FakeAsyncRedis()
+    monkeypatch.setattr(task_events, "get_async_redis", lambda **kwargs: client)
+    task_events._redis_backoff.reset()
+    return client
+
+
+@pytest.mark.unit
+class TestTaskEvents:
+    """Test SSE streams share one client and cancellation publishes without blocking."""
+
+    async def test_streams_share_one_client(self, redis):
+        """Test each stream releases its pubsub connection and leaves the shared client open."""
+        for _ in range(2):
+            events = [event async for event in stream_task_events("task-1", build_task_status("task-1", "STARTED"))]
+            assert [event["state"] for event in events] == ["STARTED", "SUCCESS"]
+        assert len(redis.pubsubs) == 2 and all(pubsub.closed for pubsub in redis.pubsubs)
+        assert not redis.closed
+
+    async def test_cancel_publishes_revoked_asynchronously(self, redis, monkeypatch):
+        """Test DELETE /tasks/{id} publishes REVOKED through the async client."""
+        class FakeAsyncResult:
+            state = "STARTED"
+
+            def __init__(self, task_id, app=None):
+                self.revoked = False
+
+            def revoke(self, terminate=False):
+                self.revoked = terminate
+
+        monkeypatch.setattr(tasks, "AsyncResult", FakeAsyncResult)
+
+        response = await tasks.cancel_task("task-1")
+        assert response["state"] == "REVOKED"
+        assert ("publish", "task-progress:task-1", "REVOKED") in redis.commands
+
+
+@pytest.mark.unit
+class TestRedisClients:
+    """Test the shared Redis clients are reused per URL and closed together on shutdown."""
+
+    async def test_clients_shared_and_closed_on_shutdown(self, monkeypatch):
+        """Test callers asking for the same client get one instance and close_redis_clients closes it."""
+        import redis.asyncio as aioredis
+
+        created = []
+
+        def from_url(url, **kwargs):
+            client = FakeAsyncRedis()
+            created.append((url, kwargs["socket_timeout"]))
+            return client
+
+        monkeypatch.setattr(aioredis.Redis, "from_url", staticmethod(from_url))
+        monkeypatch.setattr(redis_clients, "_async_clients", redis_clients.weakref.WeakKeyDictionary())
+
+        client = redis_clients.get_async_redis("redis://cache")
+        assert redis_clients.get_async_redis("redis://cache") is client
+        stream_client = redis_clients.get_async_redis("redis://cache", socket_timeout=None)
+        assert stream_client is not client
+        assert created == [("redis://cache", 2), ("redis://cache", None)]
+
+        await redis_clients.close_redis_clients()
+        assert client.closed and stream_client.closed
+        assert redis_clients.get_async_redis("redis://cache") is not client
+
+    def test_backoff_skips_redis_after_error(self):
+        """Test a failure disables Redis for retry_after seconds."""
+        backoff = redis_clients.RedisBackoff(retry_after=30)
+        assert backoff.available()
+        backoff.failed()
+        assert not backoff.available()
+        backoff.reset()
+        assert backoff.available()